@@ -0,0 +1,20 @@
+"""Cobblemon pack generator as a library. pack-generator.py is the command-line
+front end; the same operations are available here as functions returning data:
+
+    from cobblemon_packgen import api
+    pack = api.open_pack()
+    result = api.edit_species(pack, {"name": "emberfox", "hp": 80})
+    print(result["ok"], result["changes"])
+
+    from cobblemon_packgen import species_config, species_files
+    files = species_files("emberfox", species_config({"name": "emberfox", "number": 1100}))
+
+See api.py for every entry point, templates.py for the pure JSON builders."""
+
+from .generator import GENERATOR_VERSION, CobblemonPackGenerator
+from .templates import (create_species_json, create_poser_json, create_resolver_json, create_spawn_pool_json,
+                        create_lang_entries)
+from .api import (open_pack, refresh, species_config, species_files, create_species, edit_species, rename_species,
+                  swap_files, list_species, find_species, check_pack)
+
+__version__ = GENERATOR_VERSION
@@ -0,0 +1,5 @@
+"""python -m cobblemon_packgen: same as running pack-generator.py"""
+
+from .cli import main
+
+main()
@@ -0,0 +1,154 @@
+"""Library entry points: drive the generator from Python and get results back as
+data instead of console output.
+
+    from cobblemon_packgen import api
+    pack = api.open_pack()                    # ~/Downloads/Mod-ResourceAndBehavior-Packs
+    api.create_species(pack, {"name": "emberfox", "number": 1100, "primary_type": "fire"})
+    api.edit_species(pack, {"name": "emberfox", "hp": 80})["changes"]
+    [s["name"] for s in api.list_species(pack)]
+
+Option dicts use the command-line option names ("primary_type" or "primary-type"),
+exactly like --manifest rows and --apply-edits lines. Operations return a dict
+with "ok" and, as "log", the console output the command would have printed. One
+pack's calls must not overlap (each redirects sys.stdout while it runs)."""
+
+import io
+import contextlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import templates
+from .generator import CobblemonPackGenerator, parse_where, where_matches
+from .options import build_parser, build_create_config, manifest_row_to_argv, edit_row_to_args, manifest_to_batch
+
+_parser_cache = []
+
+
+def _parser():
+    """build_parser(), built once (it only describes the options)"""
+    if not _parser_cache:
+        _parser_cache.append(build_parser())
+    return _parser_cache[0]
+
+
+def _captured(function, *args, **kwargs):
+    """(return value, printed output) of one generator call"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        value = function(*args, **kwargs)
+    return value, output.getvalue()
+
+
+def open_pack(downloads_path: Optional[str] = None, profile: str = "dev", index_cache: bool = True,
+              optimize_png: bool = False) -> CobblemonPackGenerator:
+    """A generator for <downloads_path>/Mod-ResourceAndBehavior-Packs (default
+    ~/Downloads), configured like --downloads / --profile / --no-index-cache /
+    --optimize-png. Reuse it across calls: its pack index and lang view stay warm."""
+    pack = CobblemonPackGenerator(downloads_path=downloads_path)
+    pack.json_profile = profile
+    pack.optimize_pngs = optimize_png
+    if not index_cache:
+        pack.index_cache_file = None
+    return pack
+
+
+def refresh(pack: CobblemonPackGenerator):
+    """Re-read whatever changed on disk since the last call (files edited by hand
+    or by another process); only the changed files are read again."""
+    if pack._pack_index is not None:
+        pack._pack_index.revalidate()
+    pack.lang_journal.revalidate()
+
+
+def species_config(options: Dict) -> Dict:
+    """Creation config for an options dict ({"name", "number", ...}), with the same
+    defaults as the command line. Raises ValueError on bad input."""
+    parser = _parser()
+    argv = manifest_row_to_argv({k: v for k, v in options.items() if k != 'assets'}, parser)
+    errors = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(errors):
+            args = parser.parse_args(argv)
+    except SystemExit:
+        message = errors.getvalue().strip().splitlines()
+        raise ValueError(message[-1].split('error: ', 1)[-1] if message else "invalid values")
+    if not args.name or not args.number:
+        raise ValueError("'name' and 'number' are required")
+    return build_create_config(args)
+
+
+def species_files(name: str, config: Dict) -> Dict[str, Dict]:
+    """Every generated JSON document for one species, without touching the disk:
+    'species', 'poser', 'resolver', 'spawn_pool' and 'lang' (key -> text)."""
+    return {
+        'species': templates.create_species_json(name, config),
+        'poser': templates.create_poser_json(name, config),
+        'resolver': templates.create_resolver_json(name),
+        'spawn_pool': templates.create_spawn_pool_json(name, config),
+        'lang': templates.create_lang_entries(name, config),
+    }
+
+
+def create_species(pack: CobblemonPackGenerator, options: Dict, cleanup: bool = True) -> Dict:
+    """Create one species (like a --manifest row; "assets" names a folder of model /
+    animation / texture files, else <pack folder>/<name>/ or the pack folder itself).
+    Raises ValueError on bad options."""
+    entry = manifest_to_batch([options], _parser(), pack.base_dir)[0]
+    files = pack.find_files_in_dir(Path(entry['assets'])) if entry['assets'] else None
+    ok, log = _captured(pack.generate_pokemon, entry['name'], entry['config'], cleanup=cleanup, files=files)
+    return {'ok': bool(ok), 'name': entry['name'], 'log': log}
+
+
+def edit_species(pack: CobblemonPackGenerator, options: Dict) -> Dict:
+    """Apply --edit options ({"name": ..., "hp": 80, ...}) to one species; "changes"
+    lists what was saved. Raises ValueError on bad options."""
+    args = edit_row_to_args(options, _parser())
+    changes, log = _captured(pack.edit_pokemon, args.edit, args)
+    return {'ok': changes is not None, 'changes': changes or [], 'log': log}
+
+
+def rename_species(pack: CobblemonPackGenerator, renames: Dict[str, str]) -> Dict:
+    """Rename {old: new} species in one pass (chains and swaps included), across
+    every site --rename covers. Nothing is written unless every pair is valid."""
+    def rename():
+        checked = pack._validate_renames([(old.lower(), new.lower()) for old, new in renames.items()])
+        if checked is None:
+            return None
+        return pack._apply_renames(checked) if checked else []
+    changes, log = _captured(rename)
+    return {'ok': changes is not None, 'changes': changes or [], 'log': log}
+
+
+def swap_files(pack: CobblemonPackGenerator, names: Optional[List[str]] = None) -> Dict:
+    """--editfiles for the given species (None: every species with files waiting
+    in the pack folder)"""
+    if names is not None and len(names) == 1:
+        ok, log = _captured(pack.edit_files, names[0])
+    else:
+        ok, log = _captured(pack.edit_files_batch, names)
+    return {'ok': bool(ok), 'log': log}
+
+
+def list_species(pack: CobblemonPackGenerator) -> List[Dict]:
+    """Index record of every species in the pack (name, number, types, labels,
+    stats, evolutions, ...), by file name; paths as strings"""
+    index = pack.pack_index()
+    return [{key: (str(value) if isinstance(value, Path) else value) for key, value in record.items()}
+            for record in sorted(index.species.values(), key=lambda r: r['file'])]
+
+
+def find_species(pack: CobblemonPackGenerator, where: str) -> List[str]:
+    """Names of the species matching a --where query ("primaryType=fire,baseStats.hp>=100").
+    Raises ValueError on a bad query."""
+    conditions = parse_where(where)
+    index = pack.pack_index()
+    return sorted(name for name, record in index.species.items() if where_matches(record, conditions))
+
+
+def check_pack(pack: CobblemonPackGenerator, workers: Optional[int] = None) -> Dict:
+    """--check as data: "issues" is a list of {'where', 'level', 'message'}; ok
+    unless one of them is an ERROR"""
+    report, log = _captured(pack.pack_issues, workers)
+    issues = [{'where': label, 'level': level, 'message': message}
+              for label, entries in sorted(report.items()) for level, message in entries]
+    return {'ok': not any(i['level'] == "ERROR" for i in issues), 'issues': issues, 'log': log}
@@ -0,0 +1,349 @@
+"""Synthetic pack benchmarks: build packs of N species in a scratch folder and
+time the main operations on each, so generator versions can be compared.
+
+    python -m cobblemon_packgen.bench --sizes 100,1000,10000 --out bench-2.7.json
+    python -m cobblemon_packgen.bench --sizes 1000 --compare bench-2.6.json
+
+Each operation runs in a fresh interpreter (so its peak RSS is its own) against
+a pack whose index cache is already built, like the second CLI run of the day.
+Per operation: wall seconds, files opened for reading / writing, bytes read /
+written (Linux /proc/self/io; process-pool workers aren't included) and peak RSS.
+Results go out as JSON; a summary table goes to stderr."""
+
+import os
+import io
+import sys
+import json
+import time
+import zlib
+import shutil
+import struct
+import argparse
+import builtins
+import platform
+import tempfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .generator import GENERATOR_VERSION, CobblemonPackGenerator, PNG_SIGNATURE, _png_chunk
+from .options import build_parser, manifest_to_batch, edit_row_to_args
+
+OPERATIONS = ("create", "edit", "rename", "editfiles", "show", "check")
+BENCH_TYPES = ("fire", "water", "grass", "electric", "psychic", "dark", "dragon", "fairy")
+BENCH_ANIMATIONS = ("ground_idle", "ground_walk", "sleep", "faint")
+
+
+# --- Synthetic assets ---
+def synth_model(name: str, cubes: int, texture_size: int = 64) -> Dict:
+    """Bedrock geometry with one bone of `cubes` unit cubes"""
+    return {
+        "format_version": "1.12.0",
+        "minecraft:geometry": [{
+            "description": {"identifier": f"geometry.{name}", "texture_width": texture_size,
+                            "texture_height": texture_size, "visible_bounds_width": 2,
+                            "visible_bounds_height": 2, "visible_bounds_offset": [0, 1, 0]},
+            "bones": [{"name": "body", "pivot": [0, 0, 0],
+                       "cubes": [{"origin": [i % 8 - 4, i // 8 % 8, i // 64 - 4], "size": [1, 1, 1],
+                                  "uv": [i % 16 * 4 % texture_size, i // 16 * 4 % texture_size]}
+                                 for i in range(cubes)]}],
+        }],
+    }
+
+
+def synth_animation(name: str) -> Dict:
+    """An animation file defining every animation the default poser refers to"""
+    return {
+        "format_version": "1.8.0",
+        "animations": {f"animation.{name}.{anim}": {
+            "loop": True, "animation_length": 1.0,
+            "bones": {"body": {"rotation": {"0.0": [0, 0, 0], "0.5": [0, 5 * (k + 1), 0], "1.0": [0, 0, 0]}}},
+        } for k, anim in enumerate(BENCH_ANIMATIONS)},
+    }
+
+
+def synth_png(size: int, seed: int) -> bytes:
+    """A size x size RGBA PNG with seed-dependent pixels"""
+    rows = b"".join(b"\x00" + bytes((x * 7 + y * 13 + seed) % 256 for x in range(size * 4)) for y in range(size))
+    return (PNG_SIGNATURE + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+            + _png_chunk(b"IDAT", zlib.compress(rows)) + _png_chunk(b"IEND", b""))
+
+
+def write_assets(folder: Path, name: str, cubes: int, textures: int, seed: int = 0):
+    """Model, animation and `textures` textures (base, shiny, then extra variants) for one species"""
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f"{name}.geo.json").write_text(json.dumps(synth_model(name, cubes), indent=2))
+    (folder / f"{name}.animation.json").write_text(json.dumps(synth_animation(name), indent=2))
+    suffixes = ["", "_shiny"] + [f"_form{k}" for k in range(1, max(textures - 1, 0))]
+    for k, suffix in enumerate(suffixes[:textures]):
+        (folder / f"{name}{suffix}.png").write_bytes(synth_png(64, seed + k))
+
+
+def species_name(i: int) -> str:
+    return f"bench{i:05d}"
+
+
+def species_row(i: int, count: int, chain: int, assets: Optional[Path]) -> Dict:
+    """Creation options for species i; consecutive species form evolution chains of `chain`"""
+    row = {"name": species_name(i), "number": 2000 + i, "primary_type": BENCH_TYPES[i % len(BENCH_TYPES)],
+           "abilities": "blaze,h:solar_power", "moves": "1:tackle,5:ember,12:bite,tm:protect",
+           "assets": str(assets) if assets else None}
+    if chain > 1:
+        if i % chain and i > 0:
+            row["pre_evolution"] = species_name(i - 1)
+        if (i + 1) % chain and i + 1 < count:
+            row.update({"evo_target": species_name(i + 1), "evo_method": "level_up", "evo_level": 16 + i % chain * 16})
+    return row
+
+
+def build_pack(downloads: Path, count: int, params: Dict) -> Dict:
+    """Create a count-species pack under downloads/ with the generator itself
+    (batch creation), then pad each spawn file to params['spawns'] entries"""
+    generator = CobblemonPackGenerator(downloads_path=str(downloads))
+    generator.base_dir.mkdir(parents=True, exist_ok=True)
+    sources = downloads / "bench_sources"
+    rows = []
+    for i in range(count):
+        write_assets(sources / species_name(i), species_name(i), params['cubes'], params['textures'], seed=i)
+        rows.append(species_row(i, count, params['chain'], sources / species_name(i)))
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        entries = manifest_to_batch(rows, build_parser(), generator.base_dir)
+        ok = generator.generate_batch(entries, cleanup=False, workers=params['workers'])
+    if not ok:
+        raise RuntimeError(f"batch creation of the {count}-species pack failed")
+    create_seconds = time.perf_counter() - start
+    shutil.rmtree(sources)
+
+    if params['spawns'] > 1:
+        spawn_dir = generator.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world"
+        for path in spawn_dir.glob("*.json"):
+            data = json.loads(path.read_text(encoding='utf-8'))
+            first = data['spawns'][0]
+            data['spawns'] += [dict(first, id=f"{first['pokemon']}-{k}", weight=first['weight'] / k)
+                               for k in range(2, params['spawns'] + 1)]
+            path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.pack_index()  # builds the on-disk index cache every operation starts from
+
+    files, size = 0, 0
+    for dirpath, _dirnames, filenames in os.walk(generator.base_dir):
+        for filename in filenames:
+            files += 1
+            size += os.path.getsize(os.path.join(dirpath, filename))
+    return {'batch_create_seconds': round(create_seconds, 3), 'pack_files': files, 'pack_bytes': size}
+
+
+# --- Measurement (runs in a fresh interpreter per operation) ---
+class OpenCounter:
+    """Records the paths opened through open()/io.open() (pathlib included) while active"""
+
+    def __init__(self):
+        self.read = set()
+        self.written = set()
+        self._open = None
+
+    def __enter__(self):
+        self._open = builtins.open
+
+        def counting_open(file, mode='r', *args, **kwargs):
+            if isinstance(file, (str, bytes, os.PathLike)):
+                target = self.written if any(c in mode for c in "wax+") else self.read
+                target.add(os.fspath(file))
+            return self._open(file, mode, *args, **kwargs)
+
+        builtins.open = io.open = counting_open
+        return self
+
+    def __exit__(self, *exc):
+        builtins.open = io.open = self._open
+
+
+def proc_io() -> Optional[Dict[str, int]]:
+    """rchar/wchar of this process (Linux), or None"""
+    try:
+        with open("/proc/self/io", 'r') as f:
+            return {key: int(value) for key, value in (line.split(': ') for line in f)}
+    except OSError:
+        return None
+
+
+def peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def run_operation(generator: CobblemonPackGenerator, operation: str, target: str, workers: Optional[int]) -> bool:
+    if operation == "create":
+        config = manifest_to_batch([species_row(0, 1, 1, None) | {"name": target, "number": 9999}],
+                                   build_parser(), generator.base_dir)[0]['config']
+        return bool(generator.generate_pokemon(target, config, cleanup=True))
+    if operation == "edit":
+        args = edit_row_to_args({"name": target, "hp": 99, "rarity": "rare", "desc1": "Benchmark edit."},
+                                build_parser())
+        return generator.edit_pokemon(target, args) is not None
+    if operation == "rename":
+        return generator.rename_pokemon(target, f"{target}r")
+    if operation == "editfiles":
+        return generator.edit_files(target)
+    if operation == "show":
+        generator.show_current_pokemon()
+        return True
+    if operation == "check":
+        return not any(level == "ERROR" for issues in generator.pack_issues(workers).values()
+                       for level, _message in issues)
+    raise ValueError(f"unknown operation '{operation}'")
+
+
+def measure(downloads: str, operation: str, target: str, workers: Optional[int]) -> Dict:
+    """Time one operation in this (fresh) process"""
+    generator = CobblemonPackGenerator(downloads_path=downloads)
+    io_before = proc_io()
+    counter = OpenCounter()
+    start = time.perf_counter()
+    with counter, contextlib.redirect_stdout(io.StringIO()):
+        ok = run_operation(generator, operation, target, workers)
+    wall = time.perf_counter() - start
+    io_after = proc_io()
+    return {
+        'ok': ok,
+        'wall_seconds': round(wall, 4),
+        'files_read': len(counter.read),
+        'files_written': len(counter.written),
+        'bytes_read': io_after['rchar'] - io_before['rchar'] if io_before else None,
+        'bytes_written': io_after['wchar'] - io_before['wchar'] if io_before else None,
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def measure_in_child(downloads: Path, operation: str, target: str, workers: Optional[int]) -> Dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(measure, str(downloads), operation, target, workers).result()
+
+
+def bench_scale(workdir: Path, count: int, params: Dict) -> Dict:
+    """Build one pack and run every requested operation on it"""
+    downloads = workdir / f"pack_{count}"
+    print(f"  {count} species: building pack...", file=sys.stderr)
+    result = {'species': count}
+    result.update(build_pack(downloads, count, params))
+    base_dir = downloads / "Mod-ResourceAndBehavior-Packs"
+
+    # Mid-pack, mid-chain targets so references to them exist
+    middle = count // 2 - count // 2 % max(params['chain'], 1) + (1 if params['chain'] > 2 else 0)
+    targets = {"create": "benchnew", "edit": species_name(middle), "rename": species_name(middle),
+               "editfiles": species_name(max(middle - 1, 0))}
+    result['operations'] = {}
+    for operation in params['operations']:
+        target = targets.get(operation, "")
+        if operation == "create":
+            write_assets(base_dir, target, params['cubes'], params['textures'], seed=count)
+        elif operation == "editfiles":
+            write_assets(base_dir, target, params['cubes'] * 2, 1, seed=count + 1)
+            (base_dir / f"{target}.animation.json").unlink()
+        print(f"  {count} species: {operation}...", file=sys.stderr)
+        result['operations'][operation] = measure_in_child(downloads, operation, target, params['workers'])
+    if not params['keep']:
+        shutil.rmtree(downloads)
+    return result
+
+
+# --- Reporting ---
+def print_table(report: Dict, baseline: Optional[Dict] = None):
+    """Human summary on stderr; with a baseline report, wall-time change per operation"""
+    old = {(scale['species'], op): stats['wall_seconds']
+           for scale in (baseline or {}).get('scales', []) for op, stats in scale['operations'].items()}
+    header = f"{'species':>8} {'operation':<10} {'wall ms':>9} {'read':>6} {'written':>7} {'KB written':>11} {'peak RSS MB':>11}"
+    if baseline:
+        header += f"  vs {baseline.get('generator_version', '?')}"
+    print(header, file=sys.stderr)
+    for scale in report['scales']:
+        for op, stats in scale['operations'].items():
+            written = f"{stats['bytes_written'] / 1024:.0f}" if stats['bytes_written'] is not None else "-"
+            rss = f"{stats['peak_rss_kb'] / 1024:.0f}" if stats['peak_rss_kb'] is not None else "-"
+            line = (f"{scale['species']:>8} {op:<10} {stats['wall_seconds'] * 1000:>9.1f} {stats['files_read']:>6} "
+                    f"{stats['files_written']:>7} {written:>11} {rss:>11}")
+            before = old.get((scale['species'], op))
+            if before:
+                line += f"  {(stats['wall_seconds'] - before) / before:+.0%}"
+            if not stats['ok']:
+                line += "  (FAILED)"
+            print(line, file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m cobblemon_packgen.bench",
+        description="Time create/edit/rename/editfiles/show/check on synthetic packs of N species")
+    parser.add_argument('--sizes', default="100,1000", help='Pack sizes in species, comma-separated (default: 100,1000)')
+    parser.add_argument('--operations', default=",".join(OPERATIONS),
+                        help=f"Operations to time (default: {','.join(OPERATIONS)})")
+    parser.add_argument('--cubes', type=int, default=50, help='Cubes per model (model size, default: 50)')
+    parser.add_argument('--textures', type=int, default=2, help='Textures per species: base, shiny, extra forms (default: 2)')
+    parser.add_argument('--spawns', type=int, default=1, help='Spawn entries per species (default: 1)')
+    parser.add_argument('--chain', type=int, default=3, help='Evolution chain length, 1 = none (default: 3)')
+    parser.add_argument('--workers', type=int, help='Worker threads for pack building and check')
+    parser.add_argument('--workdir', help='Scratch folder for the packs (default: a new temp folder)')
+    parser.add_argument('--keep', action='store_true', help='Keep the synthetic packs')
+    parser.add_argument('--out', help='Write the JSON report here (default: stdout)')
+    parser.add_argument('--compare', metavar='REPORT', help='Earlier JSON report to compare wall times against')
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    except ValueError:
+        parser.error(f"--sizes must be numbers: {args.sizes}")
+    operations = [op.strip() for op in args.operations.split(',') if op.strip()]
+    unknown = [op for op in operations if op not in OPERATIONS]
+    if unknown:
+        parser.error(f"unknown operation(s): {', '.join(unknown)} (valid: {', '.join(OPERATIONS)})")
+    if min(sizes, default=0) < 2 or args.textures < 1 or args.spawns < 1 or args.chain < 1:
+        parser.error("--sizes must be at least 2; --textures, --spawns and --chain at least 1")
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    params = {'cubes': args.cubes, 'textures': args.textures, 'spawns': args.spawns, 'chain': args.chain,
+              'workers': args.workers, 'operations': operations, 'keep': args.keep}
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="packgen-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    report = {
+        'generator_version': GENERATOR_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'started': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'parameters': {key: value for key, value in params.items() if key != 'keep'},
+        'scales': [],
+    }
+    print(f"Benchmarking in {workdir}", file=sys.stderr)
+    try:
+        for count in sizes:
+            report['scales'].append(bench_scale(workdir, count, params))
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+        print(f"[OK] Report written to {args.out}", file=sys.stderr)
+    else:
+        print(text)
+    print_table(report, baseline)
+    if not all(stats['ok'] for scale in report['scales'] for stats in scale['operations'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Command-line front end: parse the options and dispatch one command to the
+generator (pack-generator.py and python -m cobblemon_packgen both land here)."""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from . import metrics, trace
+from .generator import GENERATOR_VERSION, CobblemonPackGenerator, BuildManifest
+from .options import (build_parser, build_create_config, load_manifest, load_edit_lines, manifest_to_batch,
+                      watch_manifest_loader)
+from .server import PackServer
+
+
+def main():
+    """Main entry point with customization options"""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # Create generator (needed by --show-current-pokemon, --edit, and creation)
+    generator = CobblemonPackGenerator(downloads_path=args.downloads)
+    if args.no_index_cache:
+        generator.index_cache_file = None
+    generator.defer_lang_compaction = args.defer_lang
+    generator.json_profile = args.profile
+    generator.optimize_pngs = args.optimize_png
+
+    if args.profile_out:
+        trace.start()
+    started = time.time()
+    status, exit_code = "failed", 1
+    try:
+        with trace.span("pack-generator", argv=sys.argv[1:]):
+            run_command(parser, args, generator)
+        status, exit_code = "ok", 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        status = "ok" if exit_code == 0 else "failed"
+        raise
+    finally:
+        generator.print_json_report()
+        if args.metrics_textfile or args.metrics_log:
+            write_metrics(args, started, status, exit_code)
+        if args.profile_out:
+            trace.stop()
+            spans = trace.write(args.profile_out, {'generator_version': GENERATOR_VERSION,
+                                                   'command': ' '.join(sys.argv)})
+            print(f"[OK] Trace written to {args.profile_out} ({spans} spans) — open it in https://ui.perfetto.dev")
+
+
+def command_name(args) -> str:
+    """The command a parsed command line runs (in dispatch order), for metrics"""
+    for dest, name in (("compact_lang", "compact-lang"), ("export_zip", "export-zip"), ("editfiles", "editfiles"),
+                       ("serve", "serve"), ("apply_edits", "apply-edits"), ("where", "where"),
+                       ("rename_map", "rename-map"), ("rename", "rename"), ("check", "check"),
+                       ("check_textures", "check-textures"), ("show_current_pokemon", "show"), ("edit", "edit"),
+                       ("watch", "watch"), ("manifest", "manifest")):
+        if getattr(args, dest) not in (None, False):  # --export-zip / --serve may be ''
+            return name
+    if args.optimize_png and not args.name:
+        return "optimize-png"
+    return "create"
+
+
+def write_metrics(args, started: float, status: str, exit_code: int):
+    """--metrics-textfile / --metrics-log: this run's counters, written at exit"""
+    run = metrics.run_record(command_name(args), sys.argv[1:], started, status, GENERATOR_VERSION, exit_code)
+    metrics.inc("run_seconds", run['duration_seconds'])
+    counters = metrics.METRICS.snapshot()
+    try:
+        if args.metrics_textfile:
+            metrics.write_textfile(args.metrics_textfile, run, counters)
+        if args.metrics_log:
+            metrics.append_log(args.metrics_log, run, counters)
+    except OSError as e:
+        print(f"WARNING: Could not write metrics: {e}", file=sys.stderr)
+
+
+def run_command(parser: argparse.ArgumentParser, args, generator: CobblemonPackGenerator):
+    """Dispatch one parsed command line to the generator"""
+    # Handle --compact-lang command
+    if args.compact_lang:
+        if generator.lang_journal.pending():
+            generator.compact_lang(force=True)
+        else:
+            print("NOTE: No journaled lang changes — en_us.json is up to date.")
+        return
+
+    # Handle --export-zip command
+    if args.export_zip is not None:
+        if not generator.export_zip(args.export_zip or None):
+            exit(1)
+        return
+
+    # Handle --editfiles command
+    if args.editfiles:
+        if args.editfiles.lower() == 'all':
+            generator.edit_files_batch()
+        elif ',' in args.editfiles:
+            generator.edit_files_batch([n.strip() for n in args.editfiles.split(',') if n.strip()])
+        else:
+            generator.edit_files(args.editfiles)
+        return
+
+    # Handle --serve (long-running JSON-RPC server)
+    if args.serve is not None:
+        try:
+            PackServer(generator).serve(args.serve or None)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Could not serve on {args.serve}: {e}", file=sys.stderr)
+            exit(1)
+        return
+
+    # Handle --apply-edits (JSONL file or - for stdin)
+    if args.apply_edits:
+        try:
+            if args.apply_edits == '-':
+                edits = load_edit_lines(sys.stdin, parser)
+            else:
+                with open(args.apply_edits, 'r', encoding='utf-8') as f:
+                    edits = load_edit_lines(f, parser)
+        except OSError as e:
+            print(f"ERROR: Bad --apply-edits: {e}", file=sys.stderr)
+            exit(1)
+        if not generator.apply_edits(edits, workers=args.workers):
+            exit(1)
+        return
+
+    # Handle --where/--set bulk edit (preview unless --confirm)
+    if args.where:
+        if not generator.bulk_edit(args.where, args.set, confirm=args.confirm, workers=args.workers):
+            exit(1)
+        return
+    if args.set or args.confirm:
+        parser.error('--set/--confirm require --where')
+
+    # Handle --rename-map command
+    if args.rename_map:
+        if not generator.rename_map(args.rename_map):
+            exit(1)
+        return
+
+    # Handle --rename (requires --edit)
+    if args.rename:
+        if not args.edit:
+            parser.error('--rename requires --edit <current-name>')
+        generator.rename_pokemon(args.edit, args.rename)
+        return
+
+    # Handle --check command
+    if args.check:
+        if not generator.check_pack(workers=args.workers):
+            exit(1)
+        return
+
+    # Handle --check-textures command
+    if args.check_textures:
+        if not generator.validate_textures(workers=args.workers):
+            exit(1)
+        return
+
+    # Handle --show-current-pokemon command
+    if args.show_current_pokemon:
+        generator.show_current_pokemon()
+        return
+
+    # Handle --edit command
+    if args.edit:
+        generator.edit_pokemon(args.edit, args)
+        return
+
+    # Handle --watch (long-running; --manifest only supplies configs for new species)
+    if args.watch:
+        generator.watch(watch_manifest_loader(args.manifest, parser, generator.base_dir) if args.manifest else None)
+        return
+
+    # Handle --manifest command (batch creation)
+    if args.manifest:
+        try:
+            entries = manifest_to_batch(load_manifest(args.manifest), parser, generator.base_dir)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Bad --manifest: {e}")
+            exit(1)
+        if not entries:
+            print(f"ERROR: Manifest is empty: {args.manifest}")
+            exit(1)
+        build = BuildManifest(generator.build_state_file, str(Path(args.manifest).resolve()), generator.base_dir)
+        build.force = args.rebuild
+        if not generator.generate_batch(entries, cleanup=not args.no_cleanup, workers=args.workers, build=build):
+            exit(1)
+        return
+
+    # Handle --optimize-png on its own (whole pack)
+    if args.optimize_png and not args.name:
+        if not generator.optimize_species_textures(generator.texture_species(), args.workers,
+                                                    prune=True):
+            exit(1)
+        return
+
+    # Validate required arguments when creating a Pokémon
+    if not args.name or not args.number:
+        parser.error("--name and --number are required when creating a Pokémon")
+
+    config = build_create_config(args)
+
+    if args.legendary:
+        print("\nLegendary mode activated!")
+        print("   - Catch rate: 3 (very hard)")
+        print("   - Base EXP: 290 (legendary level)")
+        print("   - Spawn weight: 0.05 (extremely rare)")
+        print("   - Labels: custom, legendary")
+
+    # Generate the packs
+    success = generator.generate_pokemon(
+        pokemon_name=args.name,
+        config=config,
+        cleanup=not args.no_cleanup
+    )
+
+    if not success:
+        exit(1)
+
+
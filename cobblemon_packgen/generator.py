@@ -0,0 +1,4379 @@
+"""The pack generation engine: CobblemonPackGenerator plus the index, lang
+journal, transaction, cache and file-format helpers it is built on. Console
+options live in options.py, the library entry points in api.py."""
+
+GENERATOR_VERSION = "2.7"
+
+import os
+import io
+import re
+import sys
+import csv
+import json
+import zlib
+import shutil
+import struct
+import filecmp
+import hashlib
+import zipfile
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import metrics, templates, trace
+from .templates import EV_STATS, parse_ev_yield, parse_drops, parse_hitbox
+
+
+VALID_EXP_GROUPS = {"slow", "medium_slow", "medium_fast", "fast", "erratic", "fluctuating"}
+VALID_EGG_GROUPS = {"monster", "water1", "bug", "flying", "field", "fairy", "grass", "humanlike",
+                    "water3", "mineral", "amorphous", "water2", "ditto", "dragon", "undiscovered"}
+VALID_BUCKETS = {"common", "uncommon", "rare", "ultra-rare"}
+
+# JSON output profiles (--profile): dev = readable, release = smallest download
+JSON_PROFILES = {
+    "dev": {"indent": 2},
+    "release": {"separators": (",", ":"), "sort_keys": True},
+}
+RELEASE_FLOAT_DIGITS = 6  # keeps 1/64-pixel precision in model coordinates
+
+
+def round_floats(value, digits: int = RELEASE_FLOAT_DIGITS):
+    """Copy of a JSON value with every float rounded (0.30000000000000004 -> 0.3)."""
+    if isinstance(value, float):
+        return round(value, digits)
+    if isinstance(value, dict):
+        return {k: round_floats(v, digits) for k, v in value.items()}
+    if isinstance(value, list):
+        return [round_floats(v, digits) for v in value]
+    return value
+
+
+def parse_spawn_entry(spec: str, pokemon_name: str):
+    """Parse a spawn entry spec into a full entry dict.
+
+    Accepts either JSON ('{"bucket": "rare", ...}') or compact key=value pairs:
+        "bucket=rare,level=20-40,weight=5,biomes=#minecraft:is_savanna;#minecraft:is_badlands,canSeeSky=false"
+    Biome/preset lists use ';' between items. Unspecified fields get the same
+    defaults as creation. Raises ValueError on bad input."""
+    defaults = {
+        "id": None,  # filled by caller (auto-numbered)
+        "pokemon": pokemon_name,
+        "presets": ["natural"],
+        "type": "pokemon",
+        "context": "grounded",
+        "bucket": "common",
+        "level": "5-30",
+        "weight": 10.0,
+        "condition": {"canSeeSky": True, "biomes": ["#minecraft:is_overworld"]},
+    }
+    spec = spec.strip()
+    if spec.startswith('{'):
+        parsed = json.loads(spec)
+        if not isinstance(parsed, dict):
+            raise ValueError("JSON spawn entry must be an object")
+        entry = defaults
+        cond = entry["condition"]
+        entry.update(parsed)
+        if "condition" in parsed:
+            cond.update(parsed["condition"])
+        entry["condition"] = cond
+    else:
+        entry = defaults
+        valid_keys = {"id", "pokemon", "bucket", "level", "weight", "biomes",
+                      "canseesky", "can_see_sky", "context", "presets"}
+        for pair in spec.split(','):
+            if '=' not in pair:
+                raise ValueError(f"'{pair}' is not key=value")
+            key, value = pair.split('=', 1)
+            key_norm = key.strip().lower()
+            value = value.strip()
+            if key_norm not in valid_keys:
+                raise ValueError(f"unknown key '{key.strip()}' "
+                                 f"(valid: bucket, level, weight, biomes, canSeeSky, "
+                                 f"context, presets, id, pokemon)")
+            if key_norm == "weight":
+                entry["weight"] = float(value)
+            elif key_norm == "biomes":
+                entry["condition"]["biomes"] = [b.strip() for b in value.split(';') if b.strip()]
+            elif key_norm in ("canseesky", "can_see_sky"):
+                if value.lower() not in ("true", "false"):
+                    raise ValueError("canSeeSky must be true or false")
+                entry["condition"]["canSeeSky"] = (value.lower() == "true")
+            elif key_norm == "presets":
+                entry["presets"] = [p.strip() for p in value.split(';') if p.strip()]
+            else:
+                entry[key_norm if key_norm != "pokemon" else "pokemon"] = value
+    if entry.get("bucket") not in VALID_BUCKETS:
+        raise ValueError(f"invalid bucket '{entry.get('bucket')}' "
+                         f"(valid: {', '.join(sorted(VALID_BUCKETS))})")
+    return entry
+
+
+_IDENTIFIER_KEY = re.compile(r'"identifier"\s*:\s*"')
+GEOMETRY_SCAN_CHUNK = 1 << 20  # bytes per read when streaming a model (rewrite_geometry_identifiers)
+_GEOMETRY_SCAN_CONTEXT = 4096  # bytes kept behind the read position for the backwards checks
+_GEOMETRY_SCAN_OVERLAP = 64  # re-searched at the next read: an "identifier" key split between reads
+
+
+def _prev_nonspace(text: str, i: int) -> int:
+    """Index of the last non-whitespace character before position i (-1 if none)."""
+    i -= 1
+    while i >= 0 and text[i] in ' \t\r\n':
+        i -= 1
+    return i
+
+
+def _is_geometry_identifier(text: str, key_start: int, first: bool) -> bool:
+    """True if the "identifier" key at key_start is the first key of a geometry's
+    "description", and that geometry is the first (first=True) or a later entry
+    of the "minecraft:geometry" array. Walks backwards over text only."""
+    geometry_key = '"minecraft:geometry"'
+    description_key = '"description"'
+    # { "description": { "identifier": ...   walking backwards from the key
+    brace = _prev_nonspace(text, key_start)
+    colon = _prev_nonspace(text, brace)
+    quote = _prev_nonspace(text, colon)
+    desc_start = quote - len(description_key) + 1
+    if (brace < 0 or text[brace] != '{' or colon < 0 or text[colon] != ':'
+            or desc_start < 0 or not text.startswith(description_key, desc_start)):
+        return False
+    geom_brace = _prev_nonspace(text, desc_start)
+    if geom_brace < 0 or text[geom_brace] != '{':
+        return False
+    sep = _prev_nonspace(text, geom_brace)
+    if sep >= 0 and text[sep] == '[':
+        # First geometry: must be the value of "minecraft:geometry"
+        key_colon = _prev_nonspace(text, sep)
+        key_end = _prev_nonspace(text, key_colon) + 1
+        return (first and key_colon >= 0 and text[key_colon] == ':'
+                and key_end >= len(geometry_key) and text.startswith(geometry_key, key_end - len(geometry_key)))
+    if sep >= 0 and text[sep] == ',' and not first:
+        closing = _prev_nonspace(text, sep)
+        return closing >= 0 and text[closing] == '}'  # a later geometry in the same array
+    return False
+
+
+def scan_geometry_identifiers(text: str):
+    """Find every minecraft:geometry[*].description.identifier string token in a
+    model's JSON text WITHOUT parsing the model. Returns [(start, end, value)]
+    spans (quotes included), or None if the layout isn't the usual Blockbench one
+    ("description" first in each geometry, "identifier" first in it) — callers
+    then fall back to json.load."""
+    spans = []
+    for m in _IDENTIFIER_KEY.finditer(text):
+        key_start = m.start()
+        if key_start > 0 and text[key_start - 1] == '\\':
+            return None  # escaped quote: we're inside some string
+        try:
+            value, end = json.decoder.scanstring(text, m.end())
+        except ValueError:
+            return None
+        if not _is_geometry_identifier(text, key_start, not spans):
+            return None
+        spans.append((m.end() - 1, end, value))
+
+    # Every description must have been accounted for
+    if not spans or text.count('"description"') != len(spans):
+        return None
+    return spans
+
+
+def scan_geometry_identifier_stream(f):
+    """scan_geometry_identifiers for a binary file, read GEOMETRY_SCAN_CHUNK bytes
+    at a time: the spans are byte offsets. A token split between two reads is
+    carried over to the next one; a layout needing more than _GEOMETRY_SCAN_CONTEXT
+    bytes of look-back counts as unusual (None)."""
+    description_key = '"description"'
+    spans, descriptions = [], 0
+    # window holds the file from byte offset base on, decoded as latin-1 (one
+    # character per byte: offsets stay byte offsets, JSON punctuation is ASCII)
+    window, base, pos = "", 0, 0
+    while True:
+        chunk = f.read(GEOMETRY_SCAN_CHUNK)
+        counted = max(0, len(window) - len(description_key) + 1)
+        window += chunk.decode('latin-1')
+        descriptions += window.count(description_key, counted)
+        carried = False
+        for m in _IDENTIFIER_KEY.finditer(window, pos):
+            key_start = m.start()
+            if key_start > 0 and window[key_start - 1] == '\\':
+                return None  # escaped quote: we're inside some string
+            try:
+                _raw, end = json.decoder.scanstring(window, m.end())
+            except ValueError:
+                if chunk:
+                    pos, carried = key_start, True  # the string goes on in the next read
+                    break
+                return None
+            if not _is_geometry_identifier(window, key_start, not spans):
+                return None
+            try:
+                value = json.loads(window[m.end() - 1:end].encode('latin-1').decode('utf-8'))
+            except ValueError:
+                return None
+            spans.append((base + m.end() - 1, base + end, value))
+            pos = end
+        if not chunk:
+            break
+        if not carried:
+            pos = max(pos, len(window) - _GEOMETRY_SCAN_OVERLAP)
+        cut = max(0, pos - _GEOMETRY_SCAN_CONTEXT)
+        window, base, pos = window[cut:], base + cut, pos - cut
+
+    # Every description must have been accounted for
+    if not spans or descriptions != len(spans):
+        return None
+    return spans
+
+
+def _copy_bytes(src, out, count: int):
+    """Copy count bytes from binary file src to out, GEOMETRY_SCAN_CHUNK at a time."""
+    while count > 0:
+        data = src.read(min(count, GEOMETRY_SCAN_CHUNK))
+        if not data:
+            raise ValueError("file changed while it was being rewritten")
+        out.write(data)
+        count -= len(data)
+
+
+def rewrite_geometry_identifiers(src: Path, dest: Path, rename, copy_unchanged: bool = True) -> Optional[List[tuple]]:
+    """Copy a model from src to dest (may be the same file), replacing each geometry
+    identifier with rename(old_identifier) and passing every other byte through
+    (line endings included). Both passes stream the file, so memory use doesn't
+    grow with the model. Returns [(old, new)] per geometry, or None if the structure
+    is unusual (nothing written — use the json.load path instead). With
+    copy_unchanged=False nothing is written when no identifier changes (the caller
+    ingests the file itself)."""
+    with open(src, 'rb') as f:
+        spans = scan_geometry_identifier_stream(f)
+    if spans is None:
+        return None
+    if not copy_unchanged and all(rename(old_id) == old_id for _s, _e, old_id in spans):
+        return [(old_id, old_id) for _s, _e, old_id in spans]
+
+    changes = []
+    temp = dest.with_name(f".{dest.name}.tmp")
+    try:
+        with open(src, 'rb') as f, open(temp, 'wb') as out:
+            pos = 0
+            for start, end, old_id in spans:
+                new_id = rename(old_id)
+                changes.append((old_id, new_id))
+                if new_id != old_id:
+                    _copy_bytes(f, out, start - pos)
+                    out.write(json.dumps(new_id).encode('utf-8'))
+                    f.seek(end)
+                    pos = end
+            shutil.copyfileobj(f, out, GEOMETRY_SCAN_CHUNK)
+        os.replace(temp, dest)
+    except BaseException:
+        if temp.exists():
+            temp.unlink()
+        raise
+    return changes
+
+
+def move_all(moves: List[tuple]):
+    """Rename (src, dest) pairs so chains and swaps can't clobber each other:
+    every source is first parked under a temporary name next to it."""
+    parked = []
+    for i, (src, dest) in enumerate(moves):
+        temp = src.with_name(f".renaming-{os.getpid()}-{i}-{src.name}")
+        src.rename(temp)
+        parked.append((temp, dest))
+    for temp, dest in parked:
+        temp.rename(dest)
+
+
+FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, XFS, ...)
+
+
+def reflink_file(src: Path, dest: Path) -> bool:
+    """Copy-on-write clone of src at dest; False if the OS/filesystem can't do it."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, 'rb') as s, open(dest, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        try:
+            dest.unlink()
+        except OSError:
+            pass
+        return False
+    shutil.copystat(src, dest)
+    return True
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_TYPES = {0: "grey", 2: "rgb", 3: "palette", 4: "grey+alpha", 6: "rgba"}
+TGA_IMAGE_TYPES = {1: "palette", 2: "rgb", 3: "grey", 9: "palette rle", 10: "rgb rle", 11: "grey rle"}
+
+
+def inspect_texture(path: Path) -> Dict:
+    """Format, size and bit depth of a texture from its header alone (PNG IHDR:
+    first 33 bytes; TGA: first 18). Detected by content, not extension, so TGA
+    data saved as .png shows up as format 'tga'. Unknown data: format None."""
+    with open(path, 'rb') as f:
+        head = f.read(33)
+    if head[:8] == PNG_SIGNATURE and head[12:16] == b"IHDR" and len(head) >= 26:
+        width, height, bit_depth, color_type = struct.unpack('>IIBB', head[16:26])
+        return {"format": "png", "width": width, "height": height, "bit_depth": bit_depth,
+                "color": PNG_COLOR_TYPES.get(color_type, f"type {color_type}")}
+    if len(head) >= 18:
+        colormap_type, image_type = head[1], head[2]
+        width, height, bit_depth = struct.unpack('<HHB', head[12:17])
+        if colormap_type in (0, 1) and image_type in TGA_IMAGE_TYPES and bit_depth in (8, 15, 16, 24, 32) \
+                and width and height:
+            return {"format": "tga", "width": width, "height": height, "bit_depth": bit_depth,
+                    "color": TGA_IMAGE_TYPES[image_type]}
+    return {"format": None}
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def _tga_rows(f, header: Dict, palette: List[bytes]):
+    """Yield the TGA's rows as RGBA bytes in file order (uncompressed or RLE),
+    one row in memory at a time"""
+    width, depth, rle = header['width'], header['bit_depth'], header['image_type'] >= 9
+    pixel_bytes = (depth + 7) // 8
+    row_bytes = width * pixel_bytes
+    alpha_bits = header['alpha_bits']
+    pending = bytearray()
+
+    for _ in range(header['height']):
+        if not rle:
+            data = f.read(row_bytes)
+        else:
+            while len(pending) < row_bytes:
+                packet = f.read(1)
+                if not packet:
+                    break
+                count = (packet[0] & 0x7F) + 1
+                if packet[0] & 0x80:
+                    pending += f.read(pixel_bytes) * count
+                else:
+                    pending += f.read(pixel_bytes * count)
+            data = bytes(pending[:row_bytes])
+            del pending[:row_bytes]
+        if len(data) < row_bytes:
+            raise ValueError("truncated TGA image data")
+
+        out = bytearray(width * 4)
+        if palette:
+            out[:] = b"".join(palette[i] if i < len(palette) else b"\0\0\0\xff"
+                              for i in (data if pixel_bytes == 1 else struct.unpack(f'<{width}H', data)))
+        elif depth == 32:
+            out[0::4], out[1::4], out[2::4] = data[2::4], data[1::4], data[0::4]
+            out[3::4] = data[3::4] if alpha_bits else b"\xff" * width
+        elif depth == 24:
+            out[0::4], out[1::4], out[2::4] = data[2::3], data[1::3], data[0::3]
+            out[3::4] = b"\xff" * width
+        elif depth == 8:
+            out[0::4] = out[1::4] = out[2::4] = data
+            out[3::4] = b"\xff" * width
+        elif header['grey']:  # 16-bit greyscale: luminance byte, then alpha byte
+            out[0::4] = out[1::4] = out[2::4] = data[0::2]
+            out[3::4] = data[1::2] if alpha_bits else b"\xff" * width
+        else:  # 15/16-bit ARRRRRGG GGGBBBBB
+            for i, value in enumerate(struct.unpack(f'<{width}H', data)):
+                r, g, b = (value >> 10) & 31, (value >> 5) & 31, value & 31
+                out[i * 4:i * 4 + 4] = bytes((r * 255 // 31, g * 255 // 31, b * 255 // 31,
+                                              0 if alpha_bits and not value & 0x8000 else 255))
+        if header['right_to_left']:
+            out = b"".join(out[i:i + 4] for i in range(len(out) - 4, -1, -4))
+        yield bytes(out)
+
+
+def convert_tga_to_png(src: Path, dest: Path) -> Dict:
+    """Convert a TGA (uncompressed or RLE; true-colour, greyscale or colour-mapped)
+    to an RGBA PNG at dest. Rows are decoded and deflated one at a time, so memory
+    stays flat even for 4K textures; bottom-up images (the TGA default) are
+    flipped through a temporary file. Module-level so a process pool can run it."""
+    with open(src, 'rb') as f:
+        raw = f.read(18)
+        if len(raw) < 18:
+            raise ValueError("not a TGA file (header too short)")
+        (id_length, colormap_type, image_type, cmap_first, cmap_length, cmap_depth,
+         _x, _y, width, height, depth, descriptor) = struct.unpack('<BBBHHBHHHHBB', raw)
+        if image_type not in TGA_IMAGE_TYPES or colormap_type not in (0, 1) or not width or not height:
+            raise ValueError(f"unsupported TGA (image type {image_type})")
+        header = {'width': width, 'height': height, 'bit_depth': depth, 'image_type': image_type,
+                  'alpha_bits': descriptor & 0x0F, 'right_to_left': bool(descriptor & 0x10),
+                  'grey': image_type in (3, 11)}
+        f.seek(id_length, os.SEEK_CUR)
+
+        palette = []
+        if colormap_type == 1 and image_type not in (1, 9):
+            # True-colour / greyscale files may still carry a colour map: skip it
+            f.seek(cmap_length * ((cmap_depth + 7) // 8), os.SEEK_CUR)
+        elif colormap_type == 1:
+            entry_bytes = (cmap_depth + 7) // 8
+            cmap = f.read(cmap_length * entry_bytes)
+            if len(cmap) < cmap_length * entry_bytes:
+                raise ValueError("truncated TGA colour map")
+            for i in range(cmap_length):
+                e = cmap[i * entry_bytes:(i + 1) * entry_bytes]
+                if entry_bytes >= 3:
+                    palette.append(bytes((e[2], e[1], e[0], e[3] if entry_bytes == 4 else 255)))
+                else:
+                    value = int.from_bytes(e, 'little')
+                    palette.append(bytes((((value >> 10) & 31) * 255 // 31, ((value >> 5) & 31) * 255 // 31,
+                                          (value & 31) * 255 // 31, 255)))
+            palette = [b"\0\0\0\xff"] * cmap_first + palette
+        elif image_type in (1, 9):
+            raise ValueError("colour-mapped TGA without a colour map")
+        if not palette and depth not in (8, 15, 16, 24, 32):
+            raise ValueError(f"unsupported TGA bit depth {depth}")
+        if header['grey'] and depth not in (8, 16):
+            raise ValueError(f"unsupported greyscale TGA bit depth {depth}")
+        if palette and depth not in (8, 16):
+            raise ValueError(f"unsupported colour-mapped TGA index depth {depth}")
+
+        rows = _tga_rows(f, header, palette)
+        spill = None
+        temp = dest.with_name(f".{dest.name}.tmp")
+        compressor = zlib.compressobj(6)
+        try:
+            if not descriptor & 0x20:  # bottom-up: park rows on disk, emit them top-down
+                spill = tempfile.TemporaryFile()
+                for row in rows:
+                    spill.write(row)
+
+                def top_down():
+                    for y in range(height - 1, -1, -1):
+                        spill.seek(y * width * 4)
+                        yield spill.read(width * 4)
+                rows = top_down()
+
+            with open(temp, 'wb') as out:
+                out.write(PNG_SIGNATURE)
+                out.write(_png_chunk(b"IHDR", struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+                for row in rows:
+                    block = compressor.compress(b"\0" + row)
+                    if block:
+                        out.write(_png_chunk(b"IDAT", block))
+                out.write(_png_chunk(b"IDAT", compressor.flush()))
+                out.write(_png_chunk(b"IEND", b""))
+        except BaseException as e:
+            temp.unlink(missing_ok=True)
+            if isinstance(e, (struct.error, IndexError)):  # malformed pixel data: report, don't crash
+                raise ValueError(f"corrupt TGA image data ({e})") from e
+            raise
+        finally:
+            if spill is not None:
+                spill.close()
+        os.replace(temp, dest)
+    return {"width": width, "height": height}
+
+
+PNG_KEPT_CHUNKS = {b"IHDR", b"PLTE", b"tRNS", b"IDAT", b"IEND"}  # tRNS is ancillary but carries alpha
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def optimize_png(data: bytes) -> bytes:
+    """Lossless PNG recompression: drop ancillary chunks (except tRNS), pick the
+    scanline filter with the smallest sum of absolute values per row, deflate at
+    level 9. Returns data unchanged if the result isn't smaller or the image is
+    interlaced. Module-level so a process pool can run it."""
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError("not a PNG file")
+    chunks, idat, pos = [], bytearray(), 8
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IDAT":
+            idat += body
+        elif kind in PNG_KEPT_CHUNKS:
+            chunks.append((kind, body))
+        if kind == b"IEND":
+            break
+    header = dict(chunks).get(b"IHDR")
+    if header is None:
+        raise ValueError("PNG without IHDR")
+    width, height, bit_depth, color_type, _comp, _filter, interlace = struct.unpack('>IIBBBBB', header)
+    if interlace or color_type not in PNG_CHANNELS:
+        return data
+
+    bpp = max(1, PNG_CHANNELS[color_type] * bit_depth // 8)
+    stride = (width * PNG_CHANNELS[color_type] * bit_depth + 7) // 8
+    raw = zlib.decompress(bytes(idat))
+    if len(raw) < height * (stride + 1):
+        raise ValueError("truncated PNG image data")
+
+    out = bytearray()
+    prior = bytes(stride)
+    for y in range(height):
+        ftype = raw[y * (stride + 1)]
+        line = bytearray(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+        # Unfilter
+        if ftype == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif ftype == 2:
+            line = bytearray((v + u) & 0xFF for v, u in zip(line, prior))
+        elif ftype == 3:
+            for i in range(stride):
+                line[i] = (line[i] + ((line[i - bpp] if i >= bpp else 0) + prior[i]) // 2) & 0xFF
+        elif ftype == 4:
+            for i in range(stride):
+                a = line[i - bpp] if i >= bpp else 0
+                c = prior[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + _paeth(a, prior[i], c)) & 0xFF
+        elif ftype != 0:
+            raise ValueError(f"bad PNG filter type {ftype}")
+        line = bytes(line)
+
+        # Refilter: try all five, keep the one with the smallest signed-byte sum
+        left = bytes(bpp) + line[:-bpp] if stride > bpp else bytes(stride)
+        upleft = bytes(bpp) + prior[:-bpp] if stride > bpp else bytes(stride)
+        candidates = [
+            line,
+            bytes((x - a) & 0xFF for x, a in zip(line, left)),
+            bytes((x - b) & 0xFF for x, b in zip(line, prior)),
+            bytes((x - (a + b) // 2) & 0xFF for x, a, b in zip(line, left, prior)),
+            bytes((x - _paeth(a, b, c)) & 0xFF for x, a, b, c in zip(line, left, prior, upleft)),
+        ]
+        best = min(range(5), key=lambda f: sum(v if v < 128 else 256 - v for v in candidates[f]))
+        out.append(best)
+        out += candidates[best]
+        prior = line
+
+    result = bytearray(PNG_SIGNATURE)
+    for kind, body in chunks:
+        if kind != b"IEND":
+            result += _png_chunk(kind, body)
+    result += _png_chunk(b"IDAT", zlib.compress(bytes(out), 9))
+    result += _png_chunk(b"IEND", b"")
+    return bytes(result) if len(result) < len(data) else data
+
+
+_BEDROCK_ANIMATION = re.compile(r'bedrock\(\s*([^,\s)]+)\s*,\s*([^,\s)]+)\s*\)')
+
+
+def poser_animation_refs(data) -> List[tuple]:
+    """Every bedrock(group, animation) reference anywhere in a poser, as (group, animation)"""
+    refs = []
+    if isinstance(data, dict):
+        for value in data.values():
+            refs.extend(poser_animation_refs(value))
+    elif isinstance(data, list):
+        for value in data:
+            refs.extend(poser_animation_refs(value))
+    elif isinstance(data, str):
+        refs.extend(_BEDROCK_ANIMATION.findall(data))
+    return refs
+
+
+def is_tga_texture(path: Path) -> bool:
+    """True if the file holds TGA data, whatever its extension"""
+    try:
+        return inspect_texture(path)['format'] == 'tga'
+    except OSError:
+        return False
+
+
+_TEXTURE_SIZE = re.compile(r'"texture_(width|height)"\s*:\s*(\d+)')
+
+
+def model_texture_size(path: Path) -> Optional[tuple]:
+    """(texture_width, texture_height) from the first geometry description of a
+    .geo.json. The description comes first, so only the head of the file is read;
+    None if the model doesn't declare both."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        head = f.read(65536)
+    size = {}
+    for key, value in _TEXTURE_SIZE.findall(head):
+        size.setdefault(key, int(value))
+    if 'width' in size and 'height' in size:
+        return size['width'], size['height']
+    return None
+
+
+WATCH_POLL_SECONDS = 1.0
+WATCH_SETTLE_SECONDS = 2.0  # a file must keep the same size/mtime this long (export finished)
+
+
+def asset_species(filename: str) -> str:
+    """Species an exported asset belongs to, by file name:
+    flamebird.geo.json / flamebird.animation.json / flamebird_shiny.png -> 'flamebird'"""
+    stem = filename.split('.')[0].lower()
+    return stem[:-len('_shiny')] if stem.endswith('_shiny') else stem
+
+
+# --where field -> PackIndex species record key (filters never open species files)
+WHERE_FIELDS = {
+    "name": "name",
+    "nationalpokedexnumber": "number", "number": "number",
+    "primarytype": "primary_type", "secondarytype": "secondary_type",
+    "labels": "labels",
+    "catchrate": "catch_rate",
+    "preevolution": "pre_evolution",
+}
+WHERE_OPERATORS = ("!=", "<=", ">=", "=", "~", "<", ">")
+
+
+def parse_where(spec: str) -> List[tuple]:
+    """Parse "primaryType=fire,labels~legendary,baseStats.hp>=100" into
+    (record key, stat or None, operator, value) conditions, all of which must hold.
+    = / != compare, ~ means contains (list item or substring), < > <= >= are numeric.
+    Raises ValueError on bad input."""
+    conditions = []
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        match = re.fullmatch(r'\s*([A-Za-z_.]+)\s*(!=|<=|>=|=|~|<|>)\s*(.*?)\s*', part)
+        if not match:
+            raise ValueError(f"'{part}' is not field<op>value (ops: {' '.join(WHERE_OPERATORS)})")
+        field, op, value = match.groups()
+        key = field.lower()
+        stat = None
+        if key.startswith("basestats."):
+            key, stat = "base_stats", field.split('.', 1)[1]
+        elif key in WHERE_FIELDS:
+            key = WHERE_FIELDS[key]
+        else:
+            raise ValueError(f"unknown --where field '{field}' (valid: name, nationalPokedexNumber, primaryType, "
+                             f"secondaryType, labels, catchRate, preEvolution, baseStats.<stat>)")
+        if op in ("<", ">", "<=", ">="):
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"'{part}': {op} needs a number")
+        conditions.append((key, stat, op, value))
+    if not conditions:
+        raise ValueError("empty --where")
+    return conditions
+
+
+def where_matches(record: Dict, conditions: List[tuple]) -> bool:
+    """True if an index species record satisfies every parse_where() condition"""
+    for key, stat, op, value in conditions:
+        actual = record.get(key)
+        if stat is not None:
+            actual = (actual or {}).get(stat) if isinstance(actual, dict) else None
+        if op in ("<", ">", "<=", ">="):
+            try:
+                actual = float(actual)
+            except (TypeError, ValueError):
+                return False
+            if not {"<": actual < value, ">": actual > value,
+                    "<=": actual <= value, ">=": actual >= value}[op]:
+                return False
+        elif op == "~":
+            if isinstance(actual, list):
+                if value.lower() not in (str(item).lower() for item in actual):
+                    return False
+            elif value.lower() not in str(actual or '').lower():
+                return False
+        else:
+            equal = str(actual if actual is not None else '').lower() == value.lower()
+            if equal != (op == "="):
+                return False
+    return True
+
+
+def parse_set(spec: str) -> List[tuple]:
+    """Parse "catchRate=90,baseStats.hp=80,spawn.weight=0.02" into (scope, path, value)
+    assignments: scope 'species' (dotted path into the species file) or 'spawn'
+    (path into every entry of its spawn pool file). Values are JSON when they
+    parse (90, 0.02, true, ["a"]) and strings otherwise. Raises ValueError."""
+    assignments = []
+    for part in re.split(r',(?![^\[{]*[\]}])', spec):
+        if not part.strip():
+            continue
+        if '=' not in part:
+            raise ValueError(f"'{part}' is not field=value")
+        field, raw = (s.strip() for s in part.split('=', 1))
+        path = field.split('.')
+        scope = "species"
+        if path[0].lower() == "spawn":
+            scope, path = "spawn", path[1:]
+        if not path or not all(path):
+            raise ValueError(f"'{field}' is not a field path")
+        if scope == "species" and path[0] in ("name", "evolutions", "preEvolution"):
+            raise ValueError(f"'{field}' can't be bulk-set (use --rename / --edit for names and evolutions)")
+        if scope == "spawn" and path[0] in ("id", "pokemon"):
+            raise ValueError(f"'{field}' can't be bulk-set")
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        assignments.append((scope, path, value))
+    if not assignments:
+        raise ValueError("empty --set")
+    return assignments
+
+
+_MISSING = object()
+
+
+def set_path(data: Dict, path: List[str], value):
+    """Set data[a][b]... = value (creating objects along the way); returns the old
+    value or _MISSING. Raises ValueError if something on the path isn't an object."""
+    node = data
+    for key in path[:-1]:
+        child = node.setdefault(key, {})
+        if not isinstance(child, dict):
+            raise ValueError(f"'{'.'.join(path)}': '{key}' is not an object")
+        node = child
+    old = node.get(path[-1], _MISSING)
+    node[path[-1]] = value
+    return old
+
+
+def load_rename_map(path: str) -> List[tuple]:
+    """(old, new) pairs from a two-column CSV (optional old,new header row; blank
+    lines and lines starting with # are skipped). Raises ValueError on bad input."""
+    pairs = []
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for line_no, row in enumerate(csv.reader(f), 1):
+            cells = [c.strip() for c in row]
+            if not any(cells) or cells[0].startswith('#'):
+                continue
+            if len(cells) != 2 or not all(cells):
+                raise ValueError(f"line {line_no}: expected 'old,new', got {','.join(row)!r}")
+            if line_no == 1 and [c.lower() for c in cells] == ['old', 'new']:
+                continue
+            pairs.append((cells[0], cells[1]))
+    return pairs
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """sys.stdout stand-in that lets worker threads buffer their console output,
+    so each species' log prints as one block instead of interleaving."""
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buffer = io.StringIO()
+
+    def release(self) -> str:
+        buffer = getattr(self._local, 'buffer', None)
+        self._local.buffer = None
+        return buffer.getvalue() if buffer is not None else ""
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.target).write(text)
+
+    def flush(self):
+        self.target.flush()
+
+
+class LangJournal:
+    """Append-only journal of en_us.json changes.
+
+    Creating/editing/renaming a species appends a small {"set": {...}} or
+    {"delete": [...]} line instead of rewriting the whole lang file; compact()
+    folds the journal into en_us.json once (existing keys preserved, later
+    ops win, keys sorted) and clears it. load() always sees journaled changes."""
+
+    def __init__(self, lang_file: Path, journal_file: Path):
+        self.lang_file = lang_file
+        self.journal_file = journal_file
+        self._merged = None  # lang file + journal, once loaded
+        self._merged_stamp = None  # _stamp() matching _merged
+        self._lock = threading.Lock()
+
+    def pending(self) -> bool:
+        return self.journal_file.exists() and self.journal_file.stat().st_size > 0
+
+    def _stamp(self) -> tuple:
+        stamp = []
+        for path in (self.lang_file, self.journal_file):
+            try:
+                st = path.stat()
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def revalidate(self) -> bool:
+        """Forget the loaded view if en_us.json or the journal changed on disk
+        since (someone else edited them); True if it did"""
+        with self._lock:
+            if self._merged is not None and self._stamp() != self._merged_stamp:
+                self._merged = None
+                return True
+        return False
+
+    def set(self, entries: Dict):
+        if entries:
+            self._append({"set": entries})
+
+    def delete(self, keys: List[str]):
+        if keys:
+            self._append({"delete": list(keys)})
+
+    def _append(self, op: Dict):
+        with self._lock:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(op, ensure_ascii=False) + "\n")
+            if self._merged is not None:
+                self._apply(self._merged, op)
+                self._merged_stamp = self._stamp()
+
+    @staticmethod
+    def _apply(lang: Dict, op: Dict):
+        lang.update(op.get("set", {}))
+        for key in op.get("delete", []):
+            lang.pop(key, None)
+
+    def _replay(self, lang: Dict) -> Dict:
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply(lang, json.loads(line))
+                    except (ValueError, AttributeError):
+                        print(f"WARNING: Skipped unreadable lang journal line {line_no} "
+                              f"({self.journal_file.name})")
+        return lang
+
+    def load(self) -> Dict:
+        """Current lang contents: en_us.json with the journal applied"""
+        with self._lock:
+            if self._merged is None:
+                lang = {}
+                if self.lang_file.exists():
+                    with open(self.lang_file, 'r', encoding='utf-8') as f:
+                        lang = json.load(f)
+                self._merged = self._replay(lang)
+                self._merged_stamp = self._stamp()
+            return self._merged
+
+    def compact(self, write_json=None) -> Optional[int]:
+        """Fold the journal into en_us.json; returns the key count, or None if nothing was pending.
+        write_json(path, data) overrides the default pretty-printed output."""
+        if not self.pending():
+            return None
+        lang = self.load()
+        with self._lock:
+            self.lang_file.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.lang_file.with_name(f".{self.lang_file.name}.tmp")
+            if write_json is not None:
+                write_json(temp, lang)
+            else:
+                with open(temp, 'w', encoding='utf-8') as f:
+                    json.dump(lang, f, indent=2, sort_keys=True, ensure_ascii=False)
+            os.replace(temp, self.lang_file)
+            self.journal_file.unlink()
+            self._merged_stamp = self._stamp()
+        return len(lang)
+
+
+class PackTransaction:
+    """Load-once / write-once view of the pack JSON files touched by one edit.
+
+    load() parses each file at most once and hands back the same object for
+    every later mutation; set()/mark_dirty() flag it for writing. commit()
+    stages every dirty file to a temp file first and only then swaps them all
+    in; if staging or a swap fails, the files already swapped are put back from
+    their backups, so the pack ends up as it was before the commit."""
+
+    def __init__(self):
+        self._docs = {}   # path -> parsed data
+        self._dirty = {}  # path -> file class (for the size report)
+
+    def exists(self, path: Path) -> bool:
+        return path in self._docs or path.exists()
+
+    def load(self, path: Path, default=None, encoding: Optional[str] = None):
+        """Parsed contents of path (cached). A missing file returns default if given."""
+        if path not in self._docs:
+            if default is not None and not path.exists():
+                return default
+            with open(path, 'r', encoding=encoding) as f:
+                self._docs[path] = json.load(f)
+        return self._docs[path]
+
+    def set(self, path: Path, data, file_class: str):
+        self._docs[path] = data
+        self.mark_dirty(path, file_class)
+
+    def mark_dirty(self, path: Path, file_class: str):
+        self._dirty[path] = file_class
+
+    def commit(self, write_json) -> Dict[Path, object]:
+        """Write every dirty file exactly once via write_json(path, data, file_class);
+        returns {path: data} written"""
+        staged = []
+        temp = None
+        try:
+            for path, file_class in self._dirty.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp = path.with_name(f".{path.name}.edit-tmp")
+                write_json(temp, self._docs[path], file_class)
+                staged.append((temp, path))
+                temp = None
+        except Exception:
+            for stale in [t for t, _path in staged] + ([temp] if temp is not None else []):
+                if stale.exists():
+                    stale.unlink()
+            raise
+
+        swapped = []  # (path, backup of the original or None if it is new)
+        try:
+            for temp, path in staged:
+                backup = None
+                if path.exists():
+                    # A hard link keeps path readable the whole time; copy where links aren't supported
+                    backup = path.with_name(f".{path.name}.edit-bak")
+                    if backup.exists():
+                        backup.unlink()
+                    try:
+                        os.link(path, backup)
+                    except OSError:
+                        shutil.copy2(path, backup)
+                swapped.append((path, backup))
+                os.replace(temp, path)
+        except Exception:
+            for path, backup in reversed(swapped):
+                try:
+                    if backup is not None:
+                        os.replace(backup, path)
+                        if backup.exists():  # still the same file as path (not swapped yet)
+                            backup.unlink()
+                    elif path.exists():
+                        path.unlink()
+                except OSError as e:
+                    print(f"ERROR: Could not restore {path.name} ({e})" +
+                          (f"; the original is in {backup.name}" if backup is not None else ""))
+            for temp, _path in staged:
+                if temp.exists():
+                    temp.unlink()
+            raise
+        for _path, backup in swapped:
+            if backup is not None:
+                backup.unlink()
+        written = {path: self._docs[path] for _temp, path in staged}
+        self._dirty.clear()
+        return written
+
+
+def evolution_target(result) -> str:
+    """Species name an evolution 'result' points at: "cobblemon:foo shiny" -> "foo"."""
+    parts = str(result or '').split(' ')
+    return parts[0].split(':')[-1] if parts else ''
+
+
+class PackIndex:
+    """In-memory index of a pack, built in ONE pass over species/custom,
+    spawn_pool_world, species_additions and the lang file.
+
+    Species records hold only the extracted fields the commands need (name, dex
+    number, types, base stats, labels, catchRate, evolutions, preEvolution), so
+    lookups never re-open files. Writers keep it current via refresh()/forget().
+
+    With a cache_file, extracted fields are also persisted in SQLite keyed by
+    path + mtime + size, so a warm build only re-parses files that changed."""
+
+    CACHE_SCHEMA = 1  # bump when the extracted fields change
+
+    def __init__(self, behavior_pack_dir: Path, resource_pack_dir: Path,
+                 lang_journal: Optional[LangJournal] = None):
+        data_dir = behavior_pack_dir / "data" / "cobblemon"
+        self.behavior_pack_dir = behavior_pack_dir
+        self.species_dir = data_dir / "species" / "custom"
+        self.spawn_dir = data_dir / "spawn_pool_world"
+        self.additions_dir = data_dir / "species_additions"
+        self.lang_file = resource_pack_dir / "assets" / "cobblemon" / "lang" / "en_us.json"
+        self.lang_journal = lang_journal
+
+        self.species = {}    # name -> record
+        self._species_names = {}  # species file -> name
+        self.spawns = {}     # spawn file -> [pokemon names]
+        self.additions = {}  # additions file -> {'target', 'evolutions'}
+        self.references = {}  # species name -> {file: [field paths]} (reverse index)
+        self._file_references = {}  # file -> species names it refers to
+        self._lang = None    # loaded on first use
+        self.errors = {}     # file -> error message
+        self.stamps = {}     # indexed file -> (mtime_ns, size) when it was indexed
+        self.parsed = 0      # files actually parsed (not served from the cache)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, behavior_pack_dir: Path, resource_pack_dir: Path,
+              cache_file: Optional[Path] = None, lang_journal: Optional[LangJournal] = None) -> 'PackIndex':
+        index = cls(behavior_pack_dir, resource_pack_dir, lang_journal)
+        cache = index._open_cache(cache_file) if cache_file else None
+        cached = {}
+        if cache is not None:
+            cached = {row[0]: row[1:] for row in
+                      cache.execute("SELECT path, mtime_ns, size, entry FROM files")}
+
+        seen, updates = set(), []
+        for directory in (index.species_dir, index.spawn_dir, index.additions_dir):
+            if not directory.exists():
+                continue
+            with os.scandir(directory) as it:
+                dir_entries = sorted((e for e in it if e.name.endswith('.json') and e.is_file()),
+                                     key=lambda e: e.name)
+            for dir_entry in dir_entries:
+                path = Path(dir_entry.path)
+                key = path.relative_to(behavior_pack_dir).as_posix()
+                st = dir_entry.stat()
+                seen.add(key)
+                hit = cached.get(key)
+                if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                    index._store(path, json.loads(hit[2]))
+                    index.stamps[path] = (st.st_mtime_ns, st.st_size)
+                    metrics.inc("cache_hits", cache="index")
+                    continue
+                if cache is not None:
+                    metrics.inc("cache_misses", cache="index")
+                entry = index.refresh(path)
+                if entry is not None:
+                    updates.append((key, st.st_mtime_ns, st.st_size, json.dumps(entry)))
+
+        if cache is not None:
+            try:
+                with cache:
+                    cache.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", updates)
+                    cache.executemany("DELETE FROM files WHERE path = ?",
+                                      [(key,) for key in cached if key not in seen])
+            except Exception as e:
+                print(f"WARNING: Could not update index cache: {e}")
+            cache.close()
+        return index
+
+    @classmethod
+    def _open_cache(cls, cache_file: Path):
+        """Open (or reset) the SQLite cache; None if it can't be used"""
+        import sqlite3
+        try:
+            cache = sqlite3.connect(str(cache_file))
+            if cache.execute("PRAGMA user_version").fetchone()[0] != cls.CACHE_SCHEMA:
+                cache.execute("DROP TABLE IF EXISTS files")
+                cache.execute(f"PRAGMA user_version = {cls.CACHE_SCHEMA}")
+            cache.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+                          "mtime_ns INTEGER, size INTEGER, entry TEXT)")
+            return cache
+        except Exception as e:
+            print(f"WARNING: Index cache unavailable ({cache_file.name}): {e}")
+            return None
+
+    @property
+    def lang(self) -> Dict:
+        """Lang keys (journaled changes included), loaded on first use"""
+        if self.lang_journal is not None:
+            try:
+                return self.lang_journal.load()
+            except Exception as e:
+                self.errors[self.lang_file] = str(e)
+                return {}
+        if self._lang is None:
+            self._lang = {}
+            if self.lang_file.exists():
+                try:
+                    with open(self.lang_file, 'r', encoding='utf-8') as f:
+                        self._lang = json.load(f)
+                except Exception as e:
+                    self.errors[self.lang_file] = str(e)
+        return self._lang
+
+    @staticmethod
+    def species_record(path: Path, data: Dict) -> Dict:
+        """Extract the indexed fields from a parsed species file"""
+        evolutions = [{'id': str(e.get('id', '')), 'result': str(e.get('result', ''))}
+                      for e in data.get('evolutions', []) or [] if isinstance(e, dict)]
+        return {
+            'file': path,
+            'name': data.get('name', path.stem),
+            'number': data.get('nationalPokedexNumber', '???'),
+            'primary_type': data.get('primaryType', '???'),
+            'secondary_type': data.get('secondaryType', ''),
+            'base_stats': data.get('baseStats', {}),
+            'labels': data.get('labels', []),
+            'catch_rate': data.get('catchRate', 45),
+            'evolutions': evolutions,
+            'pre_evolution': data.get('preEvolution'),
+        }
+
+    def _extract(self, path: Path, data: Dict):
+        """Indexed (JSON-serializable) entry for one file, by directory"""
+        if path.parent == self.species_dir:
+            record = self.species_record(path, data)
+            del record['file']
+            return record
+        if path.parent == self.spawn_dir:
+            return [str(e.get('pokemon', '')).split(' ')[0]
+                    for e in data.get('spawns', []) or [] if isinstance(e, dict)]
+        if path.parent == self.additions_dir:
+            return {
+                'target': str(data.get('target', '')).split(':')[-1],
+                'evolutions': [{'id': str(e.get('id', '')), 'result': str(e.get('result', ''))}
+                               for e in data.get('evolutions', []) or [] if isinstance(e, dict)],
+            }
+        return None
+
+    @staticmethod
+    def _evolution_references(evolutions: List[Dict]) -> List[tuple]:
+        """(target, field path) for each evolution's result and id (an id refers to
+        every name it ends with after an underscore, e.g. foo_bar_baz → bar_baz, baz)"""
+        refs = []
+        for i, evolution in enumerate(evolutions):
+            refs.append((evolution_target(evolution['result']), f"evolutions[{i}].result"))
+            parts = evolution['id'].split('_')
+            refs.extend(('_'.join(parts[k:]), f"evolutions[{i}].id") for k in range(1, len(parts)))
+        return refs
+
+    def _store(self, path: Path, entry):
+        with self._lock:
+            self._drop(path)
+            if path.parent == self.species_dir:
+                record = dict(entry, file=path)
+                self.species[record['name']] = record
+                self._species_names[path] = record['name']
+                refs = self._evolution_references(record['evolutions'])
+                if record['pre_evolution']:
+                    refs.append((str(record['pre_evolution']), "preEvolution"))
+            elif path.parent == self.spawn_dir:
+                self.spawns[path] = entry
+                refs = [(name, f"spawns[{i}].pokemon") for i, name in enumerate(entry)]
+            elif path.parent == self.additions_dir:
+                self.additions[path] = entry
+                refs = [(entry['target'], "target")] + self._evolution_references(entry['evolutions'])
+            else:
+                refs = []
+            for target, field in refs:
+                self.references.setdefault(target, {}).setdefault(path, []).append(field)
+            if refs:
+                self._file_references[path] = {target for target, _field in refs}
+
+    def refresh(self, path: Path, data: Optional[Dict] = None):
+        """(Re-)index one species/spawn/additions file; pass data if already parsed.
+        Returns the indexed entry (None if the file couldn't be read)."""
+        path = Path(path)
+        stamp = None
+        if path.parent in (self.species_dir, self.spawn_dir, self.additions_dir):
+            try:
+                st = path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        try:
+            if data is None:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                self.parsed += 1
+            entry = self._extract(path, data)
+        except Exception as e:
+            with self._lock:
+                self._drop(path)
+                self.errors[path] = str(e)
+                if stamp:
+                    self.stamps[path] = stamp
+            return None
+        self._store(path, entry)
+        if stamp:
+            with self._lock:
+                self.stamps[path] = stamp
+        return entry
+
+    def revalidate(self) -> int:
+        """Re-stat the indexed directories and re-index only files added, changed or
+        deleted since they were indexed (by anything, not just this process).
+        Returns how many were. For long-lived processes (--serve, --watch)."""
+        changed = 0
+        seen = set()
+        for directory in (self.species_dir, self.spawn_dir, self.additions_dir):
+            if not directory.exists():
+                continue
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    if not (dir_entry.name.endswith('.json') and dir_entry.is_file()):
+                        continue
+                    path = Path(dir_entry.path)
+                    seen.add(path)
+                    st = dir_entry.stat()
+                    if self.stamps.get(path) != (st.st_mtime_ns, st.st_size):
+                        self.refresh(path)
+                        changed += 1
+        for path in [p for p in self.stamps if p not in seen]:
+            self.forget(path)
+            changed += 1
+        return changed
+
+    def forget(self, path: Path):
+        """Drop a deleted/renamed file from the index"""
+        with self._lock:
+            self._drop(Path(path))
+
+    def _drop(self, path: Path):
+        for target in self._file_references.pop(path, ()):
+            referring = self.references.get(target, {})
+            referring.pop(path, None)
+            if not referring:
+                self.references.pop(target, None)
+        self.errors.pop(path, None)
+        self.stamps.pop(path, None)
+        self.spawns.pop(path, None)
+        self.additions.pop(path, None)
+        name = self._species_names.pop(path, None)
+        if name is not None and self.species.get(name, {}).get('file') == path:
+            del self.species[name]
+
+    # --- Lookups ---
+    def species_file(self, name: str) -> Optional[Path]:
+        record = self.species.get(name.lower())
+        return record['file'] if record else None
+
+    def names_with_number(self, number) -> List[str]:
+        return sorted(r['name'] for r in self.species.values() if r['number'] == number)
+
+    def referrers(self, name: str) -> Dict[Path, List[str]]:
+        """{file: [field paths]} of every indexed file referring to this species"""
+        with self._lock:
+            return {path: list(fields) for path, fields in self.references.get(name, {}).items()}
+
+    def evolution_referrers(self, name: str) -> List[Path]:
+        """Species files with an evolution whose result is this species"""
+        return sorted(path for path, fields in self.referrers(name).items()
+                      if path.parent == self.species_dir and any(f.endswith('.result') for f in fields))
+
+    def pre_evolution_referrers(self, name: str) -> List[Path]:
+        """Species files whose preEvolution is this species"""
+        return sorted(path for path, fields in self.referrers(name).items() if 'preEvolution' in fields)
+
+    def species_referencing(self, name: str) -> List[Path]:
+        """Species files referring to this species by evolution result/id or preEvolution"""
+        return sorted(path for path in self.referrers(name) if path.parent == self.species_dir)
+
+    def spawn_files_for(self, name: str) -> List[Path]:
+        return sorted(path for path in self.referrers(name) if path.parent == self.spawn_dir)
+
+    def additions_referencing(self, name: str) -> List[Path]:
+        """species_additions files targeting this species or evolving into it"""
+        return sorted(path for path in self.referrers(name) if path.parent == self.additions_dir)
+
+
+ZIP_DOS_TIME, ZIP_DOS_DATE = 0, (1 << 5) | 1  # every member stamped 1980-01-01 00:00
+ZIP_DEFLATE_LEVEL = 9
+ZIP_EXCLUDED_SUFFIXES = ('~', '.tmp', '.bak', '.orig', '.swp', '.edit-tmp', '.edit-bak')
+ZIP_EXCLUDED_NAMES = {'thumbs.db', 'desktop.ini'}
+
+
+def is_shipped_file(name: str) -> bool:
+    """False for files that must never end up in an exported pack: hidden files
+    (index cache, lang journal, temp files) plus editor backups and OS clutter"""
+    lower = name.lower()
+    return not (name.startswith(('.', '#')) or lower.endswith(ZIP_EXCLUDED_SUFFIXES)
+                or lower in ZIP_EXCLUDED_NAMES)
+
+
+class ZipMemberCache:
+    """Compressed zip members keyed by the sha256 of their content.
+
+    An unchanged file is copied into the next archive from the cache instead of
+    being recompressed. Files that don't shrink are stored; that decision is
+    cached too (empty .stored marker) so incompressible PNGs aren't retried."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def member(self, data: bytes):
+        """(method, crc32, payload) for a file's bytes"""
+        digest = hashlib.sha256(data).hexdigest()
+        crc = zlib.crc32(data)
+        deflated = self.cache_dir / f"{digest}.deflate"
+        stored = self.cache_dir / f"{digest}.stored"
+        if deflated.exists():
+            self.used.add(deflated.name)
+            self.hits += 1
+            return zipfile.ZIP_DEFLATED, crc, deflated.read_bytes()
+        if stored.exists():
+            self.used.add(stored.name)
+            self.hits += 1
+            return zipfile.ZIP_STORED, crc, data
+
+        self.misses += 1
+        compressor = zlib.compressobj(ZIP_DEFLATE_LEVEL, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if len(payload) < len(data):
+            target, method = deflated, zipfile.ZIP_DEFLATED
+        else:
+            target, method, payload = stored, zipfile.ZIP_STORED, data
+        temp = target.with_name(f".{target.name}.tmp")
+        temp.write_bytes(payload if method == zipfile.ZIP_DEFLATED else b"")
+        os.replace(temp, target)
+        self.used.add(target.name)
+        return method, crc, payload
+
+    def prune(self):
+        """Drop cached members no archive in this export used"""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name not in self.used:
+                os.unlink(entry.path)
+                removed += 1
+        return removed
+
+
+def write_deterministic_zip(dest: Path, root: Path, cache: ZipMemberCache) -> Dict:
+    """Zip every file under root (sorted paths, fixed timestamps, no extra fields)
+    into dest via a temp file. Identical inputs give a byte-identical archive.
+    Files is_shipped_file() rejects are left out and listed in "skipped"."""
+    names, skipped = [], []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        for filename in filenames:
+            name = Path(dirpath, filename).relative_to(root).as_posix()
+            (names if is_shipped_file(filename) else skipped).append(name)
+    names.sort()
+    if len(names) > 0xFFFF:
+        raise ValueError(f"{root.name} has {len(names)} files (zip limit is 65535)")
+
+    central = []
+    offset = 0
+    temp = dest.with_name(f".{dest.name}.tmp")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with open(temp, 'wb') as out:
+        for name in names:
+            data = (root / name).read_bytes()
+            method, crc, payload = cache.member(data)
+            if offset > 0xFFFFFFFF or len(data) > 0xFFFFFFFF:
+                raise ValueError(f"{root.name} is too large for a zip without zip64")
+            encoded = name.encode('utf-8')
+            fields = (20, 0x0800, method, ZIP_DOS_TIME, ZIP_DOS_DATE, crc, len(payload), len(data), len(encoded), 0)
+            out.write(struct.pack('<IHHHHHIIIHH', 0x04034B50, *fields))
+            out.write(encoded)
+            out.write(payload)
+            central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014B50, 3 << 8 | 20, *fields, 0, 0, 0,
+                                       0o100644 << 16, offset) + encoded)
+            offset += 30 + len(encoded) + len(payload)
+        directory = b"".join(central)
+        out.write(directory)
+        out.write(struct.pack('<IHHHHIIH', 0x06054B50, 0, 0, len(names), len(names),
+                              len(directory), offset, 0))
+    unchanged = dest.exists() and filecmp.cmp(temp, dest, shallow=False)
+    os.replace(temp, dest)
+    return {"files": len(names), "bytes": dest.stat().st_size, "unchanged": unchanged,
+            "skipped": sorted(skipped)}
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """What the last --manifest build produced, for incremental rebuilds.
+
+    Per species it records the hash of its inputs (config row, generator
+    version, JSON profile), the hash of its source assets and the output files
+    written from them. A species is rebuilt only if one of those changed or an
+    output went missing; species no longer listed get their outputs deleted.
+    Entries are grouped per manifest file so two manifests never delete each
+    other's species, and species created by hand are never touched."""
+
+    SCHEMA = 1
+
+    def __init__(self, state_file: Path, manifest_key: str, base_dir: Path):
+        self.state_file = state_file
+        self.manifest_key = manifest_key
+        self.base_dir = base_dir
+        self._state = {"schema": self.SCHEMA, "manifests": {}}
+        if state_file.exists():
+            try:
+                with open(state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get("schema") == self.SCHEMA:
+                    self._state = state
+            except (OSError, ValueError):
+                print(f"  WARNING: Unreadable {state_file.name} — rebuilding everything")
+        self.species = self._state["manifests"].setdefault(manifest_key, {})
+        self.force = False  # --rebuild: treat every species as changed
+
+    @staticmethod
+    def input_hash(config: Dict, profile: str) -> str:
+        blob = json.dumps([GENERATOR_VERSION, profile, config], sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def assets_hash(files: Dict[str, List[Path]]) -> Optional[str]:
+        """Hash of the source asset names + contents; None when there are none
+        (assets cleaned up after an earlier build count as unchanged)"""
+        assets = sorted(f for key in ['animations', 'models', 'textures'] for f in files[key])
+        if not assets:
+            return None
+        digest = hashlib.sha256()
+        for asset in assets:
+            digest.update(f"{asset.name}\0{file_sha256(asset)}\0".encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_dirty(self, name: str, inputs: str, assets: Optional[str]) -> bool:
+        record = self.species.get(name.lower())
+        if self.force or record is None or record["inputs"] != inputs:
+            return True
+        if assets is not None and assets != record["assets"]:
+            return True
+        return any(not (self.base_dir / output).exists() for output in record["outputs"])
+
+    def record(self, name: str, inputs: str, assets: Optional[str], outputs: List[Path]):
+        previous = self.species.get(name.lower(), {})
+        self.species[name.lower()] = {
+            "inputs": inputs,
+            "assets": assets if assets is not None else previous.get("assets"),
+            "outputs": sorted(p.relative_to(self.base_dir).as_posix() for p in outputs if p.exists()),
+        }
+
+    def removed(self, names: List[str]) -> List[str]:
+        """Species built from this manifest before that it no longer lists"""
+        current = {n.lower() for n in names}
+        return sorted(n for n in self.species if n not in current)
+
+    def outputs(self, name: str) -> List[Path]:
+        return [self.base_dir / output for output in self.species.get(name, {}).get("outputs", [])]
+
+    def forget(self, name: str):
+        self.species.pop(name, None)
+
+    def save(self):
+        temp = self.state_file.with_name(f".{self.state_file.name}.tmp")
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, indent=2, sort_keys=True)
+        os.replace(temp, self.state_file)
+
+
+class CobblemonPackGenerator:
+    """Generates separate Cobblemon resource and behavior packs"""
+
+    # Pack formats for 1.21.1
+    RESOURCE_PACK_FORMAT = 34  # Change to 40+ if needed for newer versions
+    DATA_PACK_FORMAT = 48  # Data pack format for 1.21.1
+
+    def __init__(self, downloads_path: str = None):
+        """Initialize the pack generator"""
+        if downloads_path is None:
+            downloads_path = str(Path.home() / "Downloads")
+
+        self.base_dir = Path(downloads_path) / "Mod-ResourceAndBehavior-Packs"
+
+        # Separate packs for easier distribution
+        self.resource_pack_dir = self.base_dir / "resource_pack"
+        self.behavior_pack_dir = self.base_dir / "behavior_pack"
+
+        # Expected file types
+        self.animation_extensions = ['.animation.json', '.animations.json']
+        self.model_extensions = ['.geo.json', '.json']
+        self.texture_extensions = ['.png', '.tga']
+
+        # Built on first use by pack_index(); the on-disk cache sits next to
+        # behavior_pack/ (hidden, so find_files_in_base_dir ignores it)
+        self._pack_index = None
+        self._pack_index_lock = threading.Lock()  # worker threads may ask for it first
+        self.index_cache_file = self.base_dir / ".pack_index_cache.sqlite"
+
+        # Lang changes are journaled and folded into en_us.json once per run
+        # (set defer_lang_compaction to leave that to --compact-lang)
+        self.lang_journal = LangJournal(
+            self.resource_pack_dir / "assets" / "cobblemon" / "lang" / "en_us.json",
+            self.base_dir / ".lang_journal.jsonl")
+        self.defer_lang_compaction = False
+
+        # What each --manifest build produced (see BuildManifest)
+        self.build_state_file = self.base_dir / ".build_manifest.json"
+
+        # JSON output profile ('dev' or 'release') and per-class size tally
+        self.json_profile = "dev"
+        self.json_report = {}  # file class -> [files, dev bytes, written bytes]
+        self._report_lock = threading.Lock()
+
+        # --optimize-png: recompress installed textures (create, batch, --editfiles, export)
+        self.optimize_pngs = False
+
+    @trace.traced()
+    def pack_index(self) -> PackIndex:
+        """The in-memory PackIndex, built once (one pass over the pack) and reused"""
+        if self._pack_index is None:
+            with self._pack_index_lock:
+                if self._pack_index is None:
+                    cache_file = self.index_cache_file if self.behavior_pack_dir.exists() else None
+                    self._pack_index = PackIndex.build(self.behavior_pack_dir, self.resource_pack_dir,
+                                                       cache_file=cache_file, lang_journal=self.lang_journal)
+        return self._pack_index
+
+    def _write_json(self, path: Path, data, file_class: str, source_bytes: Optional[int] = None, **overrides):
+        """Write one pack JSON file in the active profile (see JSON_PROFILES).
+
+        In the release profile floats are rounded and the bytes saved versus
+        dev output (or versus the copied source file, source_bytes) are tallied
+        per file class for print_json_report(). path is replaced, never written
+        in place."""
+        options = dict(JSON_PROFILES[self.json_profile])
+        options.update(overrides)
+        if self.json_profile == "release":
+            data = round_floats(data)
+        text = json.dumps(data, **options)
+        encoding = 'utf-8' if options.get('ensure_ascii') is False else None
+        # Write beside and swap in: path may be hard-linked to a user's source
+        # file (ingest_file), which an in-place write would change as well
+        temp = path.with_name(f".{path.name}.tmp")
+        try:
+            with open(temp, 'w', encoding=encoding) as f:
+                f.write(text)
+            os.replace(temp, path)
+        except BaseException:
+            if temp.exists():
+                temp.unlink()
+            raise
+        written = len(text.encode('utf-8'))
+        metrics.inc("json_files_written")
+        metrics.inc("json_bytes_written", written)
+
+        if self.json_profile == "release":
+            if source_bytes is None:
+                dev_options = dict(JSON_PROFILES["dev"])
+                dev_options.update(overrides)
+                source_bytes = len(json.dumps(data, **dev_options).encode('utf-8'))
+            with self._report_lock:
+                tally = self.json_report.setdefault(file_class, [0, 0, 0])
+                tally[0] += 1
+                tally[1] += source_bytes
+                tally[2] += written
+
+    def print_json_report(self):
+        """Bytes saved per file class by the release profile"""
+        if not self.json_report:
+            return
+        print(f"\n{'=' * 70}")
+        print("RELEASE PROFILE — JSON SIZE REPORT")
+        print(f"{'=' * 70}")
+        print(f"{'Class':<18} {'Files':>6} {'Before':>14} {'After':>14} {'Saved':>8}")
+        print("-" * 70)
+        totals = [0, 0, 0]
+        for file_class, (files, before, after) in sorted(self.json_report.items()):
+            saved = 100 * (before - after) / before if before else 0
+            print(f"{file_class:<18} {files:>6} {before:>14,} {after:>14,} {saved:>7.1f}%")
+            totals = [totals[0] + files, totals[1] + before, totals[2] + after]
+        saved = 100 * (totals[1] - totals[2]) / totals[1] if totals[1] else 0
+        print("-" * 70)
+        print(f"{'TOTAL':<18} {totals[0]:>6} {totals[1]:>14,} {totals[2]:>14,} {saved:>7.1f}%")
+        print(f"{'=' * 70}\n")
+
+    def _index_refresh(self, path: Path, data: Optional[Dict] = None):
+        """Keep an already-built index current after writing a file"""
+        if self._pack_index is not None:
+            self._pack_index.refresh(path, data)
+
+    def _index_forget(self, path: Path):
+        if self._pack_index is not None:
+            self._pack_index.forget(path)
+
+    def create_pack_mcmeta(self, pack_type: str) -> Dict:
+        """Create pack.mcmeta for resource or behavior pack
+
+        Note: Packs can only be combined into one folder if both formats match!
+        For 1.21.1: Resource = 34 (or 40+), Data = 48
+        """
+        if pack_type == 'resource':
+            return {
+                "pack": {
+                    "pack_format": self.RESOURCE_PACK_FORMAT,
+                    "description": "Cobblemon Custom Pokémon - Resource Pack"
+                }
+            }
+        else:  # behavior/data pack
+            return {
+                "pack": {
+                    "pack_format": self.DATA_PACK_FORMAT,
+                    "description": "Cobblemon Custom Pokémon - Data Pack"
+                }
+            }
+
+    @trace.traced()
+    def setup_directories(self, pokemon_name: str):
+        """Create directory structure for both packs"""
+        print(f"\nSetting up directory structure for {pokemon_name}...")
+
+        pokemon_lower = pokemon_name.lower()
+
+        # Resource pack directories
+        resource_dirs = [
+            self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "models" / pokemon_lower,
+            self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "animations" / pokemon_lower,
+            self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "posers",
+            self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "resolvers",
+            self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / pokemon_lower,
+            self.resource_pack_dir / "assets" / "cobblemon" / "lang",
+        ]
+
+        # Behavior pack (data pack) directories
+        behavior_dirs = [
+            self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom",
+            self.behavior_pack_dir / "data" / "cobblemon" / "species_features",
+            self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world",
+        ]
+
+        for directory in resource_dirs + behavior_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        print("[OK] Directory structure created!")
+
+    @trace.traced()
+    def find_files_in_base_dir(self, pokemon_name: Optional[str] = None) -> Dict[str, List[Path]]:
+        """Find the files for one species in the base directory (excludes Python scripts):
+        its <name>/ subfolder and <name>.* / <name>_shiny.* files. With no name, or no
+        such files, every loose file in the base directory is used (one drop = one species)."""
+        if pokemon_name is not None:
+            files = self.find_species_files().get(pokemon_name.lower())
+            if files is not None:
+                self.report_unused_files(files, pokemon_name)
+                return files
+        return self.find_files_in_dir(self.base_dir)
+
+    def report_unused_files(self, used: Dict[str, List[Path]], pokemon_name: Optional[str] = None):
+        """Say which loose asset files in the pack folder a grouped drop leaves
+        behind (named for another species, or not named for any): they are neither
+        used nor cleaned up. A WARNING if they'd fill a gap in pokemon_name's files;
+        no name = a --manifest batch (used: every row's files)."""
+        taken = {f for file_list in used.values() for f in file_list}
+        left = self.find_files_in_dir(self.base_dir) if self.base_dir.exists() else {}
+        left = {key: sorted(f for f in file_list if f not in taken)
+                for key, file_list in left.items() if key != 'other'}
+        names = sorted(f.name for file_list in left.values() for f in file_list)
+        if not names:
+            return
+        if pokemon_name is None:
+            print(f"NOTE: Left in the pack folder (no manifest row uses them): {', '.join(names)}")
+            return
+        name = pokemon_name.lower()
+        gaps = [key for key, file_list in left.items() if file_list and not used.get(key)]
+        if gaps:
+            print(f"WARNING: Not used for {name} (not named for it): {', '.join(names)}")
+            print(f"   Its files have no {' / '.join(gaps)} — rename these {name}.* "
+                  f"or move them into {name}/ to use them")
+        else:
+            print(f"NOTE: Left in the pack folder (not named {name}): {', '.join(names)}")
+
+    def find_species_files(self) -> Dict[str, Dict[str, List[Path]]]:
+        """Group the pack folder's assets by species in one os.scandir pass:
+        base_dir/<species>/* and base_dir/<species>.* (see asset_species).
+        The pack folders themselves and the --export-zip output are skipped."""
+        skip_dirs = {self.resource_pack_dir.name, self.behavior_pack_dir.name, "dist"}
+        groups = {}
+
+        def add(species: str, entry: os.DirEntry):
+            if entry.name.startswith('.') or entry.name.endswith('.py') or not entry.is_file():
+                return
+            group = groups.setdefault(species, {'animations': [], 'models': [], 'textures': [], 'other': []})
+            group[self.classify_file(entry.name)].append(Path(entry.path))
+
+        try:
+            entries = list(os.scandir(self.base_dir))
+        except FileNotFoundError:
+            print(f"WARNING: Base directory not found: {self.base_dir}")
+            return groups
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name.startswith('.') or entry.name in skip_dirs:
+                    continue
+                with os.scandir(entry.path) as folder:
+                    for sub in folder:
+                        add(entry.name.lower(), sub)
+            else:
+                add(asset_species(entry.name), entry)
+
+        for group in groups.values():
+            for file_list in group.values():
+                file_list.sort()
+        return groups
+
+    def find_files_in_dir(self, directory: Path) -> Dict[str, List[Path]]:
+        """Find all relevant files in one directory (excludes Python scripts)"""
+        files = {
+            'animations': [],
+            'models': [],
+            'textures': [],
+            'other': []
+        }
+
+        if not directory.exists():
+            print(f"WARNING: Base directory not found: {directory}")
+            return files
+
+        for file in directory.iterdir():
+            # Skip directories, Python files, and hidden files
+            if not file.is_file():
+                continue
+            if file.suffix == '.py':
+                continue
+            if file.name.startswith('.'):
+                continue
+            files[self.classify_file(file.name)].append(file)
+
+        return files
+
+    def classify_file(self, filename: str) -> str:
+        """'animations', 'models', 'textures' or 'other' for an asset file name"""
+        # Check animations
+        if any(filename.endswith(ext) for ext in self.animation_extensions):
+            return 'animations'
+        # Check models
+        if any(filename.endswith(ext) for ext in self.model_extensions):
+            if 'geo' in filename.lower() or 'model' in filename.lower():
+                return 'models'
+            return 'other'
+        # Check textures
+        if any(filename.endswith(ext) for ext in self.texture_extensions):
+            return 'textures'
+        return 'other'
+
+    def create_species_json(self, pokemon_name: str, config: Dict) -> Dict:
+        """Create species definition with customization options"""
+        return templates.create_species_json(pokemon_name, config)
+
+    def _build_evolutions(self, pokemon_lower: str, config: Dict) -> list:
+        """Build evolutions list from config"""
+        return templates.build_evolutions(pokemon_lower, config)
+
+    def create_poser_json(self, pokemon_name: str, config: Dict) -> Dict:
+        """Create poser configuration"""
+        return templates.create_poser_json(pokemon_name, config)
+
+    def create_resolver_json(self, pokemon_name: str) -> Dict:
+        """Create model resolver with correct texture paths"""
+        return templates.create_resolver_json(pokemon_name)
+
+    def create_spawn_pool_json(self, pokemon_name: str, config: Dict) -> Dict:
+        """Create spawn pool configuration"""
+        return templates.create_spawn_pool_json(pokemon_name, config)
+
+    @trace.traced()
+    def validate_animations(self, anim_file: Path, pokemon_name: str):
+        """Validate animation file has required animations"""
+        try:
+            with open(anim_file, 'r') as f:
+                anim_data = json.load(f)
+
+            required_anims = ['ground_idle', 'ground_walk']
+            found_anims = []
+
+            if 'animations' in anim_data:
+                for anim_key in anim_data['animations'].keys():
+                    # Extract animation name from key like "animation.pokemon.ground_idle"
+                    if '.' in anim_key:
+                        anim_name = anim_key.split('.')[-1]
+                        found_anims.append(anim_name)
+
+            missing = [anim for anim in required_anims if anim not in found_anims]
+
+            if missing:
+                print(f"\nWARNING: Missing recommended animations: {', '.join(missing)}")
+                print(f"   Your Pokémon may not animate properly!")
+                print(f"   Add these animations in Blockbench:")
+                for anim in missing:
+                    print(f"   - animation.{pokemon_name}.{anim}")
+            else:
+                print(f"  [OK] Animation validation passed")
+
+        except Exception as e:
+            print(f"  WARNING: Could not validate animations: {e}")
+
+    def is_cleanup_safe(self, file: Path) -> bool:
+        """True if cleanup_source_files may delete this file (never .py or outside base_dir)"""
+        return file.suffix != '.py' and str(file).startswith(str(self.base_dir))
+
+    def ingest_file(self, src: Path, dest: Path, consume: bool = False) -> str:
+        """Put src at dest as cheaply as possible; returns the strategy used.
+
+        consume=True means src will be cleaned up once the species is generated,
+        so it may be hard-linked into place (O(1), same filesystem). src itself
+        stays in the pack folder until cleanup_source_files, so a run that fails
+        before then leaves the user's files where they were. Otherwise (or when
+        linking isn't possible) a reflink (copy-on-write clone) or a real copy is
+        used. Files cleanup would refuse to delete are never consumed. A linked
+        dest shares src's bytes, so pack files are only ever replaced (_write_json,
+        os.replace), never rewritten in place."""
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()  # may be a link to src left by a failed run: never write through it
+        if consume and self.is_cleanup_safe(src):
+            try:
+                os.link(src, dest)
+                return "hardlinked"
+            except OSError:
+                pass
+        if reflink_file(src, dest):
+            return "reflinked"
+        shutil.copy2(src, dest)
+        return "copied"
+
+    @trace.traced()
+    def organize_files(self, pokemon_name: str, files: Dict[str, List[Path]], consume: bool = False,
+                       converted: Optional[Dict[Path, Path]] = None):
+        """Organize files into resource pack (consume=True: sources will be cleaned up, so link them).
+        TGA textures are converted to PNG; converted maps sources already converted by
+        convert_tga_sources() to their scratch PNGs."""
+        print(f"\nOrganizing files for {pokemon_name}...")
+
+        pokemon_lower = pokemon_name.lower()
+        strategies = {}
+
+        def ingest(src: Path, dest: Path):
+            strategy = self.ingest_file(src, dest, consume)
+            strategies[strategy] = strategies.get(strategy, 0) + 1
+
+        def ingest_texture(src: Path, dest: Path) -> bool:
+            """ingest(), except that TGA data is converted to PNG on the way in"""
+            if converted and src in converted:
+                os.replace(converted[src], dest)
+            elif is_tga_texture(src):
+                try:
+                    convert_tga_to_png(src, dest)
+                except (OSError, ValueError) as e:
+                    print(f"  ERROR: Could not convert {src.name} to PNG: {e}")
+                    return False
+            else:
+                ingest(src, dest)
+                metrics.inc("textures_ingested")
+                return True
+            strategies['converted from TGA'] = strategies.get('converted from TGA', 0) + 1
+            metrics.inc("textures_ingested")
+            metrics.inc("textures_converted")
+            return True
+
+        # Validate animation file if present
+        if files['animations']:
+            self.validate_animations(files['animations'][0], pokemon_lower)
+
+        trace.step("animations")
+        # Copy animations
+        if files['animations']:
+            dest_dir = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "animations" / pokemon_lower
+            for anim_file in files['animations']:
+                dest_file = dest_dir / f"{pokemon_lower}.animation.json"  # Use .animation.json NOT _animation.json
+                metrics.inc("animation_bytes_processed", anim_file.stat().st_size)
+                if self.json_profile == "release":
+                    with open(anim_file, 'r') as f:
+                        self._write_json(dest_file, json.load(f), 'animation',
+                                         source_bytes=anim_file.stat().st_size)
+                else:
+                    ingest(anim_file, dest_file)
+                print(f"  [OK] Animation: {anim_file.name} → {dest_file.relative_to(self.resource_pack_dir)}")
+
+        trace.step("models")
+        # Copy models and fix identifier
+        if files['models']:
+            dest_dir = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "models" / pokemon_lower
+            for model_file in files['models']:
+                dest_file = dest_dir / f"{pokemon_lower}.geo.json"  # Use .geo.json NOT _geo.json
+                metrics.inc("model_bytes_processed", model_file.stat().st_size)
+                new_id = f"geometry.{pokemon_lower}"
+
+                # Fast path: patch just the identifier tokens, copy everything else as-is
+                # (release profile re-serializes the whole model anyway)
+                if self.json_profile == "dev":
+                    fixed = rewrite_geometry_identifiers(model_file, dest_file, lambda _old: new_id,
+                                                         copy_unchanged=False)
+                    if fixed is not None:
+                        if all(old_id == new_id for old_id, _new in fixed):
+                            ingest(model_file, dest_file)  # already correct: no rewrite needed
+                        for old_id, _new in fixed:
+                            if old_id != new_id:
+                                print(f"  NOTE: Fixed model identifier: {old_id} → {new_id}")
+                        print(f"  [OK] Model: {model_file.name} → {dest_file.relative_to(self.resource_pack_dir)}")
+                        continue
+
+                # Read model and fix identifier if needed
+                with open(model_file, 'r') as f:
+                    model_data = json.load(f)
+
+                # Fix the identifier to match Cobblemon's requirements
+                if 'minecraft:geometry' in model_data:
+                    for geom in model_data['minecraft:geometry']:
+                        if 'description' in geom and 'identifier' in geom['description']:
+                            old_id = geom['description']['identifier']
+                            geom['description']['identifier'] = new_id
+                            if old_id != new_id:
+                                print(f"  NOTE: Fixed model identifier: {old_id} → {new_id}")
+
+                # Write fixed model
+                self._write_json(dest_file, model_data, 'model', source_bytes=model_file.stat().st_size)
+
+                print(f"  [OK] Model: {model_file.name} → {dest_file.relative_to(self.resource_pack_dir)}")
+
+        trace.step("textures")
+        # Copy textures (detect shiny by filename rather than by directory order)
+        if files['textures']:
+            dest_dir = self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / pokemon_lower
+            shiny_files = [t for t in files['textures'] if 'shiny' in t.name.lower()]
+            normal_files = [t for t in files['textures'] if 'shiny' not in t.name.lower()]
+
+            # Fallback so the Pokémon always gets a base texture
+            if not normal_files:
+                normal_files = shiny_files
+
+            copied = set()
+
+            # Base (non-shiny) texture
+            base_src = normal_files[0]
+            base_dest = dest_dir / f"{pokemon_lower}.png"
+            if ingest_texture(base_src, base_dest):
+                print(f"  [OK] Texture: {base_src.name} → {base_dest.relative_to(self.resource_pack_dir)}")
+            copied.add(base_src)
+
+            # Shiny texture (only if a distinct shiny file exists)
+            if shiny_files and shiny_files[0] not in copied:
+                shiny_dest = dest_dir / f"{pokemon_lower}_shiny.png"
+                if ingest_texture(shiny_files[0], shiny_dest):
+                    print(f"  [OK] Texture: {shiny_files[0].name} → {shiny_dest.relative_to(self.resource_pack_dir)}")
+                copied.add(shiny_files[0])
+
+            # Any remaining textures keep their original names (.tga becomes .png)
+            for texture_file in files['textures']:
+                if texture_file in copied:
+                    continue
+                dest_name = f"{texture_file.stem}.png" if texture_file.suffix.lower() == '.tga' else texture_file.name
+                dest_file = dest_dir / dest_name
+                if ingest_texture(texture_file, dest_file):
+                    print(f"  [OK] Texture: {texture_file.name} → {dest_file.relative_to(self.resource_pack_dir)}")
+
+        if strategies:
+            print(f"  NOTE: Ingest: {', '.join(f'{n} {how}' for how, n in sorted(strategies.items()))}")
+
+        trace.step("texture_check")
+        # Header-only sanity check of what was just installed (format, size vs model)
+        if files['textures']:
+            for level, message in self.texture_issues(pokemon_name)[1]:
+                if level != "NOTE":
+                    print(f"  {level}: {message}")
+        print("[OK] Files organized!")
+
+    @trace.traced()
+    def generate_pack_files(self, pokemon_name: str, config: Dict):
+        """Generate all pack configuration files"""
+        print(f"\n  Generating configuration files for {pokemon_name}...")
+
+        self.write_pack_mcmeta()
+        self.write_species_files(pokemon_name, config)
+        self.add_lang_entries(self.create_lang_entries(pokemon_name, config))
+
+        print("[OK] Configuration files generated!")
+
+    def write_pack_mcmeta(self):
+        """Create both pack.mcmeta files (existing ones are kept)"""
+        # Resource pack.mcmeta (create if doesn't exist)
+        resource_mcmeta = self.resource_pack_dir / "pack.mcmeta"
+        if not resource_mcmeta.exists():
+            self._write_json(resource_mcmeta, self.create_pack_mcmeta('resource'), 'mcmeta')
+            print(f"  [OK] Resource pack.mcmeta created (format {self.RESOURCE_PACK_FORMAT})")
+        else:
+            print(f"  NOTE: Resource pack.mcmeta already exists (keeping existing)")
+
+        # Behavior pack.mcmeta (create if doesn't exist)
+        behavior_mcmeta = self.behavior_pack_dir / "pack.mcmeta"
+        if not behavior_mcmeta.exists():
+            self._write_json(behavior_mcmeta, self.create_pack_mcmeta('behavior'), 'mcmeta')
+            print(f"  [OK] Behavior pack.mcmeta created (format {self.DATA_PACK_FORMAT})")
+        else:
+            print(f"  NOTE: Behavior pack.mcmeta already exists (keeping existing)")
+
+    @trace.traced()
+    def write_species_files(self, pokemon_name: str, config: Dict):
+        """Write the per-species files: species, poser, resolver, spawn pool"""
+        pokemon_lower = pokemon_name.lower()
+
+        # Species definition
+        species_file = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{pokemon_lower}.json"
+        if config.get('abilities'):
+            print(f"  NOTE: Abilities configured: {[a.strip() for a in config['abilities'].split(',')]}")
+        else:
+            print(f"  WARNING: No abilities specified! Pokémon will fail to spawn!")
+            print(f"     Use --abilities to add abilities (e.g., --abilities \"blaze,h:solar_power\")")
+        species_data = self.create_species_json(pokemon_name, config)
+        self._write_json(species_file, species_data, 'species')
+        self._index_refresh(species_file, species_data)
+        print(f"  [OK] Species definition")
+
+        # Poser
+        poser_file = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "posers" / f"{pokemon_lower}.json"
+        self._write_json(poser_file, self.create_poser_json(pokemon_name, config), 'poser')
+        print(f"  [OK] Poser configuration")
+
+        # Resolver
+        resolver_file = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "resolvers" / f"0_{pokemon_lower}_base.json"
+        self._write_json(resolver_file, self.create_resolver_json(pokemon_name), 'resolver')
+        print(f"  [OK] Model resolver")
+
+        # Spawn pool
+        spawn_file = self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" / f"{pokemon_lower}.json"
+        spawn_data = self.create_spawn_pool_json(pokemon_name, config)
+        self._write_json(spawn_file, spawn_data, 'spawn')
+        self._index_refresh(spawn_file, spawn_data)
+        print(f"  [OK] Spawn pool")
+        metrics.inc("species_generated")
+
+    def create_lang_entries(self, pokemon_name: str, config: Dict) -> Dict:
+        """Create the name/desc1/desc2 lang keys for one species"""
+        return templates.create_lang_entries(pokemon_name, config)
+
+    @trace.traced()
+    def add_lang_entries(self, new_lang_data: Dict):
+        """Language file - journal the keys; compact_lang() merges them into en_us.json"""
+        self.lang_journal.set(new_lang_data)
+        print(f"  [OK] Language entries queued ({len(new_lang_data)} keys)")
+
+    @trace.traced()
+    def compact_lang(self, force: bool = False):
+        """Fold journaled lang changes into en_us.json (once per run, or on demand).
+        Skipped when defer_lang_compaction is set, unless force=True."""
+        if self.defer_lang_compaction and not force:
+            if self.lang_journal.pending():
+                print(f"  NOTE: Lang changes journaled — run --compact-lang to write en_us.json")
+            return
+        try:
+            with metrics.timed("lang_merge_seconds"):
+                count = self.lang_journal.compact(
+                    lambda path, data: self._write_json(path, data, 'lang', sort_keys=True, ensure_ascii=False))
+        except Exception as e:
+            print(f"  WARNING: Could not update language file: {e}")
+            print(f"     Changes are kept in {self.lang_journal.journal_file.name}; retry with --compact-lang")
+            return
+        if count is not None:
+            metrics.inc("lang_merges")
+            print(f"  [OK] Language file updated ({count} keys, merged with existing)")
+
+    @trace.traced()
+    def export_zip(self, out_dir: Optional[Path] = None) -> bool:
+        """Build resource_pack.zip and behavior_pack.zip for distribution.
+        Members are compressed once and reused from .zip_cache/ while unchanged."""
+        out_dir = Path(out_dir) if out_dir else self.base_dir / "dist"
+        print(f"\n{'=' * 70}")
+        print(f"Exporting packs to {out_dir}")
+        print(f"{'=' * 70}")
+
+        if self.lang_journal.pending():
+            self.compact_lang(force=True)
+
+        if self.optimize_pngs:
+            self.optimize_species_textures(self.texture_species(), prune=True)
+
+        cache = ZipMemberCache(self.base_dir / ".zip_cache")
+        exported = 0
+        for pack_dir in (self.resource_pack_dir, self.behavior_pack_dir):
+            if not pack_dir.exists():
+                print(f"  WARNING: {pack_dir.name} not found — skipped")
+                continue
+            dest = out_dir / f"{pack_dir.name}.zip"
+            try:
+                result = write_deterministic_zip(dest, pack_dir, cache)
+            except (OSError, ValueError) as e:
+                print(f"  ERROR: Could not export {dest.name}: {e}")
+                return False
+            state = "unchanged" if result['unchanged'] else "written"
+            print(f"  [OK] {dest.name}: {result['files']} files, {result['bytes']:,} bytes ({state})")
+            if result['skipped']:
+                shown = result['skipped'][:5]
+                print(f"  NOTE: Left out of {dest.name}: {', '.join(shown)}"
+                      + (f" and {len(result['skipped']) - len(shown)} more" if len(result['skipped']) > 5 else ""))
+            exported += 1
+
+        if not exported:
+            print("ERROR: Nothing to export — create a Pokémon first")
+            return False
+        pruned = cache.prune()
+        metrics.inc("cache_hits", cache.hits, cache="zip")
+        metrics.inc("cache_misses", cache.misses, cache="zip")
+        print(f"  NOTE: {cache.hits} member(s) reused from cache, {cache.misses} compressed"
+              + (f", {pruned} stale cache entries removed" if pruned else ""))
+        return True
+
+    @trace.traced()
+    def cleanup_source_files(self, files: Dict[str, List[Path]]):
+        """Remove source files after copying (NEVER deletes .py files or files outside base_dir)"""
+        print("\nCleaning up source files...")
+
+        files_to_remove = []
+        for file_list in files.values():
+            files_to_remove.extend(file_list)
+
+        for file in files_to_remove:
+            # Safety checks - NEVER delete:
+            # 1. Python files
+            # 2. Files outside the base directory
+            # 3. The script itself
+            if file.suffix == '.py':
+                print(f"  WARNING: Skipped (Python file): {file.name}")
+                continue
+
+            if not str(file).startswith(str(self.base_dir)):
+                print(f"  WARNING: Skipped (outside base directory): {file.name}")
+                continue
+
+            if file.exists():
+                file.unlink()
+                print(f"  [OK] Removed: {file.name}")
+
+        # Per-species drop folders (<base_dir>/<name>/) go once they're empty
+        for folder in sorted({f.parent for f in files_to_remove if f.parent.parent == self.base_dir}):
+            try:
+                folder.rmdir()
+                print(f"  [OK] Removed folder: {folder.name}/")
+            except OSError:
+                pass
+
+        print("[OK] Cleanup complete!")
+
+    def texture_issues(self, pokemon_name: str) -> tuple:
+        """(textures checked, [(level, message)]) for one species' installed textures,
+        from file headers only, cross-checked against its model's texture_width/height"""
+        pokemon_lower = pokemon_name.lower()
+        tex_dir = self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / pokemon_lower
+        model = (self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" /
+                 "models" / pokemon_lower / f"{pokemon_lower}.geo.json")
+        issues = []
+        if not tex_dir.is_dir():
+            return 0, [("ERROR", "no texture folder")]
+        textures = sorted(Path(entry.path) for entry in os.scandir(tex_dir) if entry.is_file())
+        if not textures:
+            return 0, [("ERROR", "no textures")]
+
+        expected = None
+        if model.exists():
+            try:
+                expected = model_texture_size(model)
+            except OSError as e:
+                issues.append(("WARNING", f"could not read {model.name}: {e}"))
+
+        sizes = {}
+        for texture in textures:
+            try:
+                info = inspect_texture(texture)
+            except OSError as e:
+                issues.append(("ERROR", f"{texture.name}: unreadable ({e})"))
+                continue
+            if info['format'] is None:
+                issues.append(("ERROR", f"{texture.name}: not a PNG or TGA image"))
+                continue
+            if info['format'] != 'png':
+                issues.append(("ERROR", f"{texture.name}: {info['format'].upper()} data — Minecraft only loads PNG, "
+                                        f"re-export as PNG"))
+            elif texture.suffix.lower() != '.png':
+                issues.append(("WARNING", f"{texture.name}: PNG data with a {texture.suffix} extension"))
+            size = (info['width'], info['height'])
+            sizes[texture.name] = size
+            if expected and size != expected:
+                scale = size[0] // expected[0]
+                if scale > 1 and size == (expected[0] * scale, expected[1] * scale):
+                    issues.append(("NOTE", f"{texture.name}: {size[0]}x{size[1]} is the model's "
+                                           f"{expected[0]}x{expected[1]} scaled x{scale}"))
+                else:
+                    issues.append(("ERROR", f"{texture.name}: {size[0]}x{size[1]} but the model expects "
+                                            f"{expected[0]}x{expected[1]} (texture_width/texture_height)"))
+
+        base, shiny = f"{pokemon_lower}.png", f"{pokemon_lower}_shiny.png"
+        if base in sizes and shiny in sizes and sizes[base] != sizes[shiny]:
+            issues.append(("WARNING", f"{shiny} is {sizes[shiny][0]}x{sizes[shiny][1]}, "
+                                      f"{base} is {sizes[base][0]}x{sizes[base][1]}"))
+        return len(textures), issues
+
+    def validate_textures(self, workers: Optional[int] = None) -> bool:
+        """Check every species' textures (headers only) on a thread pool (--check-textures)"""
+        print(f"\n{'=' * 70}")
+        print("TEXTURE CHECK")
+        print(f"{'=' * 70}\n")
+        names = sorted(record['name'] for record in self.pack_index().species.values())
+        if not names:
+            print("ERROR: No Pokémon found in packs!")
+            return False
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self.texture_issues, names))
+        elapsed = time.perf_counter() - start
+
+        checked = errors = warnings = 0
+        for name, (count, issues) in zip(names, results):
+            checked += count
+            for level, message in issues:
+                print(f"  {level}: {name}: {message}")
+                errors += level == "ERROR"
+                warnings += level == "WARNING"
+        print(f"\n{'[OK]' if not errors else 'ERROR:'} {checked} texture(s) across {len(names)} Pokémon "
+              f"checked in {elapsed:.2f}s: {errors} error(s), {warnings} warning(s)")
+        return errors == 0
+
+    def _check_species_assets(self, name: str, model_files: Dict[str, Path]) -> List[tuple]:
+        """Pack-checker worker for one species: resolver, poser, model, animations and
+        textures. Returns [(level, message)]."""
+        bedrock = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+        issues = []
+
+        def load(path: Path, label: str):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                issues.append(("ERROR", f"{label} {path.name} is not valid JSON: {e}"))
+                return None
+
+        # Resolver → poser / model / texture references
+        posers, textures = {name}, []
+        resolver_file = bedrock / "resolvers" / f"0_{name}_base.json"
+        if not resolver_file.exists():
+            issues.append(("ERROR", f"missing resolver resolvers/{resolver_file.name}"))
+        else:
+            resolver = load(resolver_file, "resolver")
+            if resolver is not None:
+                if resolver.get('species') != f"cobblemon:{name}":
+                    issues.append(("ERROR", f"resolver species is '{resolver.get('species')}', "
+                                            f"expected 'cobblemon:{name}'"))
+                variations = resolver.get('variations') or []
+                if not variations:
+                    issues.append(("ERROR", "resolver has no variations"))
+                for i, variation in enumerate(variations, 1):
+                    poser = str(variation.get('poser', '')).split(':')[-1]
+                    model = str(variation.get('model', '')).split(':')[-1]
+                    texture = str(variation.get('texture', ''))
+                    posers.add(poser)
+                    if model.endswith('.geo') and f"{model}.json" not in model_files:
+                        issues.append(("ERROR", f"resolver variation {i}: model '{model}' not found "
+                                                f"(no {model}.json under models/)"))
+                    path = texture.split(':', 1)[-1]
+                    if not path.startswith('textures/') or not path.endswith('.png'):
+                        issues.append(("ERROR", f"resolver variation {i}: texture '{texture}' should look like "
+                                                f"'cobblemon:textures/pokemon/{name}/{name}.png'"))
+                    else:
+                        textures.append((i, texture, self.resource_pack_dir / "assets" / "cobblemon" / path,
+                                         variation.get('aspects') or []))
+        for i, texture, path, aspects in textures:
+            if not path.exists():
+                if aspects:  # e.g. the shiny variant: only that variant renders untextured
+                    issues.append(("WARNING", f"resolver variation {i} ({', '.join(map(str, aspects))}): "
+                                              f"texture file missing for '{texture}'"))
+                else:
+                    issues.append(("ERROR", f"resolver variation {i}: texture file missing for '{texture}'"))
+
+        # Animations: every key must carry the animation.<name>. prefix
+        animation_keys = {}
+        anim_dir = bedrock / "animations" / name
+        anim_files = sorted(anim_dir.glob("*.json")) if anim_dir.is_dir() else []
+        if not anim_files:
+            issues.append(("ERROR", f"no animation file in animations/{name}/"))
+        for anim_file in anim_files:
+            anim_data = load(anim_file, "animation")
+            if anim_data is None:
+                continue
+            keys = list((anim_data.get('animations') or {}).keys())
+            animation_keys.update(dict.fromkeys(keys))
+            bad = [k for k in keys if not k.startswith(f"animation.{name}.")]
+            if bad:
+                issues.append(("ERROR", f"{anim_file.name}: {len(bad)} animation key(s) without the "
+                                        f"'animation.{name}.' prefix (e.g. {bad[0]})"))
+
+        # Poser(s): exist, and every bedrock(group, anim) resolves to an animation key
+        for poser in sorted(posers):
+            poser_file = bedrock / "posers" / f"{poser}.json"
+            if not poser_file.exists():
+                issues.append(("ERROR", f"missing poser posers/{poser_file.name}"))
+                continue
+            poser_data = load(poser_file, "poser")
+            if poser_data is None or not animation_keys:
+                continue
+            missing = sorted({f"animation.{g}.{a}" for g, a in poser_animation_refs(poser_data)
+                              if g == name and f"animation.{g}.{a}" not in animation_keys})
+            if missing:
+                issues.append(("WARNING", f"poser {poser_file.name} uses animations the animation file doesn't "
+                                          f"define: {', '.join(missing)}"))
+
+        # Model: present with the matching geometry identifier
+        model_file = model_files.get(f"{name}.geo.json")
+        if model_file is None:
+            issues.append(("ERROR", f"missing model models/{name}/{name}.geo.json"))
+        else:
+            try:
+                with open(model_file, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                spans = scan_geometry_identifiers(text)
+                identifiers = ([value for _s, _e, value in spans] if spans is not None else
+                               [g.get('description', {}).get('identifier')
+                                for g in json.loads(text).get('minecraft:geometry', [])])
+                if f"geometry.{name}" not in identifiers:
+                    issues.append(("ERROR", f"model identifier is {', '.join(map(str, identifiers)) or 'missing'}, "
+                                            f"expected geometry.{name}"))
+            except (OSError, ValueError) as e:
+                issues.append(("ERROR", f"model {model_file.name} is not valid JSON: {e}"))
+
+        # Textures: real PNGs, sizes matching the model (header-only)
+        issues.extend(issue for issue in self.texture_issues(name)[1]
+                      if issue[1] not in ("no textures", "no texture folder"))
+        return issues
+
+    def check_pack(self, workers: Optional[int] = None) -> bool:
+        """Validate the whole pack in one indexed pass (--check). Per-species asset
+        checks run on a thread pool; cross-references (evolutions, preEvolution,
+        spawn pools, lang keys) come from the PackIndex. True if no errors."""
+        print(f"\n{'=' * 70}")
+        print("PACK CHECK")
+        print(f"{'=' * 70}\n")
+        start = time.perf_counter()
+        index = self.pack_index()
+        if not index.species and not index.errors:
+            print("ERROR: No Pokémon found in packs!")
+            return False
+
+        report = self.pack_issues(workers)
+        elapsed = time.perf_counter() - start
+
+        errors = warnings = 0
+        for label, issues in sorted(report.items()):
+            for level, message in issues:
+                print(f"  {level}: {label}: {message}")
+                errors += level == "ERROR"
+                warnings += level == "WARNING"
+        print(f"\n{'[OK]' if not errors else 'ERROR:'} {len(index.species)} Pokémon checked in {elapsed:.2f}s: "
+              f"{errors} error(s), {warnings} warning(s)")
+        return errors == 0
+
+    @trace.traced()
+    def pack_issues(self, workers: Optional[int] = None) -> Dict[str, List[tuple]]:
+        """{file or species: [(level, message)]} for the whole pack (what --check reports)"""
+        index = self.pack_index()
+        model_files = {}
+        models_dir = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon" / "models"
+        for dirpath, _dirnames, filenames in os.walk(models_dir):
+            for filename in filenames:
+                model_files.setdefault(filename, Path(dirpath, filename))
+
+        records = sorted(index.species.values(), key=lambda r: r['file'])
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            asset_issues = list(pool.map(lambda r: self._check_species_assets(r['file'].stem, model_files), records))
+
+        report = {}  # label -> [(level, message)]
+        for path, error in sorted(index.errors.items()):
+            report.setdefault(path.name, []).append(("ERROR", f"unreadable: {error}"))
+        known = set(index.species)
+        lang = index.lang
+        for record, issues in zip(records, asset_issues):
+            name = record['file'].stem
+            issues = list(issues)
+            for evolution in record['evolutions']:
+                target = evolution_target(evolution['result'])
+                if target not in known:
+                    issues.append(("WARNING", f"evolution '{evolution['id']}' → '{target}' is not a species in this "
+                                              f"pack (fine if it's a built-in Cobblemon species)"))
+            pre = record['pre_evolution']
+            if pre and str(pre).split(':')[-1] not in known:
+                issues.append(("WARNING", f"preEvolution '{pre}' is not a species in this pack "
+                                          f"(fine if it's a built-in Cobblemon species)"))
+            if not index.spawn_files_for(name):
+                issues.append(("WARNING", "no spawn pool entry (it will never spawn naturally)"))
+            missing_lang = [key for key in ("name", "desc1", "desc2")
+                            if f"cobblemon.species.{name}.{key}" not in lang]
+            if missing_lang:
+                issues.append(("ERROR" if "name" in missing_lang else "WARNING",
+                               f"missing lang key(s): {', '.join(f'cobblemon.species.{name}.{k}' for k in missing_lang)}"))
+            if issues:
+                report[name] = issues
+        for spawn_file, names in sorted(index.spawns.items()):
+            for i, target in enumerate(names, 1):
+                if target not in known:
+                    report.setdefault(spawn_file.name, []).append(
+                        ("WARNING", f"spawn #{i}: pokemon '{target}' is not a species in this pack"))
+        return report
+
+    @trace.traced()
+    def show_current_pokemon(self):
+        """Display all Pokémon currently in the packs"""
+        print(f"\n{'=' * 70}")
+        print("CURRENT POKÉMON IN PACKS")
+        print(f"{'=' * 70}\n")
+
+        # Check if packs exist
+        species_dir = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+
+        if not species_dir.exists():
+            print("ERROR: No packs found!")
+            print(f"   Location checked: {species_dir}")
+            print("\nTIP: Generate your first Pokémon to create the packs!")
+            return
+
+        # Indexed species (one pass over the pack, no per-file re-parsing here)
+        index = self.pack_index()
+        species_errors = sorted(path for path in index.errors if path.parent == index.species_dir)
+
+        if not index.species and not species_errors:
+            print("ERROR: No Pokémon found in packs!")
+            print(f"   Location: {species_dir}")
+            return
+
+        print(f"Found {len(index.species) + len(species_errors)} Pokémon:\n")
+
+        # Display each Pokémon
+        pokemon_list = []
+        for record in sorted(index.species.values(), key=lambda r: r['file']):
+            stats = record['base_stats']
+            hp = stats.get('hp', 0)
+            atk = stats.get('attack', 0)
+            defe = stats.get('defence', 0)
+            spatk = stats.get('special_attack', 0)
+            spdef = stats.get('special_defence', 0)
+            speed = stats.get('speed', 0)
+
+            pokemon_list.append({
+                'name': record['name'].capitalize(),
+                'number': record['number'],
+                'primary_type': record['primary_type'].upper(),
+                'secondary_type': record['secondary_type'],
+                'total': hp + atk + defe + spatk + spdef + speed,
+                'hp': hp,
+                'atk': atk,
+                'def': defe,
+                'spatk': spatk,
+                'spdef': spdef,
+                'speed': speed,
+                'legendary': 'legendary' in record['labels'],
+                'catch_rate': record['catch_rate']
+            })
+
+        for path in species_errors:
+            print(f"WARNING: Error reading {path.name}: {index.errors[path]}")
+
+        # Display in table format
+        print(f"{'#':<6} {'Name':<15} {'Type':<20} {'BST':<6} {'Legendary':<10} {'Catch':<6}")
+        print("-" * 70)
+
+        for p in sorted(pokemon_list, key=lambda x: x['number']):
+            type_str = p['primary_type']
+            if p['secondary_type']:
+                type_str += f"/{p['secondary_type'].upper()}"
+
+            legendary_mark = "YES" if p['legendary'] else "No"
+
+            print(
+                f"#{p['number']:<5} {p['name']:<15} {type_str:<20} {p['total']:<6} {legendary_mark:<10} {p['catch_rate']:<6}")
+
+        # Summary stats
+        print("\n" + "=" * 70)
+        print(f"SUMMARY:")
+        print(f"   Total Pokémon: {len(pokemon_list)}")
+        legendary_count = sum(1 for p in pokemon_list if p['legendary'])
+        print(f"   Legendary: {legendary_count}")
+        print(f"   Regular: {len(pokemon_list) - legendary_count}")
+
+        # Average BST
+        avg_bst = sum(p['total'] for p in pokemon_list) // len(pokemon_list) if pokemon_list else 0
+        print(f"   Average BST: {avg_bst}")
+
+        # Type distribution
+        type_counts = {}
+        for p in pokemon_list:
+            primary = p['primary_type']
+            type_counts[primary] = type_counts.get(primary, 0) + 1
+            if p['secondary_type']:
+                secondary = p['secondary_type'].upper()
+                type_counts[secondary] = type_counts.get(secondary, 0) + 1
+
+        print(f"\n   Type Distribution:")
+        for ptype, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
+            print(f"      {ptype}: {count}")
+
+        print(f"\n{'=' * 70}")
+        print(f"Pack Locations:")
+        print(f"   Resource: {self.resource_pack_dir}")
+        print(f"   Behavior: {self.behavior_pack_dir}")
+        print(f"{'=' * 70}\n")
+
+    @trace.traced()
+    def edit_pokemon(self, pokemon_name: str, args, compact: bool = True) -> Optional[List[str]]:
+        """Edit an existing Pokémon's stats and properties. Returns the list of
+        changes saved ([] if none were specified), or None on error."""
+        print(f"\n{'=' * 70}")
+        print(f"EDITING POKÉMON: {pokemon_name.upper()}")
+        print(f"{'=' * 70}\n")
+
+        pokemon_lower = pokemon_name.lower()
+        trace.annotate(species=pokemon_lower)
+        species_file = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{pokemon_lower}.json"
+
+        # Check if Pokémon exists
+        if not species_file.exists():
+            metrics.inc("edits_failed")
+            print(f"ERROR: Pokémon '{pokemon_name}' not found!")
+            print(f"   Looked for: {species_file}")
+            print(f"\nTIP: Use --show-current-pokemon to see all Pokémon")
+            return None
+
+        trace.step("load")
+        # Every file this edit touches is loaded once and written once, at the end
+        txn = PackTransaction()
+        lang_updates = {}  # journaled after the commit
+        try:
+            data = txn.load(species_file)
+        except Exception as e:
+            metrics.inc("edits_failed")
+            print(f"ERROR: reading {pokemon_name}: {e}")
+            return None
+        current_total = sum(data.get('baseStats', {}).get(stat, 0) for stat in EV_STATS)
+
+        trace.step("apply")
+        changes_made = self._apply_edit(pokemon_name, data, txn, lang_updates, args)
+
+        # Save if changes were made
+        if changes_made:
+            print(f"\nChanges to apply:")
+            for change in changes_made:
+                print(f"   • {change}")
+
+            # Calculate new BST
+            new_stats = data.get('baseStats', {})
+            new_total = (new_stats.get('hp', 0) + new_stats.get('attack', 0) +
+                         new_stats.get('defence', 0) + new_stats.get('special_attack', 0) +
+                         new_stats.get('special_defence', 0) + new_stats.get('speed', 0))
+
+            if new_total != current_total:
+                print(f"\n   BST Change: {current_total} → {new_total}")
+
+            trace.step("commit")
+            # Save every touched file in one commit
+            try:
+                txn.set(species_file, data, 'species')
+                written = txn.commit(self._write_json)
+                for path, written_data in written.items():
+                    self._index_refresh(path, written_data)
+                self.lang_journal.set(lang_updates)
+                if compact:
+                    self.compact_lang()
+                metrics.inc("species_edited")
+                metrics.inc("edit_changes", len(changes_made))
+                print(f"\n[OK] Successfully updated {pokemon_name.capitalize()}!")
+                print(f"   File: {species_file}")
+                for path in written:
+                    if path != species_file:
+                        print(f"   File: {path}")
+            except Exception as e:
+                metrics.inc("edits_failed")
+                print(f"\nERROR: saving changes (nothing was written): {e}")
+                return None
+        else:
+            print(f"\nWARNING: No changes specified!")
+            print(f"   Use --hp, --attack, --number, --evo-target, --moves, etc. to make changes")
+            print(f"\nTIP: Examples:")
+            print(f"   python script.py --edit {pokemon_name} --hp 80 --attack 70 --rarity rare")
+            print(f"   python script.py --edit {pokemon_name} --number 1102")
+            print(f"   python script.py --edit {pokemon_name} --evo-target newmon --evo-level 25")
+            print(f"   python script.py --edit {pokemon_name} --remove-evolutions")
+
+        print(f"\n{'=' * 70}\n")
+        return changes_made
+
+    @trace.traced("apply_edit")
+    def _apply_edit(self, pokemon_name: str, data: Dict, txn: PackTransaction,
+                    lang_updates: Dict, args, errors: Optional[List[str]] = None) -> List[str]:
+        """Apply one set of --edit options to a loaded species (data) in memory.
+        Other files go through txn and lang keys into lang_updates; nothing is
+        written here. Returns the change descriptions; options that couldn't be
+        applied are printed as ERRORs and appended to errors."""
+        pokemon_lower = pokemon_name.lower()
+
+        def error(message: str):
+            print(f"ERROR: {message}")
+            if errors is not None:
+                errors.append(message)
+
+        species_file = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{pokemon_lower}.json"
+        spawn_file = self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" / f"{pokemon_lower}.json"
+
+        print(f"Current Stats for {pokemon_name.capitalize()}:")
+        current_stats = data.get('baseStats', {})
+        current_hp = current_stats.get('hp', 0)
+        current_atk = current_stats.get('attack', 0)
+        current_def = current_stats.get('defence', 0)
+        current_spatk = current_stats.get('special_attack', 0)
+        current_spdef = current_stats.get('special_defence', 0)
+        current_speed = current_stats.get('speed', 0)
+        current_total = current_hp + current_atk + current_def + current_spatk + current_spdef + current_speed
+
+        print(f"   HP: {current_hp}")
+        print(f"   Attack: {current_atk}")
+        print(f"   Defence: {current_def}")
+        print(f"   Sp. Attack: {current_spatk}")
+        print(f"   Sp. Defence: {current_spdef}")
+        print(f"   Speed: {current_speed}")
+        print(f"   TOTAL BST: {current_total}")
+        print(
+            f"   Type: {data.get('primaryType', 'normal').upper()}/{data.get('secondaryType', '').upper() if data.get('secondaryType') else 'None'}")
+        print(f"   Catch Rate: {data.get('catchRate', 45)}")
+        print(f"   Legendary: {'YES' if 'legendary' in data.get('labels', []) else 'No'}")
+
+        # Track what was changed
+        changes_made = []
+
+        trace.step("stats")
+        # Update stats if provided (compare against current value so setting to 50 works)
+        if args.hp is not None and args.hp != current_hp:
+            data['baseStats']['hp'] = args.hp
+            changes_made.append(f"HP: {current_hp} → {args.hp}")
+
+        if args.attack is not None and args.attack != current_atk:
+            data['baseStats']['attack'] = args.attack
+            changes_made.append(f"Attack: {current_atk} → {args.attack}")
+
+        if args.defence is not None and args.defence != current_def:
+            data['baseStats']['defence'] = args.defence
+            changes_made.append(f"Defence: {current_def} → {args.defence}")
+
+        if args.special_attack is not None and args.special_attack != current_spatk:
+            data['baseStats']['special_attack'] = args.special_attack
+            changes_made.append(f"Sp. Attack: {current_spatk} → {args.special_attack}")
+
+        if args.special_defence is not None and args.special_defence != current_spdef:
+            data['baseStats']['special_defence'] = args.special_defence
+            changes_made.append(f"Sp. Defence: {current_spdef} → {args.special_defence}")
+
+        if args.speed is not None and args.speed != current_speed:
+            data['baseStats']['speed'] = args.speed
+            changes_made.append(f"Speed: {current_speed} → {args.speed}")
+
+        trace.step("types")
+        # Update types if provided
+        if args.primary_type and args.primary_type != data.get('primaryType', 'normal'):
+            old_type = data.get('primaryType', 'normal')
+            data['primaryType'] = args.primary_type
+            changes_made.append(f"Primary Type: {old_type} → {args.primary_type}")
+
+        if args.secondary_type:
+            old_type = data.get('secondaryType', 'None')
+            data['secondaryType'] = args.secondary_type
+            changes_made.append(f"Secondary Type: {old_type} → {args.secondary_type}")
+
+        trace.step("rarity")
+        # Update rarity
+        if args.rarity:
+            # Update spawn file
+            if txn.exists(spawn_file):
+                try:
+                    spawn_data = txn.load(spawn_file)
+                    old_rarity = spawn_data['spawns'][0].get('bucket', 'common')
+                    for _entry in spawn_data['spawns']:
+                        if isinstance(_entry, dict):
+                            _entry['bucket'] = args.rarity
+                    txn.mark_dirty(spawn_file, 'spawn')
+                    changes_made.append(f"Rarity: {old_rarity} → {args.rarity}")
+                except Exception as e:
+                    print(f"WARNING: Could not update spawn rarity: {e}")
+
+        trace.step("legendary")
+        # Update legendary status
+        if args.legendary:
+            if 'legendary' not in data.get('labels', []):
+                data['labels'].append('legendary')
+                data['catchRate'] = 3
+                data['baseExperienceYield'] = 290
+                data['baseFriendship'] = 0
+                changes_made.append("Made legendary (catchRate=3, baseExp=290)")
+
+        trace.step("number")
+        # Update pokedex number if provided
+        if args.number is not None and args.number != data.get('nationalPokedexNumber'):
+            old_num = data.get('nationalPokedexNumber', '???')
+
+            # Warn if another species already uses this number
+            for other_name in self.pack_index().names_with_number(args.number):
+                if self.pack_index().species_file(other_name) != species_file:
+                    print(f"WARNING: Dex #{args.number} is already used by '{other_name}'!")
+
+            data['nationalPokedexNumber'] = args.number
+            changes_made.append(f"Pokédex Number: #{old_num} → #{args.number}")
+
+        trace.step("evolution")
+        # Add/replace an evolution if provided
+        if args.evo_target:
+            evo_config = {
+                'evo_target': args.evo_target,
+                'evo_method': args.evo_method,
+                'evo_level': args.evo_level,
+                'evo_item': args.evo_item,
+            }
+            new_evos = self._build_evolutions(pokemon_lower, evo_config)
+
+            existing_evos = data.get('evolutions', []) or []
+            new_ids = {e['id'] for e in new_evos}
+            # Replace same-id evolution if present, keep other branches
+            kept = [e for e in existing_evos if e.get('id') not in new_ids]
+            replaced = len(existing_evos) - len(kept)
+            data['evolutions'] = kept + new_evos
+
+            evo_desc = f"{pokemon_lower} → {args.evo_target.lower()}"
+            if args.evo_method == 'level_up':
+                evo_desc += f" at level {args.evo_level}"
+            elif args.evo_method == 'item_interact':
+                evo_desc += f" with {args.evo_item or 'minecraft:stone'}"
+            elif args.evo_method == 'trade':
+                evo_desc += " by trading"
+                if args.evo_item:
+                    evo_desc += f" (holding {args.evo_item})"
+            action = "Replaced evolution" if replaced else "Added evolution"
+            changes_made.append(f"{action}: {evo_desc}")
+            if kept:
+                changes_made.append(f"  (kept {len(kept)} other evolution branch(es))")
+
+        trace.step("remove_evolutions")
+        # Remove all evolutions if requested
+        if getattr(args, 'remove_evolutions', False):
+            old_count = len(data.get('evolutions', []) or [])
+            if old_count:
+                data['evolutions'] = []
+                changes_made.append(f"Removed all evolutions ({old_count} removed)")
+            else:
+                print(f"NOTE: No evolutions to remove.")
+
+        trace.step("head_bone")
+        # Edit head bone (updates BOTH species canLook and the poser file)
+        head_bone = getattr(args, 'head_bone', None)
+        if head_bone is not None:
+            no_head = head_bone.lower() == 'none'
+
+            # 1) Species: behaviour.moving.canLook
+            behaviour = data.setdefault('behaviour', {})
+            moving = behaviour.setdefault('moving', {})
+            moving['canLook'] = (not no_head) and (not getattr(args, 'no_look', False))
+
+            # 2) Poser: head field + look animation
+            poser_file = (self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" /
+                          "pokemon" / "posers" / f"{pokemon_lower}.json")
+            if txn.exists(poser_file):
+                try:
+                    poser_data = txn.load(poser_file)
+
+                    if no_head:
+                        # Delete head field entirely (never set to null!)
+                        poser_data.pop('head', None)
+                        # Strip "look" from every pose's animations
+                        for pose in poser_data.get('poses', {}).values():
+                            if isinstance(pose, dict) and isinstance(pose.get('animations'), list):
+                                pose['animations'] = [a for a in pose['animations']
+                                                      if str(a).strip().lower() != 'look']
+                        changes_made.append("Head bone: REMOVED (poser 'head' deleted, "
+                                            "'look' animations stripped, canLook=false)")
+                    else:
+                        poser_data['head'] = head_bone
+                        # Ensure standing pose has "look" so the head actually tracks
+                        standing = poser_data.get('poses', {}).get('standing')
+                        if isinstance(standing, dict) and isinstance(standing.get('animations'), list):
+                            if not any(str(a).strip().lower() == 'look' for a in standing['animations']):
+                                standing['animations'].insert(0, 'look')
+                        changes_made.append(f"Head bone: set to '{head_bone}' "
+                                            f"(canLook={moving['canLook']})")
+
+                    txn.mark_dirty(poser_file, 'poser')
+                except Exception as e:
+                    print(f"WARNING: Could not update poser file: {e}")
+                    changes_made.append(f"canLook: {moving['canLook']} (species only — poser update FAILED)")
+            else:
+                print(f"WARNING: Poser file not found: {poser_file}")
+                print(f"   Updated species canLook only — fix the poser manually!")
+                changes_made.append(f"canLook: {moving['canLook']} (species only — no poser file found)")
+
+        # --no-look on its own: force canLook=false without touching the head bone
+        elif getattr(args, 'no_look', False):
+            behaviour = data.setdefault('behaviour', {})
+            moving = behaviour.setdefault('moving', {})
+            if moving.get('canLook') is not False:
+                moving['canLook'] = False
+                changes_made.append("canLook: false (head bone unchanged)")
+
+        trace.step("size")
+        # Edit height/weight if provided
+        if getattr(args, 'height', None) is not None and args.height != data.get('height'):
+            changes_made.append(f"Height: {data.get('height', '?')} → {args.height} decimeters")
+            data['height'] = args.height
+        if getattr(args, 'weight', None) is not None and args.weight != data.get('weight'):
+            changes_made.append(f"Weight: {data.get('weight', '?')} → {args.weight} hectograms")
+            data['weight'] = args.weight
+
+        trace.step("movement")
+        # Edit movement behaviors if flagged
+        if getattr(args, 'can_fly', False):
+            moving = data.setdefault('behaviour', {}).setdefault('moving', {})
+            if not moving.setdefault('fly', {}).get('canFly'):
+                moving['fly']['canFly'] = True
+                changes_made.append("Flight: enabled")
+        if getattr(args, 'can_swim', False) or getattr(args, 'breathe_underwater', False):
+            moving = data.setdefault('behaviour', {}).setdefault('moving', {})
+            swim = moving.setdefault('swim', {})
+            swim.setdefault('swimSpeed', 0.3)
+            if getattr(args, 'can_swim', False) and not swim.get('canSwimInWater'):
+                swim['canSwimInWater'] = True
+                changes_made.append("Swimming: enabled")
+            if getattr(args, 'breathe_underwater', False) and not swim.get('canBreatheUnderwater'):
+                swim['canBreatheUnderwater'] = True
+                changes_made.append("Underwater breathing: enabled")
+
+        trace.step("spawn_level_biomes")
+        # Edit spawn level / biomes if provided (applies to ALL spawn entries)
+        spawn_level = getattr(args, 'spawn_level', None)
+        spawn_biomes = getattr(args, 'spawn_biomes', None)
+        if spawn_level is not None or spawn_biomes is not None:
+            if txn.exists(spawn_file):
+                try:
+                    spawn_data = txn.load(spawn_file)
+                    entries = spawn_data.get('spawns', [])
+                    for entry in entries:
+                        if not isinstance(entry, dict):
+                            continue
+                        if spawn_level is not None:
+                            entry['level'] = spawn_level
+                        if spawn_biomes is not None:
+                            entry.setdefault('condition', {})['biomes'] = [
+                                b.strip() for b in spawn_biomes.split(',')]
+                    txn.mark_dirty(spawn_file, 'spawn')
+                    n = len(entries)
+                    if spawn_level is not None:
+                        changes_made.append(f"Spawn level: {spawn_level} ({n} entr{'y' if n == 1 else 'ies'})")
+                    if spawn_biomes is not None:
+                        changes_made.append(f"Spawn biomes: {spawn_biomes} ({n} entr{'y' if n == 1 else 'ies'})")
+                except Exception as e:
+                    print(f"WARNING: Could not update spawn file: {e}")
+            else:
+                print(f"WARNING: Spawn file not found: {spawn_file}")
+
+        trace.step("descriptions")
+        # Edit Pokédex descriptions if provided (lang file)
+        desc1 = getattr(args, 'desc1', None)
+        desc2 = getattr(args, 'desc2', None)
+        if desc1 is not None or desc2 is not None:
+            if desc1 is not None:
+                lang_updates[f"cobblemon.species.{pokemon_lower}.desc1"] = desc1
+                changes_made.append(f"Pokédex desc1 updated")
+            if desc2 is not None:
+                lang_updates[f"cobblemon.species.{pokemon_lower}.desc2"] = desc2
+                changes_made.append(f"Pokédex desc2 updated")
+
+        trace.step("pre_evolution")
+        # Edit preEvolution field if provided
+        pre_evo = getattr(args, 'pre_evolution', None)
+        if pre_evo is not None and data.get('preEvolution') != pre_evo.lower():
+            changes_made.append(f"Pre-evolution: {data.get('preEvolution', 'none')} → {pre_evo.lower()}")
+            data['preEvolution'] = pre_evo.lower()
+            print(f"NOTE: preEvolution is informational. For {pre_evo} to actually evolve")
+            print(f"   into {pokemon_lower}, also run:")
+            print(f"   --edit {pre_evo.lower()} --evo-target {pokemon_lower} --evo-level <level>")
+
+        trace.step("species_fields")
+        # --- Simple species fields (v2.5) ---
+        catch_rate = getattr(args, 'catch_rate', None)
+        if catch_rate is not None and catch_rate != data.get('catchRate'):
+            if not (3 <= catch_rate <= 255):
+                print(f"WARNING: Catch rate {catch_rate} outside vanilla range 3-255")
+            changes_made.append(f"Catch rate: {data.get('catchRate', '?')} → {catch_rate}")
+            data['catchRate'] = catch_rate
+
+        male_ratio = getattr(args, 'male_ratio', None)
+        if male_ratio is not None and male_ratio != data.get('maleRatio'):
+            if not (-1 <= male_ratio <= 1):
+                print(f"WARNING: maleRatio {male_ratio} outside range -1 to 1")
+            changes_made.append(f"Male ratio: {data.get('maleRatio', '?')} → {male_ratio}")
+            data['maleRatio'] = male_ratio
+
+        exp_group = getattr(args, 'exp_group', None)
+        if exp_group is not None and exp_group != data.get('experienceGroup'):
+            if exp_group not in VALID_EXP_GROUPS:
+                print(f"WARNING: '{exp_group}' is not a known experience group")
+                print(f"   Valid: {', '.join(sorted(VALID_EXP_GROUPS))}")
+            changes_made.append(f"Experience group: {data.get('experienceGroup', '?')} → {exp_group}")
+            data['experienceGroup'] = exp_group
+
+        egg_cycles = getattr(args, 'egg_cycles', None)
+        if egg_cycles is not None and egg_cycles != data.get('eggCycles'):
+            changes_made.append(f"Egg cycles: {data.get('eggCycles', '?')} → {egg_cycles}")
+            data['eggCycles'] = egg_cycles
+
+        egg_groups = getattr(args, 'egg_groups', None)
+        if egg_groups is not None:
+            groups = [g.strip().lower() for g in egg_groups.split(',')]
+            unknown = [g for g in groups if g not in VALID_EGG_GROUPS]
+            if unknown:
+                print(f"WARNING: Unknown egg group(s): {', '.join(unknown)}")
+                print(f"   Valid: {', '.join(sorted(VALID_EGG_GROUPS))}")
+            if groups != data.get('eggGroups'):
+                changes_made.append(f"Egg groups: {data.get('eggGroups', '?')} → {groups}")
+                data['eggGroups'] = groups
+
+        base_exp = getattr(args, 'base_exp', None)
+        if base_exp is not None and base_exp != data.get('baseExperienceYield'):
+            changes_made.append(f"Base exp yield: {data.get('baseExperienceYield', '?')} → {base_exp}")
+            data['baseExperienceYield'] = base_exp
+
+        friendship = getattr(args, 'friendship', None)
+        if friendship is not None and friendship != data.get('baseFriendship'):
+            changes_made.append(f"Base friendship: {data.get('baseFriendship', '?')} → {friendship}")
+            data['baseFriendship'] = friendship
+
+        ev_spec = getattr(args, 'ev_yield', None)
+        if ev_spec is not None:
+            try:
+                new_evs = parse_ev_yield(ev_spec)
+                if sum(new_evs.values()) > 3:
+                    print(f"WARNING: Total EV yield {sum(new_evs.values())} exceeds vanilla max of 3")
+                if new_evs != data.get('evYield'):
+                    nonzero = ', '.join(f"{k}:{v}" for k, v in new_evs.items() if v)
+                    changes_made.append(f"EV yield: {nonzero or 'none'}")
+                    data['evYield'] = new_evs
+            except ValueError as e:
+                error(f"Bad --ev-yield: {e}")
+
+        drops_spec = getattr(args, 'drops', None)
+        if drops_spec is not None:
+            try:
+                entries = parse_drops(drops_spec)
+                data['drops'] = {"amount": data.get('drops', {}).get('amount', '1-2'),
+                                 "entries": entries}
+                changes_made.append(f"Drops: {len(entries)} entr{'y' if len(entries) == 1 else 'ies'} "
+                                    f"({', '.join(e['item'] for e in entries)})")
+            except ValueError as e:
+                error(f"Bad --drops: {e}")
+
+        base_scale = getattr(args, 'base_scale', None)
+        if base_scale is not None and base_scale != data.get('baseScale'):
+            changes_made.append(f"Base scale: {data.get('baseScale', 'default')} → {base_scale}")
+            data['baseScale'] = float(base_scale)
+
+        hitbox_spec = getattr(args, 'hitbox', None)
+        if hitbox_spec is not None:
+            try:
+                hb = parse_hitbox(hitbox_spec)
+                if hb != data.get('hitbox'):
+                    changes_made.append(f"Hitbox: {hb['width']}x{hb['height']}")
+                    data['hitbox'] = hb
+            except ValueError as e:
+                error(f"Bad --hitbox (format: \"width,height\"): {e}")
+
+        # Un-set legendary status
+        if getattr(args, 'not_legendary', False):
+            labels = data.get('labels', [])
+            if 'legendary' in labels:
+                labels.remove('legendary')
+                data['labels'] = labels
+                changes_made.append("Legendary: REMOVED")
+                print(f"NOTE: Spawn weight unchanged — if it was set to 0.05 for legendary,")
+                print(f"   consider also: --spawn-weight 10")
+            else:
+                print(f"NOTE: {pokemon_lower} wasn't legendary.")
+
+        # Remove secondary type with --secondary-type none
+        # (handled here as a pre-check so the normal type-edit code below sees None)
+        if getattr(args, 'secondary_type', None) and args.secondary_type.lower() == 'none':
+            if 'secondaryType' in data:
+                changes_made.append(f"Secondary type: {data['secondaryType']} → REMOVED (mono-type)")
+                del data['secondaryType']
+            else:
+                print(f"NOTE: {pokemon_lower} has no secondary type.")
+            args.secondary_type = None  # prevent the regular type editor from re-adding it
+
+        trace.step("spawn_entries")
+        # --- Spawn ENTRY management (v2.6): structure ops run BEFORE bulk field edits ---
+        append_spec = getattr(args, 'append_spawn', None)
+        remove_idx = getattr(args, 'removespawn', None)
+        remove_last = getattr(args, 'removelastspawn', False)
+        spawnset_spec = getattr(args, 'spawnset', None)
+
+        if spawnset_spec is not None and (append_spec or remove_idx is not None or remove_last):
+            error(f"--spawnset replaces everything; don't combine it with "
+                  f"--append/--removespawn/--removelastspawn. Skipping all spawn entry ops.")
+        elif append_spec or remove_idx is not None or remove_last or spawnset_spec is not None:
+            if txn.exists(spawn_file):
+                spawn_data = txn.load(spawn_file)
+            else:
+                print(f"NOTE: No spawn file existed — creating one.")
+                spawn_data = {"enabled": True, "neededInstalledMods": [],
+                              "neededUninstalledMods": [], "spawns": []}
+            spawns = spawn_data.setdefault('spawns', [])
+            spawn_dirty = False
+
+            def describe(entry):
+                cond = entry.get('condition', {})
+                return (f"bucket={entry.get('bucket')}, level={entry.get('level')}, "
+                        f"weight={entry.get('weight')}, "
+                        f"biomes={';'.join(cond.get('biomes', []))}, "
+                        f"canSeeSky={cond.get('canSeeSky', True)}")
+
+            # Full replacement (preview unless --confirmset)
+            if spawnset_spec is not None:
+                try:
+                    spec = spawnset_spec.strip()
+                    if spec.startswith('['):
+                        raw_entries = json.loads(spec)
+                        if not isinstance(raw_entries, list):
+                            raise ValueError("JSON spawnset must be an array")
+                        new_entries = [parse_spawn_entry(json.dumps(e), pokemon_lower)
+                                       for e in raw_entries]
+                    else:
+                        new_entries = [parse_spawn_entry(part, pokemon_lower)
+                                       for part in spec.split('|') if part.strip()]
+                    for i, e in enumerate(new_entries):
+                        if not e.get('id'):
+                            e['id'] = f"{pokemon_lower}-{i + 1}"
+                    if not getattr(args, 'confirmset', False):
+                        print(f"\nPREVIEW: --spawnset would REPLACE all {len(spawns)} current "
+                              f"entr{'y' if len(spawns) == 1 else 'ies'} with {len(new_entries)}:")
+                        for i, e in enumerate(new_entries, 1):
+                            print(f"   #{i}: {describe(e)}")
+                        print(f"\nNothing was changed. Re-run with --confirmset to apply.\n")
+                    else:
+                        spawn_data['spawns'] = new_entries
+                        spawns = new_entries
+                        spawn_dirty = True
+                        changes_made.append(f"Spawn entries REPLACED: now {len(new_entries)} "
+                                            f"entr{'y' if len(new_entries) == 1 else 'ies'}")
+                        for i, e in enumerate(new_entries, 1):
+                            changes_made.append(f"  #{i}: {describe(e)}")
+                except (ValueError, json.JSONDecodeError) as e:
+                    error(f"Bad --spawnset: {e}")
+            else:
+                # Removals first, then append
+                if remove_idx is not None:
+                    if 1 <= remove_idx <= len(spawns):
+                        removed = spawns.pop(remove_idx - 1)
+                        spawn_dirty = True
+                        changes_made.append(f"Spawn entry #{remove_idx} removed "
+                                            f"({describe(removed)})")
+                    else:
+                        error(f"--removespawn {remove_idx} out of range "
+                              f"(have {len(spawns)} entr{'y' if len(spawns) == 1 else 'ies'}, "
+                              f"indices are 1-based)")
+                if remove_last:
+                    if spawns:
+                        removed = spawns.pop()
+                        spawn_dirty = True
+                        changes_made.append(f"Last spawn entry removed ({describe(removed)})")
+                    else:
+                        print(f"NOTE: No spawn entries to remove.")
+                if append_spec is not None:
+                    try:
+                        entry = parse_spawn_entry(append_spec, pokemon_lower)
+                        if not entry.get('id'):
+                            existing_nums = []
+                            for e in spawns:
+                                sid = str(e.get('id', ''))
+                                if sid.startswith(f"{pokemon_lower}-"):
+                                    try:
+                                        existing_nums.append(int(sid.rsplit('-', 1)[1]))
+                                    except ValueError:
+                                        pass
+                            entry['id'] = f"{pokemon_lower}-{max(existing_nums, default=0) + 1}"
+                        spawns.append(entry)
+                        spawn_dirty = True
+                        changes_made.append(f"Spawn entry appended as #{len(spawns)} "
+                                            f"({describe(entry)})")
+                    except (ValueError, json.JSONDecodeError) as e:
+                        error(f"Bad --append: {e}")
+                        print(f"   Format: \"bucket=rare,level=20-40,weight=5,"
+                              f"biomes=#minecraft:is_savanna;#minecraft:is_badlands,canSeeSky=false\"")
+
+            if spawn_dirty:
+                if not spawns:
+                    print(f"WARNING: Spawn list is now EMPTY — {pokemon_lower} will never spawn!")
+                txn.set(spawn_file, spawn_data, 'spawn')
+
+        trace.step("spawn_fields")
+        # --- Spawn-file fields (v2.5): weight and canSeeSky, all entries ---
+        spawn_weight = getattr(args, 'spawn_weight', None)
+        can_see_sky = getattr(args, 'can_see_sky', None)
+        if spawn_weight is not None or can_see_sky is not None:
+            if txn.exists(spawn_file):
+                try:
+                    spawn_data = txn.load(spawn_file)
+                    entries = spawn_data.get('spawns', [])
+                    for entry in entries:
+                        if not isinstance(entry, dict):
+                            continue
+                        if spawn_weight is not None:
+                            entry['weight'] = spawn_weight
+                        if can_see_sky is not None:
+                            entry.setdefault('condition', {})['canSeeSky'] = (can_see_sky == 'true')
+                    txn.mark_dirty(spawn_file, 'spawn')
+                    n = len(entries)
+                    if spawn_weight is not None:
+                        if spawn_weight <= 0:
+                            print(f"WARNING: Weight {spawn_weight} means it will NEVER spawn!")
+                        changes_made.append(f"Spawn weight: {spawn_weight} ({n} entr{'y' if n == 1 else 'ies'})")
+                    if can_see_sky is not None:
+                        where = "surface only" if can_see_sky == 'true' else "underground/caves allowed"
+                        changes_made.append(f"canSeeSky: {can_see_sky} ({where}, {n} entr{'y' if n == 1 else 'ies'})")
+                except Exception as e:
+                    print(f"WARNING: Could not update spawn file: {e}")
+            else:
+                print(f"WARNING: Spawn file not found: {spawn_file}")
+
+        trace.step("moves")
+        # Append moves (unlike --moves which replaces)
+        add_moves = getattr(args, 'add_moves', None)
+        if add_moves is not None:
+            if getattr(args, 'moves', None):
+                print(f"WARNING: Both --moves and --add-moves given; --moves (replace) runs below,")
+                print(f"   so --add-moves is appending to the REPLACED list.")
+            existing = data.get('moves', []) or []
+            new_moves = [m.strip() for m in add_moves.split(',') if m.strip()]
+            appended = [m for m in new_moves if m not in existing]
+            skipped = len(new_moves) - len(appended)
+            if appended:
+                data['moves'] = existing + appended
+                changes_made.append(f"Moves appended: {len(appended)} "
+                                    f"({len(existing)} kept{f', {skipped} duplicates skipped' if skipped else ''})")
+            else:
+                print(f"NOTE: All {len(new_moves)} moves already known — nothing appended.")
+
+        # Update moves if provided
+        if args.moves:
+            new_moves = [m.strip() for m in args.moves.split(',')]
+            old_moves = data.get('moves', [])
+            data['moves'] = new_moves
+            changes_made.append(f"Moves: {len(old_moves)} move(s) → {len(new_moves)} move(s)")
+
+        trace.step("abilities")
+        # Update abilities if provided
+        if args.abilities:
+            new_abilities = [a.strip() for a in args.abilities.split(',')]
+            old_abilities = data.get('abilities', [])
+            data['abilities'] = new_abilities
+            changes_made.append(f"Abilities: {old_abilities} → {new_abilities}")
+
+        return changes_made
+
+    @trace.traced()
+    def edit_files(self, pokemon_name: str, files: Optional[Dict[str, List[Path]]] = None) -> bool:
+        """Swap in new asset files (model/animation/textures) for an existing Pokémon.
+        New files are taken from the base pack folder (or given as files); displaced
+        files are moved OUT to that same folder, so running --editfiles again swaps
+        back (one-level undo)."""
+        pokemon_lower = pokemon_name.lower()
+        trace.annotate(species=pokemon_lower)
+
+        print(f"\n{'=' * 70}")
+        print(f"SWAPPING ASSET FILES FOR: {pokemon_lower.upper()}")
+        print(f"{'=' * 70}\n")
+
+        species_file = (self.behavior_pack_dir / "data" / "cobblemon" /
+                        "species" / "custom" / f"{pokemon_lower}.json")
+        if not species_file.exists():
+            print(f"ERROR: Pokémon '{pokemon_lower}' not found!")
+            return False
+
+        if files is None:
+            files = self.find_files_in_base_dir(pokemon_lower)
+        bedrock = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+        tex_dir = (self.resource_pack_dir / "assets" / "cobblemon" /
+                   "textures" / "pokemon" / pokemon_lower)
+
+        def swap(source: Path, installed: Path, label: str) -> bool:
+            """Collision-safe swap: source -> installed; old installed -> base dir."""
+            try:
+                temp = self.base_dir / f".swap_tmp_{installed.name}"
+                if installed.suffix == '.png' and is_tga_texture(source):
+                    convert_tga_to_png(source, temp)  # Minecraft only loads PNG
+                    source.unlink()
+                    print(f"  NOTE: {source.name} is TGA — converted to PNG")
+                else:
+                    shutil.move(str(source), str(temp))
+                if installed.exists():
+                    out_path = self.base_dir / installed.name
+                    if out_path.exists():
+                        print(f"WARNING: Overwriting previous backup: {out_path.name}")
+                        out_path.unlink()
+                    shutil.move(str(installed), str(out_path))
+                    print(f"  Old {label} → {out_path.name} (in pack folder, run --editfiles again to restore)")
+                else:
+                    installed.parent.mkdir(parents=True, exist_ok=True)
+                    print(f"  NOTE: No previous {label} — nothing to back up")
+                shutil.move(str(temp), str(installed))
+                print(f"  New {label}: {source.name} → installed")
+                return True
+            except Exception as e:
+                print(f"  ERROR: Failed to swap {label}: {e}")
+                return False
+
+        swapped = []
+
+        # Model
+        if files['models']:
+            if len(files['models']) > 1:
+                print(f"WARNING: Multiple model files found, using: {files['models'][0].name}")
+            installed = bedrock / "models" / pokemon_lower / f"{pokemon_lower}.geo.json"
+            if swap(files['models'][0], installed, "model"):
+                swapped.append("model")
+                # Sanity-check the new model's identifier
+                try:
+                    spans = None
+                    if self.json_profile == "dev":
+                        with open(installed, 'r', encoding='utf-8') as f:
+                            spans = scan_geometry_identifiers(f.read())
+                    if spans is not None:
+                        ident = spans[0][2]
+                    else:
+                        with open(installed, 'r') as f:
+                            geo = json.load(f)
+                        if self.json_profile == "release":
+                            self._write_json(installed, geo, 'model', source_bytes=installed.stat().st_size)
+                        ident = geo.get("minecraft:geometry", [{}])[0].get(
+                            "description", {}).get("identifier", "")
+                    if ident != f"geometry.{pokemon_lower}":
+                        print(f"  WARNING: New model identifier is '{ident}' — expected "
+                              f"'geometry.{pokemon_lower}'. Fix in Blockbench or it won't render!")
+                except Exception:
+                    print(f"  WARNING: Could not validate new model JSON — run --check!")
+
+        # Animation
+        if files['animations']:
+            if len(files['animations']) > 1:
+                print(f"WARNING: Multiple animation files found, using: {files['animations'][0].name}")
+            installed = bedrock / "animations" / pokemon_lower / f"{pokemon_lower}.animation.json"
+            if swap(files['animations'][0], installed, "animation"):
+                swapped.append("animation")
+                try:
+                    with open(installed, 'r') as f:
+                        anim_data = json.load(f)
+                    if self.json_profile == "release":
+                        self._write_json(installed, anim_data, 'animation', source_bytes=installed.stat().st_size)
+                    anims = anim_data.get("animations", {})
+                    bad = [k for k in anims if not k.startswith(f"animation.{pokemon_lower}.")]
+                    if bad:
+                        print(f"  WARNING: {len(bad)} animation key(s) don't start with "
+                              f"'animation.{pokemon_lower}.' — posers won't find them!")
+                except Exception:
+                    print(f"  WARNING: Could not validate new animation JSON — run --check!")
+
+        # Textures (classify by filename: 'shiny' -> shiny slot)
+        shiny_sources = [t for t in files['textures'] if 'shiny' in t.name.lower()]
+        normal_sources = [t for t in files['textures'] if 'shiny' not in t.name.lower()]
+        if normal_sources:
+            if len(normal_sources) > 1:
+                print(f"WARNING: Multiple base textures found, using: {normal_sources[0].name}")
+            if swap(normal_sources[0], tex_dir / f"{pokemon_lower}.png", "texture"):
+                swapped.append("texture")
+        if shiny_sources:
+            if len(shiny_sources) > 1:
+                print(f"WARNING: Multiple shiny textures found, using: {shiny_sources[0].name}")
+            if swap(shiny_sources[0], tex_dir / f"{pokemon_lower}_shiny.png", "shiny texture"):
+                swapped.append("shiny texture")
+
+        if not swapped:
+            print(f"ERROR: No asset files found in: {self.base_dir}")
+            print(f"   Drop the new files there first. Recognized:")
+            print(f"   • Model:     *.geo.json (or containing 'geo'/'model')")
+            print(f"   • Animation: *.animation.json")
+            print(f"   • Textures:  *.png ('shiny' in name → shiny slot)")
+            return False
+
+        if self.optimize_pngs and any("texture" in part for part in swapped):
+            self.optimize_species_textures([pokemon_lower])
+
+        metrics.inc("asset_swaps")
+        print(f"\n{'=' * 70}")
+        print(f"SWAPPED: {', '.join(swapped)}")
+        print(f"{'=' * 70}")
+        print(f"  Undo: run --editfiles {pokemon_lower} again (old files are in the pack folder)")
+        print(f"Recommended: run --check to validate the new files")
+        print(f"Reload in-game: /reload\n")
+        return True
+
+    @trace.traced()
+    def edit_files_batch(self, names: Optional[List[str]] = None) -> bool:
+        """--editfiles for several species from one drop (names=None: every species
+        that has files in the pack folder and already exists in the pack)"""
+        groups = self.find_species_files()
+        species_dir = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+        if names is None:
+            names = [n for n in sorted(groups) if (species_dir / f"{n}.json").exists()]
+            skipped = sorted(n for n in groups if n not in names)
+            if skipped:
+                print(f"NOTE: Not in the pack, skipped: {', '.join(skipped)}")
+        if not names:
+            print(f"ERROR: No files for any existing Pokémon in: {self.base_dir}")
+            return False
+
+        ok = True
+        for name in names:
+            files = groups.get(name.lower())
+            if files is None:
+                print(f"ERROR: No files named {name.lower()}.* or folder {name.lower()}/ in: {self.base_dir}")
+                ok = False
+                continue
+            ok = self.edit_files(name, files) and ok
+        return ok
+
+    @trace.traced()
+    def bulk_edit(self, where: str, set_spec: Optional[str] = None, confirm: bool = False,
+                  workers: Optional[int] = None) -> bool:
+        """--where [--set [--confirm]]: list the species matching an index query, preview
+        the assignments on each, and with confirm apply them (one thread per file
+        pair; each species/spawn file is loaded once and written once)."""
+        print(f"\n{'=' * 70}")
+        print(f"BULK EDIT: where {where}")
+        print(f"{'=' * 70}\n")
+        try:
+            conditions = parse_where(where)
+            assignments = parse_set(set_spec) if set_spec is not None else []
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return False
+
+        index = self.pack_index()
+        matched = sorted(name for name, record in index.species.items() if where_matches(record, conditions))
+        if not matched:
+            print("NOTE: No Pokémon match.")
+            return True
+        print(f"{len(matched)} Pokémon match: {', '.join(matched)}\n")
+        if not assignments:
+            return True
+
+        spawn_dir = self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world"
+
+        def apply(name):
+            """(diff lines, spawn fields skipped for lack of a spawn file, error) for
+            one species; writes only if confirm"""
+            txn = PackTransaction()
+            diffs, skipped = [], []
+            try:
+                species_file = index.species_file(name)
+                data = txn.load(species_file)
+                spawn_file = spawn_dir / f"{name}.json"
+                spawn_data = None
+                for scope, path, value in assignments:
+                    field = '.'.join(path)
+                    if scope == "species":
+                        old = set_path(data, path, value)
+                        if old != value:
+                            txn.mark_dirty(species_file, 'species')
+                            diffs.append(f"{field}: {'(unset)' if old is _MISSING else json.dumps(old)} → {json.dumps(value)}")
+                        continue
+                    if spawn_data is None:
+                        if not txn.exists(spawn_file):
+                            skipped.append(f"spawn.{field}")
+                            continue
+                        spawn_data = txn.load(spawn_file)
+                    for i, entry in enumerate(spawn_data.get('spawns', []) or [], 1):
+                        if not isinstance(entry, dict):
+                            continue
+                        old = set_path(entry, path, value)
+                        if old != value:
+                            txn.mark_dirty(spawn_file, 'spawn')
+                            diffs.append(f"spawn #{i} {field}: {'(unset)' if old is _MISSING else json.dumps(old)} → {json.dumps(value)}")
+                if confirm:
+                    for path, written in txn.commit(self._write_json).items():
+                        index.refresh(path, written)
+            except Exception as e:
+                return diffs, skipped, str(e)
+            return diffs, skipped, None
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(apply, matched))
+
+        changed = failed = 0
+        no_spawn = []
+        for name, (diffs, skipped, error) in zip(matched, results):
+            if confirm and error:
+                metrics.inc("edits_failed")
+            elif confirm and diffs:
+                metrics.inc("species_edited")
+                metrics.inc("edit_changes", len(diffs))
+            if error:
+                failed += 1
+                print(f"  ERROR: {name}: {error}")
+            elif diffs:
+                changed += 1
+                print(f"  {name}:")
+                for diff in diffs:
+                    print(f"     {diff}")
+            if skipped and not error:
+                no_spawn.append(name)
+                print(f"  {name}: no spawn file — {', '.join(skipped)} skipped")
+        if not changed and not failed and not no_spawn:
+            print("  (every matching Pokémon already has these values)")
+        skip_note = f", {len(no_spawn)} without a spawn file (spawn fields skipped)" if no_spawn else ""
+
+        if not confirm:
+            print(f"\nPREVIEW: {changed} Pokémon would change{skip_note}. Nothing was changed. "
+                  f"Re-run with --confirm to apply.\n")
+        elif failed:
+            print(f"\nERROR: {changed} Pokémon updated, {failed} failed (their files were left untouched)"
+                  f"{skip_note}\n")
+        else:
+            print(f"\n[OK] {changed} Pokémon updated{skip_note}")
+            print(f"Reload in-game: /reload\n")
+        return not failed
+
+    @trace.traced()
+    def rename_pokemon(self, old_name: str, new_name: str) -> bool:
+        """Rename a Pokémon across EVERY site: species, spawn, model, animation,
+        poser, resolver, textures, lang, other species' evolutions/preEvolution,
+        and species_additions."""
+        old = old_name.lower()
+        new = new_name.lower()
+        trace.annotate(species=old, new_name=new)
+
+        print(f"\n{'=' * 70}")
+        print(f"  RENAMING: {old.upper()} → {new.upper()}")
+        print(f"{'=' * 70}\n")
+
+        renames = self._validate_renames([(old, new)])
+        if renames is None:
+            return False
+        changes = self._apply_renames(renames)
+
+        print(f"RENAME COMPLETE — sites updated:")
+        for c in changes:
+            print(f"   • {c}")
+        print(f"\nSTRONGLY recommended: run --check now to verify all references")
+        print(f"Reload in-game: /reload")
+        print(f"{'=' * 70}\n")
+        return True
+
+    @trace.traced()
+    def rename_map(self, map_file: str) -> bool:
+        """Apply every old,new row of a CSV mapping file in one pass (chains and
+        swaps like a→b, b→a included); each affected file is rewritten once."""
+        print(f"\n{'=' * 70}")
+        print(f"  BULK RENAME from {map_file}")
+        print(f"{'=' * 70}\n")
+
+        try:
+            pairs = load_rename_map(map_file)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Bad --rename-map: {e}")
+            return False
+        if not pairs:
+            print(f"ERROR: Rename map is empty: {map_file}")
+            return False
+        renames = self._validate_renames(pairs)
+        if renames is None:
+            return False
+        if not renames:
+            print("NOTE: Every row maps a name to itself — nothing to rename.")
+            return True
+
+        for old, new in renames.items():
+            print(f"  {old} → {new}")
+        print()
+        changes = self._apply_renames(renames)
+
+        print(f"RENAME COMPLETE — {len(renames)} species, sites updated:")
+        for c in changes:
+            print(f"   • {c}")
+        print(f"\nSTRONGLY recommended: run --check now to verify all references")
+        print(f"Reload in-game: /reload")
+        print(f"{'=' * 70}\n")
+        return True
+
+    def _validate_renames(self, pairs: List[tuple]) -> Optional[Dict[str, str]]:
+        """{old: new} for the (old, new) pairs, or None (after printing why) if any
+        is invalid. A target may be an existing species only if it is renamed too."""
+        species_dir = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+        renames = {}
+        ok = True
+        for old, new in pairs:
+            old, new = old.lower(), new.lower()
+            if old in renames:
+                print(f"ERROR: '{old}' is renamed twice ({renames[old]}, {new})")
+                ok = False
+            elif not re.fullmatch(r'[a-z0-9_]+', new):
+                print(f"ERROR: Invalid name '{new}': use lowercase letters, numbers, underscores only")
+                ok = False
+            elif not (species_dir / f"{old}.json").exists():
+                print(f"ERROR: Pokémon '{old}' not found!")
+                ok = False
+            elif old != new:
+                renames[old] = new
+        targets = {}
+        for old, new in renames.items():
+            if new in targets:
+                print(f"ERROR: '{targets[new]}' and '{old}' are both renamed to '{new}'")
+                ok = False
+                continue
+            targets[new] = old
+            if new not in renames and (species_dir / f"{new}.json").exists():
+                print(f"ERROR: A Pokémon named '{new}' already exists!")
+                ok = False
+        return renames if ok else None
+
+    @trace.traced("apply_renames")
+    def _apply_renames(self, renames: Dict[str, str]) -> List[str]:
+        """Rename every {old: new} species at once across all sites. Every file is
+        read before anything is written and files/folders are moved in two phases,
+        so chains and swaps never clobber each other. Returns the change list."""
+        species_dir = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+        spawn_dir = self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world"
+        additions_dir = self.behavior_pack_dir / "data" / "cobblemon" / "species_additions"
+        bedrock = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+        tex_root = self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon"
+        index = self.pack_index()
+        changes = []
+
+        def rename_result(result) -> str:
+            parts = str(result).split(' ')
+            target = parts[0].split(':')[-1]
+            if target not in renames:
+                return result
+            return ' '.join([parts[0][:-len(target)] + renames[target]] + parts[1:]).strip()
+
+        def rename_evolution_id(evo_id: str, own: Optional[str] = None) -> str:
+            head, rest = '', evo_id
+            if own and evo_id.startswith(f"{own}_"):
+                head, rest = renames[own], evo_id[len(own):]
+            for old in sorted(renames, key=len, reverse=True):
+                if rest.endswith(f"_{old}"):
+                    rest = rest[:-len(old)] + renames[old]
+                    break
+            return head + rest
+
+        def rename_spawn_pokemon(value) -> str:
+            base = str(value).split(' ')
+            return ' '.join([renames[base[0]]] + base[1:]).strip() if base[0] in renames else value
+
+        # Reverse-reference snapshot: the only other files read or written
+        refs = {}
+        for old in renames:
+            for path, fields in index.referrers(old).items():
+                refs.setdefault(path, []).extend(fields)
+
+        def describe(path: Path, name: Optional[str] = None) -> str:
+            return f"{name or path.stem} ({', '.join(dict.fromkeys(refs[path]))})"
+
+        staged = []  # (source, destination, data, file class)
+
+        # 1. Species files: renamed ones (name, pokedex keys, evolution ids, filename)
+        #    and the ones referring to them (evolution results/ids, preEvolution)
+        touched_others = []
+        for path in sorted({species_dir / f"{old}.json" for old in renames} |
+                           {p for p in refs if p.parent == species_dir}):
+            own = path.stem if path.stem in renames else None
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            except Exception:
+                if own is None:
+                    continue
+                raise
+            before = json.dumps(data, sort_keys=True)
+            if own:
+                new = renames[own]
+                data['name'] = new
+                if isinstance(data.get('pokedex'), list):
+                    data['pokedex'] = [k.replace(f"cobblemon.species.{own}.", f"cobblemon.species.{new}.")
+                                       for k in data['pokedex']]
+            for evo in data.get('evolutions', []) or []:
+                if isinstance(evo, dict):
+                    if 'result' in evo:
+                        evo['result'] = rename_result(evo['result'])
+                    if 'id' in evo:
+                        evo['id'] = rename_evolution_id(str(evo['id']), own)
+            if data.get('preEvolution') in renames:
+                data['preEvolution'] = renames[data['preEvolution']]
+            if own:
+                staged.append((path, species_dir / f"{renames[own]}.json", data, 'species'))
+            elif json.dumps(data, sort_keys=True) != before:
+                staged.append((path, path, data, 'species'))
+                touched_others.append(describe(path))
+        changes.append("species file (name, pokedex keys, evolution ids, filename)")
+        if touched_others:
+            changes.append(f"other species referencing it: {', '.join(touched_others)}")
+
+        # 2. Spawn files: pokemon fields everywhere; ids + filename for renamed species
+        touched_spawns = []
+        spawn_files = {spawn_dir / f"{old}.json" for old in renames}
+        for path in sorted({p for p in spawn_files if p.exists()} |
+                           {p for p in refs if p.parent == spawn_dir}):
+            own = path.stem if path in spawn_files else None
+            try:
+                with open(path, 'r') as f:
+                    spawn = json.load(f)
+            except Exception:
+                if own is None:
+                    continue
+                raise
+            dirty = False
+            for entry in spawn.get('spawns', []) or []:
+                if not isinstance(entry, dict):
+                    continue
+                renamed = rename_spawn_pokemon(entry.get('pokemon', ''))
+                if renamed != entry.get('pokemon', ''):
+                    entry['pokemon'] = renamed
+                    dirty = True
+                if own and str(entry.get('id', '')).startswith(f"{own}-"):
+                    entry['id'] = renames[own] + entry['id'][len(own):]
+            if own:
+                staged.append((path, spawn_dir / f"{renames[own]}.json", spawn, 'spawn'))
+            elif dirty:
+                staged.append((path, path, spawn, 'spawn'))
+                touched_spawns.append(describe(path))
+        if any(p.exists() for p in spawn_files):
+            changes.append("spawn file (pokemon, ids, filename)")
+
+        # 3. Species additions: targets, evolution results/ids, filenames
+        touched_adds = []
+        for path in sorted(p for p in refs if p.parent == additions_dir):
+            try:
+                with open(path, 'r') as f:
+                    add = json.load(f)
+            except Exception:
+                continue
+            before = json.dumps(add, sort_keys=True)
+            target = str(add.get('target', ''))
+            if target.startswith("cobblemon:") and target[len("cobblemon:"):] in renames:
+                add['target'] = f"cobblemon:{renames[target[len('cobblemon:'):]]}"
+            for evo in add.get('evolutions', []) or []:
+                if isinstance(evo, dict):
+                    if 'result' in evo:
+                        evo['result'] = rename_result(evo['result'])
+                    if 'id' in evo:
+                        evo['id'] = rename_evolution_id(str(evo['id']))
+            if json.dumps(add, sort_keys=True) != before:
+                new_name = path.name
+                for old in sorted(renames, key=len, reverse=True):
+                    if f"_{old}_" in path.name:
+                        new_name = path.name.replace(f"_{old}_", f"_{renames[old]}_")
+                        break
+                staged.append((path, additions_dir / new_name, add, 'species_additions'))
+                touched_adds.append(describe(path, new_name))
+        if touched_adds:
+            changes.append(f"species_additions: {', '.join(touched_adds)}")
+        if touched_spawns:
+            changes.append(f"other spawn files: {', '.join(touched_spawns)}")
+
+        # 4. Resolvers: species/model/poser/texture refs, filename
+        resolvers_dir = bedrock / "resolvers"
+        if resolvers_dir.exists():
+            resolved = False
+            for old, new in renames.items():
+                for res_file in sorted(resolvers_dir.glob(f"*_{old}_base.json")):
+                    if not re.fullmatch(rf"\d+_{re.escape(old)}_base\.json", res_file.name):
+                        continue  # *_pika_base.json also matches 0_sir_pika_base.json
+                    with open(res_file, 'r') as f:
+                        res = json.load(f)
+                    if res.get('species') == f"cobblemon:{old}":
+                        res['species'] = f"cobblemon:{new}"
+                    for var in res.get('variations', []) or []:
+                        if not isinstance(var, dict):
+                            continue
+                        if var.get('model') == f"cobblemon:{old}.geo":
+                            var['model'] = f"cobblemon:{new}.geo"
+                        if var.get('poser') == f"cobblemon:{old}":
+                            var['poser'] = f"cobblemon:{new}"
+                        if 'texture' in var:
+                            var['texture'] = (str(var['texture'])
+                                              .replace(f"pokemon/{old}/", f"pokemon/{new}/")
+                                              .replace(f"/{old}_shiny.png", f"/{new}_shiny.png")
+                                              .replace(f"/{old}.png", f"/{new}.png"))
+                    new_res_name = res_file.name.replace(f"_{old}_base.json", f"_{new}_base.json")
+                    staged.append((res_file, resolvers_dir / new_res_name, res, 'resolver'))
+                    resolved = True
+            if resolved:
+                changes.append("resolver (species/model/poser/texture refs, filename)")
+
+        # 5. Posers: bedrock() refs, filename (one regex pass, so swaps can't double-apply)
+        posers = []
+        for old in renames:
+            poser = bedrock / "posers" / f"{old}.json"
+            if poser.exists():
+                text = re.sub(r"bedrock\(([a-z0-9_]+),",
+                              lambda m: f"bedrock({renames.get(m.group(1), m.group(1))},",
+                              poser.read_text(encoding='utf-8'))
+                posers.append((poser, bedrock / "posers" / f"{renames[old]}.json", text))
+        if posers:
+            changes.append("poser (bedrock() refs, filename)")
+
+        # Everything is in memory: write destinations, then drop sources that
+        # aren't also destinations (a→b, b→a leaves both files in place)
+        destinations = {dest for _src, dest, _data, _cls in staged} | {dest for _src, dest, _text in posers}
+        for src, dest, data, file_class in staged:
+            self._write_json(dest, data, file_class)
+        for src, dest, text in posers:
+            dest.write_text(text, encoding='utf-8')
+        for src in {src for src, _dest, _data, _cls in staged} | {src for src, _dest, _text in posers}:
+            if src not in destinations:
+                src.unlink()
+            index.forget(src)
+        for src, dest, data, file_class in staged:
+            index.refresh(dest, data)
+
+        # 6. Model: identifier, file, folder
+        moves = []
+        models_renamed = animations_renamed = textures_renamed = False
+        for old, new in renames.items():
+            old_model_dir = bedrock / "models" / old
+            if not old_model_dir.exists():
+                continue
+            model_file = old_model_dir / f"{old}.geo.json"
+            if model_file.exists():
+                renamed_ids = None
+                if self.json_profile == "dev":
+                    renamed_ids = rewrite_geometry_identifiers(
+                        model_file, model_file,
+                        lambda ident, old=old, new=new: f"geometry.{new}" if ident == f"geometry.{old}" else ident)
+                if renamed_ids is None:
+                    with open(model_file, 'r') as f:
+                        geo = json.load(f)
+                    for g in geo.get("minecraft:geometry", []):
+                        desc = g.get("description", {})
+                        if desc.get("identifier") == f"geometry.{old}":
+                            desc["identifier"] = f"geometry.{new}"
+                    self._write_json(model_file, geo, 'model')
+                model_file.rename(old_model_dir / f"{new}.geo.json")
+            moves.append((old_model_dir, bedrock / "models" / new))
+            models_renamed = True
+
+        # 7. Animation: keys, file, folder
+        for old, new in renames.items():
+            old_anim_dir = bedrock / "animations" / old
+            if not old_anim_dir.exists():
+                continue
+            anim_file = old_anim_dir / f"{old}.animation.json"
+            if anim_file.exists():
+                with open(anim_file, 'r') as f:
+                    anim = json.load(f)
+                anim['animations'] = {
+                    (f"animation.{new}." + k[len(f"animation.{old}."):]
+                     if k.startswith(f"animation.{old}.") else k): v
+                    for k, v in anim.get('animations', {}).items()}
+                self._write_json(anim_file, anim, 'animation')
+                anim_file.rename(old_anim_dir / f"{new}.animation.json")
+            moves.append((old_anim_dir, bedrock / "animations" / new))
+            animations_renamed = True
+
+        # 8. Textures: files, folder
+        for old, new in renames.items():
+            old_tex_dir = tex_root / old
+            if not old_tex_dir.exists():
+                continue
+            for tex in list(old_tex_dir.iterdir()):
+                stem = tex.name.split('.', 1)[0]
+                if stem == old or stem.startswith(f"{old}_"):  # pika.png, pika_shiny.png; not pikachu.png
+                    tex.rename(old_tex_dir / (new + tex.name[len(old):]))
+            moves.append((old_tex_dir, tex_root / new))
+            textures_renamed = True
+
+        move_all(moves)
+        if models_renamed:
+            changes.append("model (geometry identifier, file, folder)")
+        if animations_renamed:
+            changes.append("animation (keys, file, folder)")
+        if textures_renamed:
+            changes.append("textures (files, folder)")
+
+        # 9. Lang: all cobblemon.species.{old}.* keys, one journal update
+        lang_file = (self.resource_pack_dir / "assets" / "cobblemon" /
+                     "lang" / "en_us.json")
+        if lang_file.exists() or self.lang_journal.pending():
+            lang = self.lang_journal.load()
+            renamed = {}
+            for k, v in lang.items():
+                parts = k.split('.', 3)
+                if len(parts) == 4 and parts[:2] == ["cobblemon", "species"] and parts[2] in renames:
+                    k = f"cobblemon.species.{renames[parts[2]]}.{parts[3]}"
+                renamed[k] = v
+            for old, new in renames.items():
+                # Update the display name VALUE too (if it was the auto-generated default)
+                name_key = f"cobblemon.species.{new}.name"
+                if name_key in renamed and f"cobblemon.species.{old}.name" in lang:
+                    if str(renamed[name_key]).lower() == old:
+                        renamed[name_key] = new.title()
+                    else:
+                        print(f"WARNING: Display name '{renamed[name_key]}' looks custom — kept as-is.")
+                        print(f"   Update it manually in en_us.json if it should change.")
+                # Warn if desc prose still mentions the old name (can't safely auto-rewrite)
+                stale = [k for k, v in renamed.items()
+                         if k.startswith(f"cobblemon.species.{new}.desc") and old in str(v).lower()]
+                if stale:
+                    print(f"WARNING: Pokédex text still mentions '{old}' in: {', '.join(stale)}")
+                    print(f"   Update with: --edit {new} --desc1 \"...\" --desc2 \"...\"")
+            if renamed != lang:
+                self.lang_journal.delete([k for k in lang if k not in renamed])
+                self.lang_journal.set({k: v for k, v in renamed.items() if k not in lang or lang[k] != v})
+                changes.append("lang file (name/desc keys)")
+
+        self.compact_lang()
+        metrics.inc("species_renamed", len(renames))
+        return changes
+
+    @trace.traced()
+    def generate_pokemon(self, pokemon_name: str, config: Dict, cleanup: bool = True,
+                         files: Optional[Dict[str, List[Path]]] = None):
+        """Main function to generate Pokémon packs (files: assets to use instead of
+        everything in the pack folder)"""
+        trace.annotate(species=pokemon_name.lower())
+        print(f"\n{'=' * 70}")
+        print(f"Cobblemon Pack Generator - Creating {pokemon_name.upper()}")
+        print(f"{'=' * 70}")
+
+        # Important warning
+        print(f"\nWARNING: IMPORTANT: Keep this Python script OUTSIDE of:")
+        print(f"   {self.base_dir}")
+        print(f"   (Only put your .geo.json, .animation.json, .png files there!)")
+
+        # Find files
+        if files is None:
+            print(f"\nScanning {self.base_dir} for files...")
+            files = self.find_files_in_base_dir(pokemon_name)
+
+        print(f"\nFound:")
+        print(f"  • {len(files['animations'])} animation file(s)")
+        print(f"  • {len(files['models'])} model file(s)")
+        print(f"  • {len(files['textures'])} texture file(s)")
+
+        if not any(files[key] for key in ['animations', 'models', 'textures']):
+            print("\nWARNING: No valid files found! Please add files to:")
+            print(f"    {self.base_dir}")
+            return False
+
+        # Setup directories
+        self.setup_directories(pokemon_name)
+
+        # Organize files (sources that cleanup will delete are linked, not copied;
+        # they stay in the pack folder until generation has succeeded)
+        self.organize_files(pokemon_name, files, consume=cleanup)
+        if self.optimize_pngs:
+            self.optimize_species_textures([pokemon_name])
+
+        # Generate configuration files
+        self.generate_pack_files(pokemon_name, config)
+        self.compact_lang()
+
+        # Info message about head bone
+        if config.get('head_bone', 'head').lower() == 'none':
+            print(f"\nNOTE: Note: No head bone specified")
+            print(f"   - Poser will not include 'head' field")
+            print(f"   - Species 'canLook' automatically set to false")
+
+        # Cleanup if requested
+        if cleanup:
+            self.cleanup_source_files(files)
+
+        print(f"\n{'=' * 70}")
+        print("PACK GENERATION COMPLETE! ")
+        print(f"{'=' * 70}")
+        print(f"\nYour packs are at:")
+        print(f"   Resource Pack: {self.resource_pack_dir}")
+        print(f"   Behavior Pack: {self.behavior_pack_dir}")
+        print(f"\nPack Formats:")
+        print(f"   Resource: {self.RESOURCE_PACK_FORMAT} | Behavior: {self.DATA_PACK_FORMAT}")
+        print(f"   WARNING: Can only combine into one folder if formats match!")
+        print(f"\nAdding More Pokémon:")
+        print(f"   Just run the script again with new files and a new name!")
+        print(f"   It will ADD to the existing packs (won't overwrite)")
+        print(f"\nTIP: Installation:")
+        print(f"   1. Copy resource_pack/ to .minecraft/resourcepacks/")
+        print(f"   2. Copy behavior_pack/ to .minecraft/saves/YourWorld/datapacks/")
+        print(f"   3. In-game: Enable resource pack, /reload")
+        print(f"   4. Test: /pokespawn {pokemon_name.lower()}")
+        print(f"\nTexture Issue?")
+        print(f"   If showing practice dummy, check:")
+        print(f"   - Texture is .png format")
+        print(f"   - Model identifier matches Pokémon name")
+        print(f"   - Both packs are installed AND enabled")
+        print(f"   - Run /reload after installing")
+        print(f"\n{'=' * 70}\n")
+
+        return True
+
+    @trace.traced()
+    def generate_batch(self, entries: List[Dict], cleanup: bool = True, workers: Optional[int] = None,
+                       build: Optional[BuildManifest] = None) -> bool:
+        """Create many Pokémon in one run (see --manifest).
+
+        Each entry is {'name', 'config', 'assets'}; 'assets' is the folder holding
+        that species' model/animation/textures (None = its <name>.* files in the
+        pack folder, see find_species_files; none there = data files only). Per-species
+        work runs on a thread pool and journals its lang keys; pack.mcmeta and
+        en_us.json are written once at the end. With a BuildManifest, species whose
+        inputs are unchanged are skipped and species dropped from it are removed."""
+        print(f"\n{'=' * 70}")
+        print(f"Cobblemon Pack Generator - Batch creating {len(entries)} Pokémon")
+        print(f"{'=' * 70}")
+
+        names = [e['name'].lower() for e in entries]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            print(f"ERROR: Manifest lists these Pokémon more than once: {', '.join(duplicates)}")
+            return False
+        numbers = {}
+        for e in entries:
+            numbers.setdefault(e['config']['pokedex_number'], []).append(e['name'])
+        for number, holders in sorted(numbers.items()):
+            if len(holders) > 1:
+                print(f"WARNING: Dex #{number} is used by {', '.join(holders)}")
+
+        groups = self.find_species_files()
+        jobs = []
+        for e in entries:
+            files = {'animations': [], 'models': [], 'textures': [], 'other': []}
+            if e.get('assets') is not None:
+                files = self.find_files_in_dir(Path(e['assets']))
+            elif e['name'].lower() in groups:
+                files = groups[e['name'].lower()]
+            jobs.append((e, files))
+        self.report_unused_files({key: [f for _e, files in jobs for f in files[key]]
+                                  for key in ['animations', 'models', 'textures', 'other']})
+
+        tga_sources = [t for _e, files in jobs for t in files['textures'] if is_tga_texture(t)]
+        converted = self.convert_tga_sources(tga_sources, workers) if tga_sources else {}
+
+        output = _ThreadLocalStdout(sys.stdout)
+        sys.stdout = output
+        succeeded, unchanged, failed = [], [], []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._generate_batch_species, output, e['name'], e['config'], files,
+                                       cleanup, build, converted): (e, files)
+                           for e, files in jobs}
+                for future in as_completed(futures):
+                    entry, files = futures[future]
+                    log, error, hashes = future.result()
+                    print(log, end='')
+                    if error is not None:
+                        failed.append(entry['name'])
+                    elif hashes is None:
+                        unchanged.append(entry['name'])
+                    else:
+                        succeeded.append((entry, files))
+                        if build is not None:
+                            build.record(entry['name'], *hashes, self.species_outputs(entry['name']))
+        finally:
+            sys.stdout = output.target
+            if converted:
+                shutil.rmtree(self.base_dir / ".tga_convert", ignore_errors=True)
+        if build is not None:
+            metrics.inc("cache_hits", len(unchanged), cache="build")
+            metrics.inc("cache_misses", len(succeeded) + len(failed), cache="build")
+
+        removed = []
+        if build is not None:
+            for name in build.removed(names):
+                self.remove_species_outputs(name, build.outputs(name))
+                build.forget(name)
+                removed.append(name)
+            build.save()
+
+        # Shared files: written once, in manifest order
+        if self.optimize_pngs and succeeded:
+            self.optimize_species_textures([entry['name'] for entry, _files in succeeded], workers)
+
+        if succeeded or removed:
+            print(f"\n  Writing shared pack files...")
+            self.write_pack_mcmeta()
+            self.compact_lang()
+
+        if cleanup:
+            for _entry, files in succeeded:
+                if any(files[key] for key in ['animations', 'models', 'textures']):
+                    self.cleanup_source_files(files)
+
+        print(f"\n{'=' * 70}")
+        if build is None:
+            print(f"BATCH COMPLETE: {len(succeeded)} created, {len(failed)} failed")
+        else:
+            print(f"BATCH COMPLETE: {len(succeeded)} built, {len(unchanged)} unchanged, "
+                  f"{len(removed)} removed, {len(failed)} failed")
+        if removed:
+            print(f"   Removed: {', '.join(removed)}")
+        if failed:
+            print(f"   Failed: {', '.join(sorted(failed))}")
+        print(f"   Resource Pack: {self.resource_pack_dir}")
+        print(f"   Behavior Pack: {self.behavior_pack_dir}")
+        print(f"{'=' * 70}\n")
+        return not failed
+
+    @trace.traced()
+    def apply_edits(self, edits: List[Dict], workers: Optional[int] = None) -> bool:
+        """--apply-edits: run many --edit operations in one process. edits come from
+        load_edit_lines(); they are grouped by species (on a thread pool) so each
+        species/spawn/poser file is loaded once and saved once, and en_us.json is
+        compacted once at the end. One JSON result line per edit goes to stdout
+        (human-readable progress to stderr). True if every edit succeeded."""
+        groups = {}
+        results = []
+        for edit in edits:
+            if 'error' in edit:
+                results.append({'line': edit['line'], 'name': edit['name'], 'ok': False, 'error': edit['error']})
+            else:
+                groups.setdefault(edit['name'].lower(), []).append(edit)
+        for result in results:
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+        output = _ThreadLocalStdout(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self._apply_edit_group, output, name, group)
+                           for name, group in groups.items()]
+                for future in as_completed(futures):
+                    for result in future.result():
+                        results.append(result)
+                        print(json.dumps(result, ensure_ascii=False), flush=True)
+            output.capture()
+            self.compact_lang()
+            print(output.release(), end='', file=sys.stderr)
+        finally:
+            sys.stdout = output.target
+
+        failed = sum(1 for r in results if not r['ok'])
+        if failed:
+            print(f"ERROR: {len(results) - failed} edit(s) applied, {failed} failed "
+                  f"({len(groups)} Pokémon)", file=sys.stderr)
+        else:
+            print(f"[OK] {len(results)} edit(s) applied to {len(groups)} Pokémon", file=sys.stderr)
+        return not failed
+
+    @trace.traced("apply_edit_group")
+    def _apply_edit_group(self, output: _ThreadLocalStdout, name: str, group: List[Dict]) -> List[Dict]:
+        """Worker for apply_edits: every edit for one species applied in memory, then
+        one commit. If any edit raises or reports an error (a value it couldn't
+        apply, see _apply_edit), nothing is saved for that species."""
+        trace.annotate(species=name)
+        species_file = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{name}.json"
+        if not species_file.exists():
+            metrics.inc("edits_failed", len(group))
+            return [{'line': e['line'], 'name': e['name'], 'ok': False, 'error': f"Pokémon '{name}' not found"}
+                    for e in group]
+        txn = PackTransaction()
+        lang_updates = {}
+        results = []
+        try:
+            data = txn.load(species_file)
+            for edit in group:
+                errors = []
+                output.capture()
+                try:
+                    changes = self._apply_edit(name, data, txn, lang_updates, edit['args'], errors)
+                finally:
+                    log = output.release()
+                if errors:
+                    # A value that couldn't be applied fails the line like an exception would
+                    raise ValueError(errors[0])
+                notes = [line.strip() for line in log.splitlines() if line.strip().startswith(('WARNING', 'NOTE'))]
+                results.append({'line': edit['line'], 'name': name, 'ok': True,
+                                'changes': changes, 'warnings': notes})
+            txn.set(species_file, data, 'species')
+            for path, written in txn.commit(self._write_json).items():
+                self._index_refresh(path, written)
+            self.lang_journal.set(lang_updates)
+        except Exception as e:
+            metrics.inc("edits_failed", len(group))
+            failed_line = group[len(results)]['line'] if len(results) < len(group) else None
+            reason = f"line {failed_line}: {e}" if failed_line else f"saving: {e}"
+            return [{'line': edit['line'], 'name': name, 'ok': False,
+                     'error': f"nothing saved for {name} ({reason})"} for edit in group]
+        metrics.inc("species_edited")
+        metrics.inc("edit_changes", sum(len(r['changes']) for r in results))
+        return results
+
+    @trace.traced("batch_species")
+    def _generate_batch_species(self, output: _ThreadLocalStdout, pokemon_name: str, config: Dict,
+                                files: Dict[str, List[Path]], consume: bool = False,
+                                build: Optional[BuildManifest] = None,
+                                converted: Optional[Dict[Path, Path]] = None):
+        """Worker for generate_batch: per-species files only, output buffered.
+        Returns (log, error, (input hash, assets hash)); the hashes are None when
+        the build manifest says the species is unchanged and nothing was written."""
+        output.capture()
+        trace.annotate(species=pokemon_name.lower())
+        error = None
+        hashes = (None, None)
+        try:
+            if build is not None:
+                hashes = (BuildManifest.input_hash(config, self.json_profile), BuildManifest.assets_hash(files))
+                if not build.is_dirty(pokemon_name, *hashes):
+                    return output.release(), None, None
+            self.setup_directories(pokemon_name)
+            self.organize_files(pokemon_name, files, consume=consume, converted=converted)
+            self.write_species_files(pokemon_name, config)
+            self.add_lang_entries(self.create_lang_entries(pokemon_name, config))
+        except Exception as e:
+            error = e
+            print(f"ERROR: {pokemon_name} failed: {e}")
+        return output.release(), error, hashes
+
+    @trace.traced()
+    def convert_tga_sources(self, textures: List[Path], workers: Optional[int] = None) -> Dict[Path, Path]:
+        """Convert TGA sources to PNGs in base_dir/.tga_convert/ on a process pool
+        (decoding is CPU-bound pure Python). Returns {source: converted PNG};
+        failures are left out, so organize_files retries them and reports why."""
+        scratch = self.base_dir / ".tga_convert"
+        scratch.mkdir(parents=True, exist_ok=True)
+        targets = {src: scratch / f"{i}_{src.stem}.png" for i, src in enumerate(textures)}
+        print(f"\n  Converting {len(textures)} TGA texture(s) to PNG...")
+        converted = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(convert_tga_to_png, src, dest): src for src, dest in targets.items()}
+            for future in as_completed(futures):
+                src = futures[future]
+                try:
+                    future.result()
+                    converted[src] = targets[src]
+                except (OSError, ValueError):
+                    pass
+        return converted
+
+    @trace.traced()
+    def optimize_species_textures(self, names: List[str], workers: Optional[int] = None,
+                                  prune: bool = False) -> bool:
+        """Losslessly recompress the installed PNGs of these species (--optimize-png)
+        on a process pool. Results are cached in .png_cache/ by input hash, so each
+        texture is only ever optimized once; prints bytes before/after per species.
+        prune=True (names is the whole pack) also evicts the cache entries that no
+        installed texture's bytes hash to."""
+        cache_dir = self.base_dir / ".png_cache"
+        textures = {}
+        for name in names:
+            tex_dir = self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / name.lower()
+            if tex_dir.is_dir():
+                textures[name.lower()] = sorted(Path(e.path) for e in os.scandir(tex_dir)
+                                                if e.is_file() and e.name.lower().endswith('.png'))
+        if not any(textures.values()):
+            return True
+
+        print(f"\nOptimizing PNG textures...")
+        jobs, results = {}, {}  # path -> (input bytes, digest); path -> optimized bytes
+        live = set()  # digests of the installed textures, before and after
+        for paths in textures.values():
+            for path in paths:
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                live.add(digest)
+                optimized, keep = cache_dir / f"{digest}.png", cache_dir / f"{digest}.keep"
+                if optimized.exists():
+                    results[path] = optimized.read_bytes()
+                elif keep.exists():
+                    results[path] = data
+                else:
+                    jobs[path] = (data, digest)
+
+        ok = True
+        if jobs:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(optimize_png, data): path for path, (data, _digest) in jobs.items()}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    data, digest = jobs[path]
+                    try:
+                        result = future.result()
+                    except (ValueError, zlib.error) as e:
+                        print(f"  WARNING: {path.name}: not optimized ({e})")
+                        ok = False
+                        result = data
+                    results[path] = result
+                    if result is not data:
+                        # Written beside and swapped in: a run killed mid-write
+                        # must not leave a truncated entry that later runs trust
+                        temp = cache_dir / f".{digest}.png.tmp"
+                        temp.write_bytes(result)
+                        os.replace(temp, cache_dir / f"{digest}.png")
+                    # Either way the result is final: never optimize these bytes again
+                    (cache_dir / f"{hashlib.sha256(result).hexdigest()}.keep").touch()
+
+        metrics.inc("cache_hits", sum(map(len, textures.values())) - len(jobs), cache="png")
+        metrics.inc("cache_misses", len(jobs), cache="png")
+        total_before = total_after = 0
+        for name, paths in sorted(textures.items()):
+            before = after = 0
+            for path in paths:
+                size = path.stat().st_size
+                result = results[path]
+                if len(result) < size:
+                    temp = path.with_name(f".{path.name}.tmp")
+                    temp.write_bytes(result)
+                    os.replace(temp, path)
+                before += size
+                after += min(size, len(result))
+            if paths:
+                saved = (before - after) * 100 // before if before else 0
+                print(f"  [OK] {name}: {before:,} → {after:,} bytes (-{saved}%)")
+            total_before += before
+            total_after += after
+        print(f"[OK] Textures optimized: {total_before:,} → {total_after:,} bytes "
+              f"({len(jobs)} recompressed, {sum(map(len, textures.values())) - len(jobs)} from cache)")
+
+        if prune and cache_dir.is_dir():
+            live.update(hashlib.sha256(result).hexdigest() for result in results.values())
+            evicted = 0
+            for entry in os.scandir(cache_dir):
+                if entry.is_file() and (entry.name.startswith('.') or entry.name.split('.', 1)[0] not in live):
+                    os.unlink(entry.path)
+                    evicted += 1
+            if evicted:
+                print(f"  NOTE: Removed {evicted} .png_cache entr{'y' if evicted == 1 else 'ies'} "
+                      f"no texture in the pack uses")
+        return ok
+
+    def texture_species(self) -> List[str]:
+        """Names of every species folder under textures/pokemon/"""
+        tex_root = self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon"
+        if not tex_root.is_dir():
+            return []
+        return sorted(entry.name for entry in os.scandir(tex_root) if entry.is_dir())
+
+    def species_asset_dirs(self, pokemon_name: str) -> List[Path]:
+        """The per-species model, animation and texture folders"""
+        pokemon_lower = pokemon_name.lower()
+        bedrock = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+        return [bedrock / "models" / pokemon_lower, bedrock / "animations" / pokemon_lower,
+                self.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / pokemon_lower]
+
+    def species_outputs(self, pokemon_name: str) -> List[Path]:
+        """Every pack file generated for one species (lang keys aside)"""
+        pokemon_lower = pokemon_name.lower()
+        bedrock = self.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+        outputs = [
+            self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{pokemon_lower}.json",
+            self.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" / f"{pokemon_lower}.json",
+            bedrock / "posers" / f"{pokemon_lower}.json",
+            bedrock / "resolvers" / f"0_{pokemon_lower}_base.json",
+        ]
+        for asset_dir in self.species_asset_dirs(pokemon_name):
+            if asset_dir.is_dir():
+                outputs.extend(sorted(Path(entry.path) for entry in os.scandir(asset_dir) if entry.is_file()))
+        return outputs
+
+    def remove_species_outputs(self, pokemon_name: str, outputs: List[Path]):
+        """Delete a species' generated files and lang keys (see BuildManifest)"""
+        print(f"\nRemoving {pokemon_name} (no longer in the manifest)...")
+        for output in outputs:
+            if not output.exists():
+                continue
+            output.unlink()
+            self._index_forget(output)
+            print(f"  [OK] Deleted: {output.relative_to(self.base_dir)}")
+        for asset_dir in self.species_asset_dirs(pokemon_name):
+            try:
+                asset_dir.rmdir()  # only if empty: files added by hand stay
+            except OSError:
+                pass
+        self.lang_journal.delete([f"cobblemon.species.{pokemon_name}.{key}" for key in ['name', 'desc1', 'desc2']])
+
+    def _watch_snapshot(self) -> Dict[str, tuple]:
+        """{file name: (size, mtime_ns)} for the asset files in base_dir (one scandir, stat only)"""
+        snapshot = {}
+        try:
+            entries = list(os.scandir(self.base_dir))
+        except FileNotFoundError:
+            return snapshot
+        for entry in entries:
+            if entry.name.startswith('.') or entry.name.endswith('.py'):
+                continue
+            if self.classify_file(entry.name) == 'other':
+                continue
+            try:
+                if entry.is_file():
+                    st = entry.stat()
+                    snapshot[entry.name] = (st.st_size, st.st_mtime_ns)
+            except FileNotFoundError:
+                continue  # removed between scandir and stat
+        return snapshot
+
+    def watch(self, load_manifest_configs=None, poll: float = WATCH_POLL_SECONDS,
+              settle: float = WATCH_SETTLE_SECONDS):
+        """Poll base_dir and ingest asset drops until interrupted (--watch).
+
+        Files are grouped by species (asset_species). Once a species has a model,
+        an animation and a base texture that have all stopped changing for
+        `settle` seconds, an existing species gets the edit_files swap and a new
+        one is created with generate_pokemon, if load_manifest_configs() (called
+        again whenever it may have changed) has a row for it. Files already there
+        at startup, and the backups edit_files moves out, are left alone until
+        they change. A species whose ingest raises or returns False is reported
+        and skipped until one of its files changes again."""
+        print(f"\n{'=' * 70}")
+        print(f"Watching {self.base_dir} (Ctrl+C to stop)")
+        print(f"{'=' * 70}")
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        baseline = self._watch_snapshot()
+        if baseline:
+            print(f"  NOTE: {len(baseline)} asset file(s) already present — ignored until they change")
+        last_seen, changed_at, waiting = {}, {}, set()
+        failed = {}  # species -> {file name: signature} of the drop that raised
+        configs = {}
+
+        try:
+            while True:
+                time.sleep(poll)
+                now = time.monotonic()
+                snapshot = self._watch_snapshot()
+                for name, sig in snapshot.items():
+                    if last_seen.get(name) != sig:
+                        changed_at[name] = now
+                last_seen = snapshot
+
+                groups = {}
+                for name, sig in snapshot.items():
+                    if baseline.get(name) != sig:
+                        groups.setdefault(asset_species(name), []).append(name)
+
+                for species, names in sorted(groups.items()):
+                    if any(now - changed_at[name] < settle for name in names):
+                        continue  # still being written
+                    if failed.get(species) == {name: snapshot[name] for name in names}:
+                        continue  # failed before and nothing changed since
+                    files = {'animations': [], 'models': [], 'textures': [], 'other': []}
+                    for name in sorted(names):
+                        files[self.classify_file(name)].append(self.base_dir / name)
+                    has_base_texture = any('shiny' not in t.name.lower() for t in files['textures'])
+                    if not (files['models'] and files['animations'] and has_base_texture):
+                        continue  # wait for the rest of the set
+
+                    species_file = self.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{species}.json"
+                    try:
+                        if species_file.exists():
+                            ok = self.edit_files(species, files)
+                        else:
+                            if load_manifest_configs is not None:
+                                try:
+                                    configs = load_manifest_configs()
+                                except (OSError, ValueError) as e:
+                                    print(f"  WARNING: Could not read the manifest: {e}")
+                            entry = configs.get(species)
+                            if entry is None:
+                                if species not in waiting:
+                                    print(f"  NOTE: New files for '{species}', but it isn't in the pack or the "
+                                          f"manifest — add a manifest row or create it by hand")
+                                    waiting.add(species)
+                                continue
+                            ok = self.generate_pokemon(entry['name'], entry['config'], cleanup=True, files=files)
+                        error = None if ok else "see the messages above"
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                    if error is not None:
+                        # One bad drop must not stop the watcher: report it and leave
+                        # this species alone until one of its files is saved again
+                        print(f"  ERROR: {species} failed: {error}")
+                        print(f"  NOTE: Fix the files and save them again to retry '{species}'")
+                        failed[species] = {name: snapshot[name] for name in names}
+                        continue
+                    failed.pop(species, None)
+                    waiting.discard(species)
+                    baseline = self._watch_snapshot()
+                    last_seen = baseline
+        except KeyboardInterrupt:
+            print("\nWatch stopped.")
@@ -0,0 +1,167 @@
+"""Run metrics for CI and nightly batch builds (--metrics-textfile, --metrics-log).
+
+The generator counts what it does as it goes (inc() / timed(); a lock and a
+dict update, always on). At the end of a run the CLI can write:
+  - a Prometheus textfile (node_exporter textfile collector format): counters
+    accumulate across runs, so rate()/increase() work; last-run gauges are
+    replaced
+  - one JSON line per run appended to a log: that run's counts, cache hit
+    rates and duration, for trend charts over many builds
+
+Counter names are given without prefix or _total ("species_generated"); labels
+as keyword arguments (inc("cache_hits", cache="index"))."""
+
+import os
+import re
+import json
+import time
+import threading
+import contextlib
+from pathlib import Path
+from typing import Dict, Optional
+
+PREFIX = "packgen_"
+HELP = {
+    "runs": "Generator runs",
+    "run_seconds": "Wall time of generator runs",
+    "species_generated": "Species whose pack files were generated",
+    "species_edited": "Species saved by --edit, --apply-edits or --where --set",
+    "edit_changes": "Individual field changes saved by edits",
+    "edits_failed": "Edits that saved nothing because of an error",
+    "species_renamed": "Species renamed",
+    "asset_swaps": "Species whose asset files were swapped (--editfiles)",
+    "model_bytes_processed": "Bytes of model (.geo.json) files ingested",
+    "animation_bytes_processed": "Bytes of animation files ingested",
+    "textures_ingested": "Texture files installed",
+    "textures_converted": "TGA textures converted to PNG",
+    "json_files_written": "Pack JSON files written",
+    "json_bytes_written": "Bytes of pack JSON written",
+    "cache_hits": "Lookups answered from a cache (index, zip, png, build)",
+    "cache_misses": "Lookups a cache could not answer",
+    "lang_merges": "Times the lang journal was merged into en_us.json",
+    "lang_merge_seconds": "Time spent merging the lang journal into en_us.json",
+}
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}  # (name, ((label, value), ...)) -> amount
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    @contextlib.contextmanager
+    def timed(self, name: str, **labels):
+        """Add the time spent in the with-block to counter name (seconds)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inc(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[tuple, float]:
+        with self._lock:
+            return dict(self.counters)
+
+
+METRICS = Metrics()
+inc = METRICS.inc
+timed = METRICS.timed
+
+
+def sample_name(name: str, labels: tuple, suffix: str = "_total") -> str:
+    """packgen_<name>_total{label="value"}"""
+    text = ",".join(f'{key}="{str(value)}"' for key, value in labels)
+    return f"{PREFIX}{name}{suffix}" + (f"{{{text}}}" if text else "")
+
+
+def hit_rates(counters: Dict[tuple, float]) -> Dict[str, float]:
+    """{cache: hits / lookups} for every cache that was consulted"""
+    hits, lookups = {}, {}
+    for (name, labels), value in counters.items():
+        if name in ("cache_hits", "cache_misses"):
+            cache = dict(labels).get("cache", "")
+            lookups[cache] = lookups.get(cache, 0) + value
+            if name == "cache_hits":
+                hits[cache] = hits.get(cache, 0) + value
+    return {cache: round(hits.get(cache, 0) / total, 4) for cache, total in sorted(lookups.items()) if total}
+
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*(?:\{[^}]*\})?)\s+(\S+)')
+
+
+def read_textfile(path: Path) -> Dict[str, float]:
+    """Sample values from an earlier textfile ({} if missing or unreadable)"""
+    values = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = _SAMPLE.match(line)
+                if match and not line.startswith('#'):
+                    try:
+                        values[match.group(1)] = float(match.group(2))
+                    except ValueError:
+                        pass
+    except OSError:
+        pass
+    return values
+
+
+def write_textfile(path: str, run: Dict, counters: Dict[tuple, float]):
+    """Add this run's counters to the totals already in the textfile and replace
+    the last-run gauges; written to a temp file and renamed in (the collector
+    must never see a half-written file)."""
+    path = Path(path)
+    previous = read_textfile(path)
+    totals = {}
+    for (name, labels), value in counters.items():
+        totals.setdefault(name, {})[sample_name(name, labels)] = value
+    totals.setdefault("runs", {})[sample_name("runs", (("status", run['status']),))] = 1
+    for sample, value in previous.items():  # keep counters this run didn't touch
+        name = sample[len(PREFIX):].split('{')[0]
+        if sample.startswith(PREFIX) and name.endswith("_total"):
+            family = totals.setdefault(name[:-len("_total")], {})
+            family[sample] = family.get(sample, 0) + value
+
+    lines = []
+    for name in sorted(totals):
+        lines.append(f"# HELP {PREFIX}{name}_total {HELP.get(name, name.replace('_', ' '))}")
+        lines.append(f"# TYPE {PREFIX}{name}_total counter")
+        lines += [f"{sample} {format_value(value)}" for sample, value in sorted(totals[name].items())]
+    gauges = [("last_run_timestamp_seconds", "When the last run finished", run['finished']),
+              ("last_run_duration_seconds", "Wall time of the last run", run['duration_seconds']),
+              ("last_run_success", "1 if the last run succeeded", 1 if run['status'] == "ok" else 0)]
+    for name, help_text, value in gauges:
+        lines += [f"# HELP {PREFIX}{name} {help_text}", f"# TYPE {PREFIX}{name} gauge",
+                  f'{PREFIX}{name}{{command="{run["command"]}"}} {format_value(value)}']
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.tmp")
+    temp.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    os.replace(temp, path)
+
+
+def append_log(path: str, run: Dict, counters: Dict[tuple, float]):
+    """Append one JSON line for this run"""
+    record = dict(run)
+    record['counters'] = {sample_name(name, labels, suffix="")[len(PREFIX):]: round(value, 6)
+                          for (name, labels), value in sorted(counters.items())}
+    record['cache_hit_rates'] = hit_rates(counters)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(round(value, 6))
+
+
+def run_record(command: str, argv: list, started: float, status: str, version: str,
+               exit_code: Optional[int] = None) -> Dict:
+    finished = time.time()
+    return {'finished': round(finished, 3), 'duration_seconds': round(finished - started, 4),
+            'command': command, 'argv': argv, 'status': status, 'exit_code': exit_code,
+            'generator_version': version}
@@ -0,0 +1,449 @@
+"""Command-line options (build_parser) and the conversions built on the same
+definitions: --manifest rows to creation configs, --apply-edits lines and
+library option dicts to --edit arguments."""
+
+import os
+import io
+import csv
+import json
+import argparse
+import contextlib
+from pathlib import Path
+from typing import Dict, List
+
+from .generator import GENERATOR_VERSION, JSON_PROFILES
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (also used to parse --manifest rows)"""
+    parser = argparse.ArgumentParser(
+        description='Generate Cobblemon packs with full customization',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Basic Pokémon
+  python cobblemon_pack_generator.py --name Flamebird --number 999
+
+  # With custom stats and type
+  python cobblemon_pack_generator.py --name Aquadragon --number 1000 \\
+    --primary-type water --secondary-type dragon \\
+    --hp 100 --attack 80 --defence 90
+
+  # With moves and abilities
+  python cobblemon_pack_generator.py --name Earthgolem --number 1001 \\
+    --moves "1:tackle,7:rockthrow,20:earthquake,tm:stoneedge" \\
+    --abilities "sturdy,h:sandforce"
+
+  # Flying/Swimming Pokémon
+  python cobblemon_pack_generator.py --name Skywhale --number 1002 \\
+    --can-fly --can-swim --breathe-underwater
+        """
+    )
+
+    # Required arguments (unless using --show-current-pokemon)
+    parser.add_argument('--name', type=str, help='Pokémon name')
+    parser.add_argument('--number', type=int, help='Pokédex number')
+
+    # Type arguments
+    parser.add_argument('--primary-type', type=str, default=None, help='Primary type (default: normal on create)')
+    parser.add_argument('--secondary-type', type=str, help='Secondary type (optional)')
+
+    # Stats
+    parser.add_argument('--hp', type=int, default=None, help='HP stat (default: 50 on create)')
+    parser.add_argument('--attack', type=int, default=None, help='Attack stat (default: 50 on create)')
+    parser.add_argument('--defence', type=int, default=None, help='Defence stat (default: 50 on create)')
+    parser.add_argument('--special-attack', type=int, default=None, help='Special Attack (default: 50 on create)')
+    parser.add_argument('--special-defence', type=int, default=None, help='Special Defence (default: 50 on create)')
+    parser.add_argument('--speed', type=int, default=None, help='Speed stat (default: 50 on create)')
+
+    # Moves and abilities
+    parser.add_argument('--moves', type=str, help='Comma-separated moves (e.g. "1:tackle,7:ember,tm:flamethrower")')
+    parser.add_argument('--abilities', type=str, help='Comma-separated abilities (e.g. "blaze,h:solar_power")')
+
+    # Physical properties
+    parser.add_argument('--height', type=int, default=None, help='Height in decimeters (default: 10 on create)')
+    parser.add_argument('--weight', type=int, default=None, help='Weight in hectograms (default: 100 on create)')
+
+    # Movement abilities
+    parser.add_argument('--can-fly', action='store_true', help='Pokémon can fly')
+    parser.add_argument('--can-swim', action='store_true', help='Pokémon can swim')
+    parser.add_argument('--breathe-underwater', action='store_true', help='Can breathe underwater')
+    parser.add_argument('--no-look', action='store_true', help='Pokémon cannot look around (canLook=false)')
+
+    # Spawn configuration
+    parser.add_argument('--rarity', type=str, default=None, choices=['common', 'uncommon', 'rare', 'ultra-rare'],
+                        help='Spawn rarity (default: common on create)')
+    parser.add_argument('--spawn-level', type=str, default=None, help='Spawn level range (e.g. "10-40"; default: 5-30 on create)')
+    parser.add_argument('--spawn-biomes', type=str, default=None,
+                        help='Comma-separated biome tags (default: #minecraft:is_overworld on create)')
+
+    # Descriptions
+    parser.add_argument('--desc1', type=str, help='First Pokédex entry')
+    parser.add_argument('--desc2', type=str, help='Second Pokédex entry')
+
+    # Legendary/Mythical
+    parser.add_argument('--legendary', action='store_true',
+                        help='Make this a legendary Pokémon (sets catchRate=3, baseExp=290, adds legendary label)')
+
+    # Evolution
+    parser.add_argument('--evo-target', type=str, help='Pokémon this evolves into (e.g. "brightfix")')
+    parser.add_argument('--evo-method', type=str, choices=['level_up', 'item_interact', 'trade'],
+                        default='level_up', help='Evolution method (default: level_up)')
+    parser.add_argument('--evo-level', type=int, default=36, help='Level to evolve at (default: 36)')
+    parser.add_argument('--evo-item', type=str, help='Item required for item_interact or trade evolution')
+    parser.add_argument('--pre-evolution', type=str, help='Pokémon this evolves from (e.g. "grayfix")')
+    parser.add_argument('--remove-evolutions', action='store_true',
+                        help='(edit mode) Remove ALL evolutions from the Pokémon')
+
+    # Species fields (work in BOTH create and edit modes)
+    parser.add_argument('--catch-rate', '--catchrate', type=int, default=None, dest='catch_rate',
+                        help='Catch rate 3-255 (default: 45 on create; 3=legendary-hard, 255=trivial)')
+    parser.add_argument('--male-ratio', type=float, default=None,
+                        help='Male ratio -1 to 1 (-1=genderless, 0=all female, 1=all male; default: 0.5 on create)')
+    parser.add_argument('--exp-group', type=str, default=None,
+                        help='Experience group (default: medium_fast on create)')
+    parser.add_argument('--egg-cycles', type=int, default=None,
+                        help='Egg cycles (default: 20 on create)')
+    parser.add_argument('--egg-groups', type=str, default=None,
+                        help='Comma-separated egg groups (default: field on create)')
+    parser.add_argument('--base-exp', type=int, default=None,
+                        help='Base experience yield (default: 100 on create)')
+    parser.add_argument('--friendship', type=int, default=None,
+                        help='Base friendship (default: 50 on create)')
+    parser.add_argument('--ev-yield', type=str, default=None,
+                        help='EV yield, e.g. "speed:2" or "attack:1,hp:1" (default: hp:1 on create)')
+    parser.add_argument('--drops', type=str, default=None,
+                        help='Item drops, e.g. "minecraft:redstone:50,cobblemon:exp_candy_xs:10" (item:percentage)')
+    parser.add_argument('--base-scale', type=float, default=None,
+                        help='Model scale multiplier')
+    parser.add_argument('--hitbox', type=str, default=None,
+                        help='Hitbox "width,height" (e.g. "1.5,2")')
+    parser.add_argument('--spawn-weight', type=float, default=None,
+                        help='Spawn weight (default: 10 on create, 0.05 for legendary)')
+    parser.add_argument('--can-see-sky', type=str, default=None, choices=['true', 'false'],
+                        help='Spawn condition: false = underground/cave spawner')
+    # Spawn entry management (edit mode only)
+    parser.add_argument('--append', type=str, default=None, metavar='SPAWNENTRY', dest='append_spawn',
+                        help='(edit) Append a spawn entry: "bucket=rare,level=20-40,weight=5,'
+                             'biomes=#minecraft:is_savanna;#minecraft:is_badlands,canSeeSky=false" or JSON')
+    parser.add_argument('--removespawn', type=int, default=None, metavar='IDX',
+                        help='(edit) Remove spawn entry by 1-based index (as shown by the pack checker)')
+    parser.add_argument('--removelastspawn', action='store_true',
+                        help='(edit) Remove the last spawn entry')
+    parser.add_argument('--spawnset', type=str, default=None,
+                        help='(edit) REPLACE the whole spawns array. Entries separated by "|" in '
+                             'key=value form, or a JSON array. Requires --confirmset.')
+    parser.add_argument('--confirmset', action='store_true',
+                        help='Confirm a --spawnset replacement (without it you get a preview only)')
+
+    parser.add_argument('--not-legendary', action='store_true',
+                        help='(edit mode) Remove legendary status')
+    parser.add_argument('--add-moves', type=str, default=None,
+                        help='(edit mode) APPEND moves to the existing list (unlike --moves which replaces)')
+
+    # Model customization
+    parser.add_argument('--version', action='version',
+                        version=f'Cobblemon Pack Generator v{GENERATOR_VERSION}')
+    parser.add_argument('--head-bone', type=str, default=None,
+                        help='Head bone name (use "none" if model has no head; default: "head" on create)')
+
+    # Other options
+    parser.add_argument('--downloads', type=str, help='Custom Downloads path')
+    parser.add_argument('--no-cleanup', action='store_true', help='Keep source files')
+    parser.add_argument('--show-current-pokemon', action='store_true', help='Show all Pokémon currently in the packs')
+    parser.add_argument('--edit', type=str, help='Edit an existing Pokémon (use Pokémon name)')
+    parser.add_argument('--rename', type=str,
+                        help='(with --edit) Rename the Pokémon across ALL files/references')
+    parser.add_argument('--where', type=str, metavar='QUERY',
+                        help='Select Pokémon for a bulk edit, e.g. "primaryType=fire,labels~legendary,baseStats.hp>=100" '
+                             '(ops: = != ~ < > <= >=). Alone it lists the matches')
+    parser.add_argument('--set', type=str, metavar='FIELDS',
+                        help='(with --where) Fields to set on every match, e.g. "catchRate=90,spawn.weight=0.02" '
+                             '(spawn.* applies to each spawn entry). Preview unless --confirm')
+    parser.add_argument('--confirm', action='store_true',
+                        help='(with --where/--set) Apply the previewed changes')
+    parser.add_argument('--serve', nargs='?', const='', default=None, metavar='SOCKET',
+                        help='Run as a JSON-RPC server (create, edit, rename, editfiles, show, check) on a '
+                             'Unix socket, or stdin/stdout if no path is given')
+    parser.add_argument('--apply-edits', type=str, metavar='JSONL',
+                        help='Apply many edits in one run: one JSON object per line, {"name": ..., <--edit options>} '
+                             '(use - for stdin); prints one JSON result line per edit')
+    parser.add_argument('--rename-map', type=str, metavar='CSV',
+                        help='Rename many Pokémon in one pass from an old,new CSV (chains and swaps allowed)')
+    parser.add_argument('--editfiles', type=str, metavar='POKEMON',
+                        help='Swap in new model/animation/texture files from the pack folder '
+                             '(old files are moved out; run again to undo). Several: a,b,c or all')
+    parser.add_argument('--manifest', type=str, metavar='FILE',
+                        help='Create every species listed in a .json/.yaml/.csv manifest in one run '
+                             '(one row per species; columns are the creation flags, e.g. name, number, hp)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='(with --manifest/--apply-edits/--where/--check/--check-textures/--optimize-png) '
+                             'Number of parallel workers (default: automatic)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and ingest model/animation/texture sets as they are dropped in the '
+                             'pack folder (existing species: --editfiles swap; new species: created from --manifest)')
+    parser.add_argument('--check', action='store_true',
+                        help='Validate the whole pack (resolvers, posers, models, animations, textures, evolutions, '
+                             'spawns, lang) and exit non-zero on errors')
+    parser.add_argument('--check-textures', action='store_true',
+                        help='Check every texture (PNG/TGA header only: format, size vs the model\'s '
+                             'texture_width/height) and exit non-zero on errors')
+    parser.add_argument('--optimize-png', action='store_true',
+                        help='Losslessly recompress PNG textures (strip extra chunks, best row filters, max zlib). '
+                             'Alone: the whole pack; with create/--manifest/--editfiles/--export-zip: those textures')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='(with --manifest) Regenerate every species, not just the ones whose row or assets changed')
+    parser.add_argument('--defer-lang', action='store_true',
+                        help='Journal lang changes without rewriting en_us.json (finish with --compact-lang)')
+    parser.add_argument('--compact-lang', action='store_true',
+                        help='Write all journaled lang changes into en_us.json')
+    parser.add_argument('--profile', type=str, default='dev', choices=sorted(JSON_PROFILES),
+                        help='JSON output: dev = indented (default), release = minified, sorted keys, '
+                             'rounded floats, with a bytes-saved report')
+    parser.add_argument('--no-index-cache', action='store_true',
+                        help='Re-read every pack file instead of using the .pack_index_cache.sqlite cache')
+    parser.add_argument('--profile-out', type=str, metavar='TRACE.json',
+                        help='Record per-phase timing and file I/O of this run and save it as a Chrome/Perfetto '
+                             'trace (open in https://ui.perfetto.dev)')
+    parser.add_argument('--metrics-textfile', type=str, metavar='FILE.prom',
+                        help='At exit, add this run\'s counters to a Prometheus textfile (node_exporter '
+                             'textfile collector); totals accumulate across runs')
+    parser.add_argument('--metrics-log', type=str, metavar='FILE.jsonl',
+                        help='At exit, append one JSON line with this run\'s counters, cache hit rates and duration')
+    parser.add_argument('--export-zip', type=str, nargs='?', const='', default=None, metavar='DIR',
+                        help='Write resource_pack.zip and behavior_pack.zip (default DIR: '
+                             'Mod-ResourceAndBehavior-Packs/dist); unchanged files are not recompressed')
+
+    return parser
+
+
+def build_create_config(args) -> Dict:
+    """Build the creation config from parsed arguments, applying creation defaults"""
+    config = {
+        'pokedex_number': args.number,
+        'primary_type': args.primary_type if args.primary_type is not None else 'normal',
+        'secondary_type': args.secondary_type,
+        'hp': args.hp if args.hp is not None else 50,
+        'attack': args.attack if args.attack is not None else 50,
+        'defence': args.defence if args.defence is not None else 50,
+        'special_attack': args.special_attack if args.special_attack is not None else 50,
+        'special_defence': args.special_defence if args.special_defence is not None else 50,
+        'speed': args.speed if args.speed is not None else 50,
+        'moves': args.moves,
+        'abilities': args.abilities,
+        'height': args.height if args.height is not None else 10,
+        'weight': args.weight if args.weight is not None else 100,
+        'can_fly': args.can_fly,
+        'can_swim': args.can_swim,
+        'breathe_underwater': args.breathe_underwater,
+        'can_look': not args.no_look,  # Inverted: --no-look sets canLook to false
+        'rarity': args.rarity if args.rarity is not None else 'common',
+        'spawn_level': args.spawn_level if args.spawn_level is not None else '5-30',
+        'spawn_biomes': args.spawn_biomes if args.spawn_biomes is not None else '#minecraft:is_overworld',
+        'desc1': args.desc1,
+        'desc2': args.desc2,
+        'head_bone': args.head_bone if args.head_bone is not None else 'head',
+        'legendary': args.legendary,
+        'evo_target': args.evo_target,
+        'evo_method': args.evo_method,
+        'evo_level': args.evo_level,
+        'evo_item': args.evo_item,
+        'pre_evolution': args.pre_evolution,
+        'catch_rate': args.catch_rate if args.catch_rate is not None else 45,
+        'male_ratio': args.male_ratio if args.male_ratio is not None else 0.5,
+        'exp_group': args.exp_group if args.exp_group is not None else 'medium_fast',
+        'egg_cycles': args.egg_cycles if args.egg_cycles is not None else 20,
+        'egg_groups': ([g.strip() for g in args.egg_groups.split(',')]
+                       if args.egg_groups is not None else ['field']),
+        'base_exp': args.base_exp if args.base_exp is not None else 100,
+        'friendship': args.friendship if args.friendship is not None else 50,
+        'ev_yield_spec': args.ev_yield,
+        'drops_spec': args.drops,
+        'base_scale': args.base_scale,
+        'hitbox_spec': args.hitbox,
+        'spawn_surface': (args.can_see_sky != 'false') if args.can_see_sky is not None else True,
+        'spawn_weight': args.spawn_weight if args.spawn_weight is not None else 10.0,
+    }
+
+    # Apply legendary settings if --legendary flag is used
+    if args.legendary:
+        config['catch_rate'] = 3  # Hard to catch (like Mewtwo)
+        config['base_exp'] = 290  # High experience yield
+        config['labels'] = ['custom', 'legendary']
+        config['friendship'] = 0  # Starts unfriendly
+        if args.spawn_weight is None:
+            config['spawn_weight'] = 0.05  # Extremely rare spawn
+
+        # Auto-set ultra-rare if not specified
+        if args.rarity == 'common':  # Default value
+            config['rarity'] = 'ultra-rare'
+
+    return config
+
+
+# Columns a manifest row may NOT use (commands and edit-only flags)
+MANIFEST_EXCLUDED_DESTS = {"help", "version", "manifest", "workers", "rebuild", "watch", "check", "check_textures",
+                           "optimize_png", "downloads", "no_cleanup", "no_index_cache",
+                           "defer_lang", "compact_lang", "profile", "export_zip",
+                           "show_current_pokemon", "edit", "rename", "rename_map", "where", "set", "confirm",
+                           "editfiles", "apply_edits", "serve", "profile_out",
+                           "metrics_textfile", "metrics_log",
+                           "append_spawn", "removespawn", "removelastspawn", "spawnset", "confirmset",
+                           "not_legendary", "add_moves", "remove_evolutions"}
+
+
+def load_manifest(path: str) -> List[Dict]:
+    """Load manifest rows from .json (array, or {"species": [...]}), .yaml/.yml or .csv.
+    Raises ValueError on bad input."""
+    manifest = Path(path)
+    suffix = manifest.suffix.lower()
+    if suffix == '.csv':
+        with open(manifest, 'r', encoding='utf-8-sig', newline='') as f:
+            return [dict(row) for row in csv.DictReader(f)]
+    if suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML manifests need PyYAML (pip install pyyaml) — or use .json/.csv")
+        with open(manifest, 'r', encoding='utf-8') as f:
+            try:
+                rows = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"invalid YAML: {e}")
+    elif suffix == '.json':
+        with open(manifest, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+    else:
+        raise ValueError(f"unsupported manifest type '{suffix}' (use .json, .yaml or .csv)")
+    if isinstance(rows, dict):
+        rows = rows.get('species')
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError("manifest must be a list of species objects (or {\"species\": [...]})")
+    return rows
+
+
+def manifest_row_to_argv(row: Dict, parser: argparse.ArgumentParser,
+                         excluded=MANIFEST_EXCLUDED_DESTS, label: str = 'column') -> List[str]:
+    """Turn one manifest row into creation flags, e.g. {"primary-type": "fire"} -> ["--primary-type", "fire"].
+    Keys may use '-' or '_'; booleans mark flags like can_fly; lists are joined with ','."""
+    options = {}
+    for action in parser._actions:
+        if action.dest in excluded:
+            continue
+        for opt in action.option_strings:
+            options[opt.lstrip('-').replace('-', '_').lower()] = (opt, action)
+        options.setdefault(action.dest, (action.option_strings[0], action))
+
+    argv = []
+    for key, value in row.items():
+        key_norm = str(key).strip().lower().replace('-', '_')
+        if key_norm == 'assets' or value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if key_norm not in options:
+            raise ValueError(f"unknown {label} '{key}'")
+        opt, action = options[key_norm]
+        if action.nargs == 0:
+            if isinstance(value, str):
+                if value.strip().lower() not in ('true', 'false', 'yes', 'no', '1', '0', 'y', 'n', 'x'):
+                    raise ValueError(f"'{key}' must be true or false")
+                value = value.strip().lower() in ('true', 'yes', '1', 'y', 'x')
+            if value:
+                argv.append(opt)
+            continue
+        if isinstance(value, list):
+            value = ','.join(str(v) for v in value)
+        elif isinstance(value, bool):
+            value = str(value).lower()
+        argv.extend([opt, str(value).strip()])
+    return argv
+
+
+# Options that make no sense on an --apply-edits line (commands and run-wide settings)
+EDIT_LINE_EXCLUDED_DESTS = {"help", "version", "name", "manifest", "workers", "rebuild", "watch", "check",
+                            "check_textures", "optimize_png", "downloads", "no_cleanup", "no_index_cache",
+                            "defer_lang", "compact_lang", "profile", "export_zip", "show_current_pokemon",
+                            "edit", "rename", "rename_map", "where", "set", "confirm", "editfiles", "apply_edits",
+                            "serve", "profile_out", "metrics_textfile", "metrics_log"}
+
+
+def edit_row_to_args(row: Dict, parser: argparse.ArgumentParser) -> argparse.Namespace:
+    """Parse one {"name": ..., <--edit options>} object, keyed like manifest columns
+    ("hp": 80, "rarity": "rare", "append": "bucket=rare", "remove_evolutions": true),
+    into --edit arguments (args.edit = the name). Raises ValueError on bad input."""
+    row = dict(row)
+    name = row.pop('name', None)
+    if not name or not isinstance(name, str):
+        raise ValueError("'name' is required")
+    argv = manifest_row_to_argv(row, parser, EDIT_LINE_EXCLUDED_DESTS, label='field')
+    errors = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(errors):
+            return parser.parse_args(['--edit', name] + argv)
+    except SystemExit:
+        message = errors.getvalue().strip().splitlines()
+        raise ValueError(message[-1].split('error: ', 1)[-1] if message else "invalid values")
+
+
+def load_edit_lines(stream, parser: argparse.ArgumentParser) -> List[Dict]:
+    """Parse --apply-edits JSONL: one edit_row_to_args() object per line. Returns
+    {'line', 'name', 'args'} per edit, or {'line', 'name', 'error'} for a line
+    that doesn't parse."""
+    edits = []
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        name = None
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("line must be a JSON object")
+            name = row.get('name')
+            edits.append({'line': line_no, 'name': name, 'args': edit_row_to_args(row, parser)})
+        except (ValueError, json.JSONDecodeError) as e:
+            edits.append({'line': line_no, 'name': name if isinstance(name, str) else None, 'error': str(e)})
+    return edits
+
+
+def manifest_to_batch(rows: List[Dict], parser: argparse.ArgumentParser, base_dir: Path) -> List[Dict]:
+    """Build generate_batch() entries from manifest rows, with the same defaults as
+    single creation. A row's assets come from its 'assets' column (relative to the
+    pack folder) or, by default, a <pack folder>/<name>/ subfolder if one exists."""
+    entries = []
+    for i, row in enumerate(rows, 1):
+        try:
+            argv = manifest_row_to_argv(row, parser)
+        except ValueError as e:
+            raise ValueError(f"row {i}: {e}")
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit:
+            raise ValueError(f"row {i}: invalid values (see the error above)")
+        if not args.name or not args.number:
+            raise ValueError(f"row {i}: 'name' and 'number' are required")
+
+        assets = row.get('assets')
+        if assets:
+            assets = Path(assets) if Path(assets).is_absolute() else base_dir / assets
+            if not assets.is_dir():
+                raise ValueError(f"row {i}: assets folder not found: {assets}")
+        elif (base_dir / args.name.lower()).is_dir():
+            assets = base_dir / args.name.lower()
+        else:
+            assets = None
+        entries.append({'name': args.name, 'config': build_create_config(args), 'assets': assets})
+    return entries
+
+
+def watch_manifest_loader(path: str, parser: argparse.ArgumentParser, base_dir: Path):
+    """For --watch: returns a callable giving {lowercase name: batch entry},
+    re-reading the manifest only when its mtime changes"""
+    cache = {'mtime': None, 'entries': {}}
+
+    def load():
+        mtime = os.stat(path).st_mtime_ns
+        if mtime != cache['mtime']:
+            entries = manifest_to_batch(load_manifest(path), parser, base_dir)
+            cache['entries'] = {e['name'].lower(): e for e in entries}
+            cache['mtime'] = mtime
+        return cache['entries']
+    return load
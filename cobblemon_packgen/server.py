@@ -0,0 +1,174 @@
+"""--serve: the library API (api.py) as a JSON-RPC 2.0 server."""
+
+import os
+import io
+import sys
+import json
+import stat
+import errno
+import socket
+from typing import Dict, Optional
+
+from . import api
+from .generator import CobblemonPackGenerator
+
+
+def remove_stale_socket(path: str):
+    """Delete a socket left at path by an earlier run that is gone. A socket
+    some server still listens on, or anything that isn't a socket, is never
+    touched: raises ValueError instead."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"{path} exists and is not a socket (refusing to replace it)")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            return  # removed in the meantime
+        if e.errno != errno.ECONNREFUSED:
+            raise
+    else:
+        raise ValueError(f"another server is already listening on {path}")
+    finally:
+        probe.close()
+    os.unlink(path)
+
+
+class PackServer:
+    """--serve: JSON-RPC 2.0 over newline-delimited JSON, on stdin/stdout or a Unix
+    socket. One CobblemonPackGenerator (and its PackIndex / lang view) stays warm
+    between requests; before each request they are re-stat'ed so files changed by
+    anything else are re-read (only those). Console output of each call is
+    captured and returned in the result's "log" instead of being printed.
+
+    Methods: create, edit, rename, editfiles, show, check, shutdown. Requests are
+    handled one at a time (pack writes aren't safe to interleave)."""
+
+    def __init__(self, generator: CobblemonPackGenerator):
+        self.generator = generator
+        self.stopping = False
+        self.methods = {
+            'create': self.rpc_create, 'edit': self.rpc_edit, 'rename': self.rpc_rename,
+            'editfiles': self.rpc_editfiles, 'show': self.rpc_show, 'check': self.rpc_check,
+            'shutdown': self.rpc_shutdown,
+        }
+
+    # --- Methods (params -> result dict; ValueError = invalid params) ---
+    def rpc_create(self, params: Dict) -> Dict:
+        params = dict(params)
+        cleanup = bool(params.pop('cleanup', True))
+        return api.create_species(self.generator, params, cleanup=cleanup)
+
+    def rpc_edit(self, params: Dict) -> Dict:
+        return api.edit_species(self.generator, params)
+
+    def rpc_rename(self, params: Dict) -> Dict:
+        if 'renames' in params:
+            renames = params['renames']
+            if not isinstance(renames, dict) or not all(isinstance(v, str) for v in renames.values()):
+                raise ValueError("'renames' must be an object of old -> new names")
+        elif isinstance(params.get('old'), str) and isinstance(params.get('new'), str):
+            renames = {params['old']: params['new']}
+        else:
+            raise ValueError("'old' and 'new' (or 'renames') are required")
+        return api.rename_species(self.generator, renames)
+
+    def rpc_editfiles(self, params: Dict) -> Dict:
+        names = params.get('names', [params['name']] if 'name' in params else None)
+        if names is not None and (not isinstance(names, list) or not all(isinstance(n, str) for n in names)):
+            raise ValueError("'name' must be a string / 'names' a list of strings")
+        return api.swap_files(self.generator, names)
+
+    def rpc_show(self, params: Dict) -> Dict:
+        species = api.list_species(self.generator)
+        errors = {str(path): error for path, error in sorted(self.generator.pack_index().errors.items())}
+        return {'ok': True, 'species': species, 'errors': errors, 'log': ''}
+
+    def rpc_check(self, params: Dict) -> Dict:
+        return api.check_pack(self.generator, params.get('workers'))
+
+    def rpc_shutdown(self, params: Dict) -> Dict:
+        self.stopping = True
+        return {'ok': True, 'log': ''}
+
+    # --- Protocol ---
+    def handle(self, line: str) -> Optional[Dict]:
+        """Response object for one request line (None for a notification)"""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32700, 'message': f"Parse error: {e}"}}
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': "Invalid Request"}}
+        request_id = request.get('id')
+        method = self.methods.get(request['method'])
+        params = request.get('params', {})
+        if method is None:
+            response = {'error': {'code': -32601, 'message': f"Method not found: {request['method']}"}}
+        elif not isinstance(params, dict):
+            response = {'error': {'code': -32602, 'message': "params must be an object"}}
+        else:
+            api.refresh(self.generator)
+            try:
+                response = {'result': method(params)}
+            except ValueError as e:
+                response = {'error': {'code': -32602, 'message': f"Invalid params: {e}"}}
+            except Exception as e:
+                response = {'error': {'code': -32000, 'message': f"{type(e).__name__}: {e}"}}
+        if 'id' not in request:
+            return None
+        return dict({'jsonrpc': '2.0', 'id': request_id}, **response)
+
+    def serve_stream(self, reader, writer):
+        for line in reader:
+            if not line.strip():
+                continue
+            response = self.handle(line)
+            if response is not None:
+                writer.write(json.dumps(response, ensure_ascii=False) + "\n")
+                writer.flush()
+            if self.stopping:
+                break
+
+    def serve(self, socket_path: Optional[str] = None):
+        """Serve on a Unix socket (one client at a time), or stdin/stdout if no path"""
+        # Responses go to the real stdout; anything printed outside a captured
+        # call (warnings while re-reading the pack) goes to stderr instead
+        stdout = sys.stdout
+        sys.stdout = sys.stderr
+        try:
+            if not socket_path:
+                print("NOTE: Serving JSON-RPC on stdin/stdout (one request per line)", file=sys.stderr)
+                self.serve_stream(sys.stdin, stdout)
+                return
+            import socketserver
+            server_ref = self
+
+            class Handler(socketserver.StreamRequestHandler):
+                def handle(self):
+                    writer = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+                    server_ref.serve_stream(io.TextIOWrapper(self.rfile, encoding='utf-8'), writer)
+                    writer.detach()
+
+            remove_stale_socket(socket_path)
+            with socketserver.UnixStreamServer(socket_path, Handler) as server:
+                bound = os.lstat(socket_path).st_ino
+                try:
+                    print(f"NOTE: Serving JSON-RPC on {socket_path} (Ctrl+C or the shutdown method stops it)",
+                          file=sys.stderr)
+                    while not self.stopping:
+                        server.handle_request()
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    try:  # ours unless something replaced it meanwhile
+                        if os.lstat(socket_path).st_ino == bound:
+                            os.unlink(socket_path)
+                    except FileNotFoundError:
+                        pass
+        finally:
+            sys.stdout = stdout
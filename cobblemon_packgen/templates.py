@@ -0,0 +1,325 @@
+"""Pure builders for one species' pack files: a creation config dict in, the
+species / poser / resolver / spawn pool JSON and lang keys out. No file I/O,
+no printing; CobblemonPackGenerator writes what these return."""
+
+from typing import Dict
+
+EV_STATS = ("hp", "attack", "defence", "special_attack", "special_defence", "speed")
+
+
+def parse_ev_yield(spec: str):
+    """Parse "speed:2,attack:1" into a full six-stat dict (unspecified -> 0)."""
+    result = {s: 0 for s in EV_STATS}
+    aliases = {"spatk": "special_attack", "spdef": "special_defence", "spa": "special_attack",
+               "spd": "special_defence", "def": "defence", "atk": "attack", "spe": "speed"}
+    for part in spec.split(','):
+        if ':' not in part:
+            raise ValueError(f"'{part}' is not stat:amount")
+        stat, amount = part.rsplit(':', 1)
+        stat = aliases.get(stat.strip().lower(), stat.strip().lower())
+        if stat not in result:
+            raise ValueError(f"unknown stat '{stat}' (valid: {', '.join(EV_STATS)})")
+        result[stat] = int(amount)
+    return result
+
+
+def parse_drops(spec: str):
+    """Parse "minecraft:redstone:50,cobblemon:exp_candy_xs:10" into drop entries.
+    The LAST colon-separated field is the percentage; the rest is the item id."""
+    entries = []
+    for part in spec.split(','):
+        if ':' not in part:
+            raise ValueError(f"'{part}' is not item:percentage")
+        item, pct = part.rsplit(':', 1)
+        entries.append({"item": item.strip(), "percentage": float(pct.strip())})
+    return entries
+
+
+def parse_hitbox(spec: str):
+    """Parse "width,height" into a hitbox dict."""
+    w, h = spec.split(',', 1)
+    return {"width": float(w.strip()), "height": float(h.strip()), "fixed": False}
+
+
+def create_species_json(pokemon_name: str, config: Dict) -> Dict:
+    """Create species definition with customization options"""
+    pokemon_lower = pokemon_name.lower()
+
+    # Parse moves if provided
+    moves = []
+    if config.get('moves'):
+        moves = [m.strip() for m in config['moves'].split(',')]
+
+    # Parse abilities if provided
+    abilities = []
+    if config.get('abilities'):
+        abilities = [a.strip() for a in config['abilities'].split(',')]
+
+    # Parse types
+    primary_type = config.get('primary_type', 'normal')
+    secondary_type = config.get('secondary_type')
+
+    # Get labels - add legendary if flagged
+    labels = config.get('labels', ['custom'])
+    if config.get('legendary') and 'legendary' not in labels:
+        labels.append('legendary')
+
+    return {
+        "implemented": True,
+        "name": pokemon_lower,
+        "labels": labels,
+        "pokedex": [
+            f"cobblemon.species.{pokemon_lower}.desc1",
+            f"cobblemon.species.{pokemon_lower}.desc2"
+        ],
+        "nationalPokedexNumber": config['pokedex_number'],
+        "primaryType": primary_type,
+        "secondaryType": secondary_type,
+        "baseStats": {
+            "hp": config.get('hp', 50),
+            "attack": config.get('attack', 50),
+            "defence": config.get('defence', 50),
+            "special_attack": config.get('special_attack', 50),
+            "special_defence": config.get('special_defence', 50),
+            "speed": config.get('speed', 50)
+        },
+        "catchRate": config.get('catch_rate', 45),
+        "maleRatio": config.get('male_ratio', 0.5),
+        "baseExperienceYield": config.get('base_exp', 100),
+        "experienceGroup": config.get('exp_group', 'medium_fast'),
+        "eggCycles": config.get('egg_cycles', 20),
+        "eggGroups": config.get('egg_groups', ['field']),
+        "baseFriendship": config.get('friendship', 50),
+        "evYield": (parse_ev_yield(config['ev_yield_spec'])
+                    if config.get('ev_yield_spec') else
+                    {"hp": 1, "attack": 0, "defence": 0,
+                     "special_attack": 0, "special_defence": 0, "speed": 0}),
+        "height": config.get('height', 10),
+        "weight": config.get('weight', 100),
+        "aspects": [],
+        "cannotDynamax": False,
+        "drops": {
+            "amount": "1-2",
+            "entries": parse_drops(config['drops_spec']) if config.get('drops_spec') else []
+        },
+        **({"baseScale": float(config['base_scale'])} if config.get('base_scale') else {}),
+        **({"hitbox": parse_hitbox(config['hitbox_spec'])} if config.get('hitbox_spec') else {}),
+        "moves": moves,
+        "abilities": abilities,
+        "evolutions": build_evolutions(pokemon_lower, config),
+        "preEvolution": config.get('pre_evolution'),
+        "behaviour": {
+            "moving": {
+                # canLook must be false if no head bone, otherwise true by default
+                "canLook": False if (config.get('head_bone', 'head').lower() == 'none') else config.get('can_look',
+                                                                                                        True),
+                "fly": {
+                    "canFly": config.get('can_fly', False)
+                },
+                "swim": {
+                    "swimSpeed": 0.3,
+                    "canSwimInWater": config.get('can_swim', False),
+                    "canBreatheUnderwater": config.get('breathe_underwater', False)
+                }
+            }
+        }
+    }
+
+
+def build_evolutions(pokemon_lower: str, config: Dict) -> list:
+    """Build evolutions list from config"""
+    if not config.get('evo_target'):
+        return []
+
+    evo_target = config['evo_target'].lower()
+    evo_method = config.get('evo_method', 'level_up')
+
+    evolution = {
+        "id": f"{pokemon_lower}_{evo_target}",
+        "variant": evo_method,
+        "result": evo_target,
+        "consumeHeldItem": False,
+        "learnableMoves": [],
+        "requirements": []
+    }
+
+    if evo_method == 'level_up':
+        evolution["requirements"].append({
+            "variant": "level",
+            "minLevel": config.get('evo_level', 36)
+        })
+    elif evo_method == 'item_interact':
+        evo_item = config.get('evo_item', 'minecraft:stone')
+        evolution["requiredContext"] = evo_item
+    elif evo_method == 'trade':
+        if config.get('evo_item'):
+            evolution["requirements"].append({
+                "variant": "held_item",
+                "item": config['evo_item']
+            })
+
+    return [evolution]
+
+
+def create_poser_json(pokemon_name: str, config: Dict) -> Dict:
+    """Create poser configuration"""
+    pokemon_lower = pokemon_name.lower()
+
+    # Check if head bone exists
+    has_head_bone = config.get('head_bone', 'head').lower() != 'none'
+
+    # Build base animations for standing pose
+    standing_animations = []
+    if has_head_bone:
+        standing_animations.append("look")
+    standing_animations.append(f"bedrock({pokemon_lower}, ground_idle)")
+
+    # Build poses based on movement type
+    poses = {
+        "standing": {
+            "poseName": "standing",
+            "transformTicks": 10,
+            "poseTypes": ["STAND", "NONE", "PORTRAIT", "PROFILE"],
+            "animations": standing_animations
+        },
+        "walking": {
+            "poseName": "walking",
+            "transformTicks": 10,
+            "poseTypes": ["WALK"],
+            "animations": [f"bedrock({pokemon_lower}, ground_walk)"]
+        },
+        "sleep": {
+            "poseName": "sleep",
+            "transformTicks": 10,
+            "poseTypes": ["SLEEP"],
+            "animations": [f"bedrock({pokemon_lower}, sleep)"]
+        }
+    }
+
+    # Add water poses if it can swim
+    if config.get('can_swim', False):
+        poses["floating"] = {
+            "poseName": "floating",
+            "transformTicks": 10,
+            "poseTypes": ["FLOAT"],
+            "animations": [f"bedrock({pokemon_lower}, water_idle)"]
+        }
+        poses["swimming"] = {
+            "poseName": "swimming",
+            "transformTicks": 10,
+            "poseTypes": ["SWIM"],
+            "animations": [f"bedrock({pokemon_lower}, water_swim)"]
+        }
+
+    # Add flying poses if it can fly
+    if config.get('can_fly', False):
+        poses["flying"] = {
+            "poseName": "flying",
+            "transformTicks": 10,
+            "poseTypes": ["FLY"],
+            "animations": [f"bedrock({pokemon_lower}, air_fly)"]
+        }
+        poses["hovering"] = {
+            "poseName": "hovering",
+            "transformTicks": 10,
+            "poseTypes": ["HOVER"],
+            "animations": [f"bedrock({pokemon_lower}, air_idle)"]
+        }
+
+    result = {
+        "portraitScale": config.get('portrait_scale', 1.25),
+        "portraitTranslation": [0, 0.5, 0],
+        "profileScale": config.get('profile_scale', 0.8),
+        "profileTranslation": [0, 0.4, 0],
+        "faint": f"bedrock({pokemon_lower}, faint)",
+        "poses": poses
+    }
+
+    # Only add head bone if specified (some models don't have a head)
+    head_bone = config.get('head_bone', 'head')
+    if head_bone and head_bone.lower() != 'none':
+        result["head"] = head_bone
+    else:
+        # No head bone - canLook will be automatically set to false in species JSON
+        pass
+
+    return result
+
+
+def create_resolver_json(pokemon_name: str) -> Dict:
+    """Create model resolver with correct texture paths"""
+    pokemon_lower = pokemon_name.lower()
+    return {
+        "species": f"cobblemon:{pokemon_lower}",
+        "order": 0,
+        "variations": [
+            {
+                "aspects": [],
+                "poser": f"cobblemon:{pokemon_lower}",
+                "model": f"cobblemon:{pokemon_lower}.geo",
+                # Correct path format that ACTUALLY works
+                "texture": f"cobblemon:textures/pokemon/{pokemon_lower}/{pokemon_lower}.png",
+                "layers": []
+            },
+            {
+                "aspects": ["shiny"],
+                "poser": f"cobblemon:{pokemon_lower}",
+                "model": f"cobblemon:{pokemon_lower}.geo",
+                # Shiny variant with full path
+                "texture": f"cobblemon:textures/pokemon/{pokemon_lower}/{pokemon_lower}_shiny.png",
+                "layers": []
+            }
+        ]
+    }
+
+
+def create_spawn_pool_json(pokemon_name: str, config: Dict) -> Dict:
+    """Create spawn pool configuration"""
+    pokemon_lower = pokemon_name.lower()
+
+    # Determine spawn context based on abilities
+    context = "grounded"
+    presets = ["natural"]
+
+    if config.get('can_swim', False):
+        context = "submerged"
+        presets = ["underwater"]
+    elif config.get('can_fly', False):
+        context = "grounded"  # Still spawns on ground but can fly
+        presets = ["natural"]
+
+    return {
+        "enabled": True,
+        "neededInstalledMods": [],
+        "neededUninstalledMods": [],
+        "spawns": [
+            {
+                "id": f"{pokemon_lower}-1",
+                "pokemon": pokemon_lower,
+                "presets": presets,
+                "type": "pokemon",
+                "context": context,
+                "bucket": config.get('rarity', 'common'),
+                "level": config.get('spawn_level', '5-30'),
+                "weight": config.get('spawn_weight', 10.0),
+                "condition": {
+                    "canSeeSky": config.get('spawn_surface', True),
+                    "biomes": config.get('spawn_biomes', ['#minecraft:is_overworld']).split(',') if isinstance(
+                        config.get('spawn_biomes', '#minecraft:is_overworld'), str) else config.get('spawn_biomes',
+                                                                                                    ['#minecraft:is_overworld'])
+                }
+            }
+        ]
+    }
+
+
+def create_lang_entries(pokemon_name: str, config: Dict) -> Dict:
+    """Create the name/desc1/desc2 lang keys for one species"""
+    pokemon_lower = pokemon_name.lower()
+    return {
+        f"cobblemon.species.{pokemon_lower}.name": pokemon_name,
+        f"cobblemon.species.{pokemon_lower}.desc1": config.get('desc1',
+                                                               f"A mysterious Pokémon known as {pokemon_name}."),
+        f"cobblemon.species.{pokemon_lower}.desc2": config.get('desc2',
+                                                               "Customize this description in the language file!")
+    }
@@ -0,0 +1,276 @@
+"""Per-phase tracing for --profile-out: spans with wall time, bytes and files
+read/written and time spent parsing/serializing JSON, saved as a Chrome trace
+(open it in https://ui.perfetto.dev or chrome://tracing).
+
+Instrumented code uses span() / @traced for phases and step() for consecutive
+blocks inside one function; all three cost one attribute check when tracing is
+off. While tracing is on, open() and the json functions are wrapped, and what
+they do is charged to every open span on the calling thread (spans are
+inclusive, like their wall time). Work done in process-pool workers isn't seen."""
+
+import os
+import io
+import json
+import time
+import builtins
+import functools
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+FILES_LISTED = 20  # per span; the counts cover the rest
+
+
+class Span:
+    """One open span; its counters collect I/O from the thread that opened it"""
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict, is_step: bool = False):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.is_step = is_step
+        self.step = None  # open step() child, closed with this span
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files_read = set()
+        self.files_written = set()
+        self.json_parse = 0.0
+        self.json_serialize = 0.0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.step is not None:
+            self.step.__exit__(None, None, None)
+        end = time.perf_counter()
+        stack = self.tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        files = sorted(self.files_read | self.files_written)
+        args = dict(self.args)
+        args.update({
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'files_read': len(self.files_read),
+            'files_written': len(self.files_written),
+            'json_parse_ms': round(self.json_parse * 1000, 3),
+            'json_serialize_ms': round(self.json_serialize * 1000, 3),
+        })
+        if files:
+            args['files'] = files[:FILES_LISTED] + ([f"... {len(files) - FILES_LISTED} more"]
+                                                    if len(files) > FILES_LISTED else [])
+        self.tracer._emit(self.name, self.start, end, args)
+        return False
+
+
+class _TracedFile:
+    """File object wrapper: on close, charges a written file's final size to the
+    spans that were open when it was opened"""
+
+    def __init__(self, f, spans: List[Span]):
+        self._f = f
+        self._spans = spans
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __iter__(self):
+        return iter(self._f)
+
+    def __next__(self):
+        return next(self._f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        if not self._f.closed:
+            try:
+                self._f.flush()
+                size = os.fstat(self._f.fileno()).st_size
+            except (OSError, ValueError):
+                size = 0
+            for span in self._spans:
+                span.bytes_written += size
+        self._f.close()
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._threads = {}  # thread ident -> name
+        self._saved = None
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _emit(self, name: str, start: float, end: float, args: Dict):
+        thread = threading.current_thread()
+        with self._lock:
+            self._threads.setdefault(thread.ident, thread.name)
+            self.events.append({
+                'name': name, 'cat': 'packgen', 'ph': 'X', 'pid': os.getpid(), 'tid': thread.ident,
+                'ts': round((start - self._origin) * 1e6, 1), 'dur': round((end - start) * 1e6, 1), 'args': args,
+            })
+
+    # --- Hooks (installed by start()) ---
+    def _open(self, file, mode='r', *args, **kwargs):
+        f = self._saved['open'](file, mode, *args, **kwargs)
+        spans = self._stack()
+        if not spans or not isinstance(file, (str, bytes, os.PathLike)):
+            return f
+        path = os.fsdecode(file)
+        if any(c in mode for c in "wax+"):
+            for span in spans:
+                span.files_written.add(path)
+            return _TracedFile(f, list(spans))
+        try:
+            size = os.fstat(f.fileno()).st_size
+        except OSError:
+            size = 0
+        for span in spans:
+            span.files_read.add(path)
+            span.bytes_read += size
+        return f
+
+    def _timed_json(self, name: str, attribute: str):
+        original = self._saved[name]
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            if getattr(self._local, 'in_json', False) or not self._stack():
+                return original(*args, **kwargs)  # json.load -> json.loads: time once
+            self._local.in_json = True
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.in_json = False
+                for span in self._stack():
+                    setattr(span, attribute, getattr(span, attribute) + elapsed)
+        return wrapper
+
+    def start(self):
+        if self.enabled:
+            return
+        self._saved = {'open': builtins.open, 'load': json.load, 'loads': json.loads,
+                       'dump': json.dump, 'dumps': json.dumps}
+        builtins.open = io.open = self._open
+        json.load = self._timed_json('load', 'json_parse')
+        json.loads = self._timed_json('loads', 'json_parse')
+        json.dump = self._timed_json('dump', 'json_serialize')
+        json.dumps = self._timed_json('dumps', 'json_serialize')
+        self._origin = time.perf_counter()
+        self.enabled = True
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        builtins.open = io.open = self._saved['open']
+        json.load, json.loads = self._saved['load'], self._saved['loads']
+        json.dump, json.dumps = self._saved['dump'], self._saved['dumps']
+
+    def write(self, path: str, metadata: Optional[Dict] = None) -> int:
+        """Save the trace (Chrome trace event format); returns the span count"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        pid = os.getpid()
+        names = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'pack-generator'}}]
+        names += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': ident, 'args': {'name': name}}
+                  for ident, name in threads.items()]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': names + sorted(events, key=lambda e: (e['tid'], e['ts'])),
+                       'displayTimeUnit': 'ms', 'otherData': metadata or {}}, f, ensure_ascii=False)
+        return len(events)
+
+
+TRACER = Tracer()
+
+
+class _NoSpan:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, **args):
+    """Context manager timing one phase (a no-op unless tracing)"""
+    if not TRACER.enabled:
+        return _NO_SPAN
+    return Span(TRACER, name, args)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run the function inside span(name or its __name__)"""
+    def decorate(function):
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return function(*args, **kwargs)
+            with Span(TRACER, span_name, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def step(name: str):
+    """End the current step of the innermost span on this thread and start the
+    next one; the last step ends with the span. For long functions made of
+    consecutive blocks (no re-indenting them into with-statements)."""
+    if not TRACER.enabled:
+        return
+    stack = TRACER._stack()
+    parent = next((s for s in reversed(stack) if not s.is_step), None)
+    if parent is None:
+        return
+    if parent.step is not None:
+        parent.step.__exit__(None, None, None)
+    parent.step = Span(TRACER, name, {}, is_step=True).__enter__()
+
+
+def annotate(**args):
+    """Add args to the innermost span on this thread (e.g. the species it's about)"""
+    if not TRACER.enabled:
+        return
+    parent = next((s for s in reversed(TRACER._stack()) if not s.is_step), None)
+    if parent is not None:
+        parent.args.update(args)
+
+
+def start():
+    TRACER.start()
+
+
+def stop():
+    TRACER.stop()
+
+
+def write(path: str, metadata: Optional[Dict] = None) -> int:
+    return TRACER.write(path, metadata)
+
@@ -0,0 +1,82 @@
+import sys
+import json
+import zlib
+import struct
+from pathlib import Path
+
+import pytest
+
+# Run from anywhere: make the cobblemon_packgen folder next to tests/ importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cobblemon_packgen import api  # noqa: E402
+
+
+def png_bytes(width: int, height: int, pixels: bytes, color_type: int = 6, bit_depth: int = 8) -> bytes:
+    """Unoptimized PNG of raw scanlines (filter 0, one IDAT)"""
+    channels = {0: 1, 2: 3, 4: 2, 6: 4}[color_type]
+    stride = width * channels * bit_depth // 8
+    raw = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 0)) + chunk(b"IEND", b""))
+
+
+def decode_png(data: bytes):
+    """(width, height, color type, bit depth, palette, raw unfiltered pixel bytes) of an 8-bit PNG"""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat, palette = 8, b"", b""
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        assert struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])[0] == zlib.crc32(kind + body)
+        if kind == b"IHDR":
+            width, height, depth, color_type = struct.unpack(">IIBB", body[:10])
+        elif kind == b"PLTE":
+            palette = body
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+    assert depth == 8
+    bpp = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color_type]
+    stride = width * bpp
+    raw, out, prev = zlib.decompress(idat), bytearray(), bytearray(stride)
+    for y in range(height):
+        kind, line = raw[y * (stride + 1)], bytearray(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+        for x in range(stride):
+            a = line[x - bpp] if x >= bpp else 0
+            b, c = prev[x], prev[x - bpp] if x >= bpp else 0
+            if kind == 1:
+                line[x] = (line[x] + a) & 0xFF
+            elif kind == 2:
+                line[x] = (line[x] + b) & 0xFF
+            elif kind == 3:
+                line[x] = (line[x] + (a + b) // 2) & 0xFF
+            elif kind == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                line[x] = (line[x] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        out += line
+        prev = line
+    return width, height, color_type, depth, palette, bytes(out)
+
+
+def drop_assets(folder: Path, name: str, identifier: str = None):
+    """Model, animation and texture for name, as Blockbench would export them"""
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f"{name}.geo.json").write_text(json.dumps({"format_version": "1.12.0", "minecraft:geometry": [
+        {"description": {"identifier": identifier or f"geometry.{name}", "texture_width": 2, "texture_height": 2},
+         "bones": [{"name": "head"}]}]}, indent=2), encoding='utf-8')
+    (folder / f"{name}.animation.json").write_text(json.dumps({"format_version": "1.8.0", "animations": {
+        f"animation.{name}.ground_idle": {}, f"animation.{name}.ground_walk": {}}}), encoding='utf-8')
+    (folder / f"{name}.png").write_bytes(png_bytes(2, 2, bytes(range(16))))
+
+
+@pytest.fixture
+def pack(tmp_path):
+    """A generator for an empty pack under tmp_path (pack folder: pack.base_dir)"""
+    generator = api.open_pack(str(tmp_path))
+    generator.base_dir.mkdir()
+    return generator
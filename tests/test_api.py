@@ -0,0 +1,71 @@
+import io
+import json
+import contextlib
+
+import pytest
+
+import cobblemon_packgen
+from cobblemon_packgen import api
+from conftest import drop_assets
+
+
+def test_species_files_touch_no_disk(tmp_path):
+    files = cobblemon_packgen.species_files("Emberfox", api.species_config(
+        {"name": "Emberfox", "number": 1100, "primary-type": "fire"}))
+    assert sorted(files) == ["lang", "poser", "resolver", "spawn_pool", "species"]
+    assert files['species']['nationalPokedexNumber'] == 1100
+    assert files['species']['primaryType'] == "fire"
+    assert files['resolver']['species'] == "cobblemon:emberfox"
+    assert files['lang']["cobblemon.species.emberfox.name"] == "Emberfox"
+
+
+@pytest.mark.parametrize("options,message", [
+    ({"name": "Emberfox"}, "'name' and 'number' are required"),
+    ({"name": "Emberfox", "number": "lots"}, "invalid"),
+])
+def test_species_config_raises_value_error(options, message):
+    with pytest.raises(ValueError, match=message):
+        api.species_config(options)
+
+
+def test_operations_return_data_and_print_nothing(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        created = api.create_species(pack, {"name": "Emberfox", "number": 1100, "primary_type": "fire"})
+        edited = api.edit_species(pack, {"name": "emberfox", "hp": 80})
+        listed = api.list_species(pack)
+        found = api.find_species(pack, "primaryType=fire,baseStats.hp>=80")
+    assert output.getvalue() == ""
+    assert created['ok'] and created['name'] == "Emberfox" and "[OK]" in created['log']
+    assert edited['ok'] and any("80" in change for change in edited['changes'])
+    assert [record['name'] for record in listed] == ["emberfox"]
+    assert isinstance(listed[0]['file'], str)
+    assert found == ["emberfox"]
+
+
+def test_failures_are_reported_in_the_result(pack):
+    result = api.edit_species(pack, {"name": "nobody", "hp": 80})
+    assert not result['ok'] and result['changes'] == [] and "not found" in result['log']
+    assert not api.rename_species(pack, {"nobody": "somebody"})['ok']
+    with pytest.raises(ValueError):
+        api.find_species(pack, "catchRate>>3")
+
+
+def test_refresh_sees_changes_made_outside_the_pack_object(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    assert api.find_species(pack, "catchRate=3") == []
+    path = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / "emberfox.json"
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['catchRate'] = 3
+    path.write_text(json.dumps(data), encoding='utf-8')
+    api.refresh(pack)
+    assert api.find_species(pack, "catchRate=3") == ["emberfox"]
+
+
+def test_package_exports():
+    assert cobblemon_packgen.__version__ == cobblemon_packgen.GENERATOR_VERSION
+    for name in ("open_pack", "create_species", "edit_species", "rename_species", "swap_files", "list_species",
+                 "find_species", "check_pack", "refresh", "create_species_json"):
+        assert callable(getattr(cobblemon_packgen, name))
@@ -0,0 +1,102 @@
+import io
+import json
+import time
+
+from cobblemon_packgen import api, generator
+from cobblemon_packgen.options import build_parser, load_edit_lines
+from conftest import drop_assets
+
+
+def species(pack, name):
+    path = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{name}.json"
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def create(pack, *names):
+    for number, name in enumerate(names, 1100):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name, "number": number})['ok']
+
+
+def apply(pack, capsys, lines):
+    capsys.readouterr()
+    edits = load_edit_lines(io.StringIO("\n".join(lines) + "\n"), build_parser())
+    ok = pack.apply_edits(edits)
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith('{')]
+    return ok, sorted(results, key=lambda r: r['line'])
+
+
+def test_load_edit_lines():
+    edits = load_edit_lines(io.StringIO('{"name": "a", "hp": 80, "primary-type": "fire"}\n\n'
+                                        '[1]\n{"name": "b", "hp": "lots"}\n{broken\n{"hp": 3}\n'), build_parser())
+    assert [e['line'] for e in edits] == [1, 3, 4, 5, 6]
+    assert edits[0]['name'] == "a" and edits[0]['args'].hp == 80 and edits[0]['args'].primary_type == "fire"
+    assert "JSON object" in edits[1]['error']
+    assert edits[2]['name'] == "b" and 'error' in edits[2]
+    assert 'error' in edits[3] and edits[3]['name'] is None
+    assert 'error' in edits[4]
+
+
+def test_edits_are_grouped_and_applied_in_order(pack, capsys):
+    create(pack, "emberfox", "tidefox")
+    ok, results = apply(pack, capsys, ['{"name": "emberfox", "hp": 80}', '{"name": "tidefox", "catch_rate": 3}',
+                                       '{"name": "emberfox", "hp": 90, "attack": 70}'])
+    assert ok and [r['ok'] for r in results] == [True, True, True]
+    assert species(pack, "emberfox")['baseStats']['hp'] == 90
+    assert species(pack, "emberfox")['baseStats']['attack'] == 70
+    assert species(pack, "tidefox")['catchRate'] == 3
+
+
+def test_a_value_that_cannot_be_parsed_fails_the_species(pack, capsys):
+    create(pack, "emberfox", "tidefox")
+    before = species(pack, "emberfox")
+    ok, results = apply(pack, capsys, ['{"name": "emberfox", "hp": 80}', '{"name": "emberfox", "ev_yield": "bogus"}',
+                                       '{"name": "tidefox", "hp": 99}'])
+    assert not ok
+    assert [r['ok'] for r in results] == [False, False, True]
+    assert "line 2" in results[0]['error'] and "Bad --ev-yield" in results[1]['error']
+    assert species(pack, "emberfox") == before  # nothing saved, not even line 1
+    assert species(pack, "tidefox")['baseStats']['hp'] == 99
+
+
+def test_failure_comes_from_the_reported_errors_not_the_output(pack, capsys, monkeypatch):
+    create(pack, "emberfox")
+    real_apply = pack._apply_edit
+
+    def apply_edit(name, data, txn, lang_updates, args, errors=None):
+        print("NOTE: nothing here is an ERROR:")  # output alone never fails a line
+        return real_apply(name, data, txn, lang_updates, args, errors)
+
+    monkeypatch.setattr(pack, "_apply_edit", apply_edit)
+    ok, results = apply(pack, capsys, ['{"name": "emberfox", "hp": 80}'])
+    assert ok and results[0]['ok']
+    ok, results = apply(pack, capsys, ['{"name": "emberfox", "removespawn": 9}'])
+    assert not ok and "--removespawn 9 out of range" in results[0]['error']
+
+
+def test_unknown_species_and_bad_lines_fail_alone(pack, capsys):
+    create(pack, "emberfox")
+    ok, results = apply(pack, capsys, ['{"name": "nobody", "hp": 1}', 'not json', '{"name": "emberfox", "hp": 7}'])
+    assert not ok
+    assert [r['ok'] for r in results] == [False, False, True]
+    assert "not found" in results[0]['error']
+
+
+def test_index_is_built_once_by_concurrent_workers(pack, capsys, monkeypatch):
+    names = [f"mon{i}" for i in range(8)]
+    create(pack, *names)
+    pack._pack_index = None
+    builds = []
+    real_build = generator.PackIndex.build
+
+    def slow_build(*args, **kwargs):
+        builds.append(1)
+        time.sleep(0.05)
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(generator.PackIndex, "build", slow_build)
+    lines = [json.dumps({"name": name, "number": 2000 + i}) for i, name in enumerate(names)]
+    capsys.readouterr()
+    assert pack.apply_edits(load_edit_lines(io.StringIO("\n".join(lines)), build_parser()), workers=8)
+    assert len(builds) == 1
+    assert [species(pack, name)['nationalPokedexNumber'] for name in names] == list(range(2000, 2008))
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from cobblemon_packgen import bench
+
+
+def run(tmp_path, *extra):
+    out = tmp_path / "report.json"
+    bench.main(["--sizes", "2", "--cubes", "2", "--workdir", str(tmp_path / "work"), "--out", str(out), *extra])
+    return json.loads(out.read_text(encoding='utf-8'))
+
+
+def test_smoke_run_reports_each_operation(tmp_path, capsys):
+    report = run(tmp_path, "--operations", "show,edit")
+    assert report['parameters']['operations'] == ["show", "edit"]
+    (scale,) = report['scales']
+    assert scale['species'] == 2
+    assert sorted(scale['operations']) == ["edit", "show"]
+    for stats in scale['operations'].values():
+        assert stats['ok'] and stats['wall_seconds'] >= 0
+    assert scale['operations']['show']['files_read'] == 0  # served from the warm index cache
+    assert scale['operations']['edit']['files_read'] > 0 and scale['operations']['edit']['files_written'] > 0
+    assert not (tmp_path / "work" / "pack_2").exists()  # scratch pack removed without --keep
+    assert "[OK] Report written to" in capsys.readouterr().err
+
+
+def test_compare_prints_the_change_against_a_baseline(tmp_path, capsys):
+    baseline = run(tmp_path, "--operations", "show")
+    baseline['generator_version'] = "2.6"
+    (tmp_path / "old.json").write_text(json.dumps(baseline), encoding='utf-8')
+    run(tmp_path, "--operations", "show", "--compare", str(tmp_path / "old.json"))
+    err = capsys.readouterr().err
+    assert "vs 2.6" in err
+    assert any(line.split()[:2] == ["2", "show"] and line.rstrip().endswith("%") for line in err.splitlines())
+
+
+@pytest.mark.parametrize("argv", [["--sizes", "1"], ["--sizes", "x"], ["--operations", "fly"], ["--chain", "0"]])
+def test_bad_arguments_are_rejected(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        bench.main(argv)
+    assert exit_info.value.code == 2
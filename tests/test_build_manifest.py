@@ -0,0 +1,78 @@
+import json
+
+from cobblemon_packgen import api
+from cobblemon_packgen.generator import BuildManifest
+from conftest import drop_assets
+
+MANIFEST = "/packs/manifest.csv"
+
+
+def entry(name, number, **options):
+    return {'name': name, 'config': api.species_config({"name": name, "number": number, **options}), 'assets': None}
+
+
+def build(pack, entries, capsys, manifest=MANIFEST):
+    """Build entries incrementally (sources kept, like --manifest --no-cleanup); the summary line"""
+    capsys.readouterr()
+    state = BuildManifest(pack.build_state_file, manifest, pack.base_dir)
+    assert pack.generate_batch(entries, cleanup=False, build=state)
+    return next(line for line in capsys.readouterr().out.splitlines() if line.startswith("BATCH COMPLETE"))
+
+
+def species_file(pack, name):
+    return pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{name}.json"
+
+
+def test_unchanged_species_are_skipped(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "tidefox")
+    entries = [entry("Emberfox", 1100), entry("Tidefox", 1101)]
+    assert build(pack, entries, capsys) == "BATCH COMPLETE: 2 built, 0 unchanged, 0 removed, 0 failed"
+    stamp = species_file(pack, "emberfox").stat().st_mtime_ns
+    assert build(pack, entries, capsys) == "BATCH COMPLETE: 0 built, 2 unchanged, 0 removed, 0 failed"
+    assert species_file(pack, "emberfox").stat().st_mtime_ns == stamp
+
+
+def test_a_changed_row_asset_or_output_marks_only_that_species_dirty(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "tidefox")
+    drop_assets(pack.base_dir, "stonefox")
+    entries = [entry("Emberfox", 1100), entry("Tidefox", 1101), entry("Stonefox", 1102)]
+    build(pack, entries, capsys)
+
+    entries[0] = entry("Emberfox", 1100, hp=99)  # config row
+    texture = pack.base_dir / "tidefox.png"  # source asset
+    texture.write_bytes(texture.read_bytes() + b"\0")
+    assert build(pack, entries, capsys) == "BATCH COMPLETE: 2 built, 1 unchanged, 0 removed, 0 failed"
+    assert json.loads(species_file(pack, "emberfox").read_text(encoding='utf-8'))['baseStats']['hp'] == 99
+
+    species_file(pack, "stonefox").unlink()  # an output went missing
+    assert build(pack, entries, capsys) == "BATCH COMPLETE: 1 built, 2 unchanged, 0 removed, 0 failed"
+    assert species_file(pack, "stonefox").exists()
+
+
+def test_species_dropped_from_the_manifest_are_removed(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "tidefox")
+    build(pack, [entry("Emberfox", 1100), entry("Tidefox", 1101)], capsys)
+    assert build(pack, [entry("Emberfox", 1100)], capsys) == \
+        "BATCH COMPLETE: 0 built, 1 unchanged, 1 removed, 0 failed"
+    assert not species_file(pack, "tidefox").exists()
+    assert not (pack.resource_pack_dir / "assets/cobblemon/textures/pokemon/tidefox/tidefox.png").exists()
+    assert species_file(pack, "emberfox").exists()
+
+
+def test_manifests_never_remove_each_others_species(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "tidefox")
+    build(pack, [entry("Emberfox", 1100)], capsys, manifest="/packs/a.csv")
+    build(pack, [entry("Tidefox", 1101)], capsys, manifest="/packs/b.csv")
+    assert species_file(pack, "emberfox").exists() and species_file(pack, "tidefox").exists()
+
+
+def test_unreadable_state_rebuilds_everything(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    entries = [entry("Emberfox", 1100)]
+    build(pack, entries, capsys)
+    pack.build_state_file.write_text("{broken", encoding='utf-8')
+    assert build(pack, entries, capsys) == "BATCH COMPLETE: 1 built, 0 unchanged, 0 removed, 0 failed"
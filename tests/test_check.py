@@ -0,0 +1,90 @@
+import re
+import sys
+import json
+
+import pytest
+
+from cobblemon_packgen import api, cli
+from conftest import drop_assets
+
+
+def create(pack, *names):
+    for number, name in enumerate(names, 1100):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name, "number": number})['ok']
+
+
+def run_check(pack, monkeypatch, capsys, *extra):
+    """(exit code, output) of pack-generator.py --check on pack"""
+    capsys.readouterr()
+    monkeypatch.setattr(sys, "argv", ["pack-generator.py", "--downloads", str(pack.base_dir.parent), "--check",
+                                      *extra])
+    try:
+        cli.main()
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    return code, capsys.readouterr().out
+
+
+@pytest.fixture
+def broken(pack):
+    """emberfox is fine; tidefox, stonefox and a stray file each break something"""
+    create(pack, "emberfox", "tidefox", "stonefox")
+    behavior = pack.behavior_pack_dir / "data" / "cobblemon"
+    bedrock = pack.resource_pack_dir / "assets" / "cobblemon" / "bedrock" / "pokemon"
+
+    model = bedrock / "models" / "tidefox" / "tidefox.geo.json"
+    model.write_text(model.read_text(encoding='utf-8').replace("geometry.tidefox", "geometry.wrong"), encoding='utf-8')
+    (behavior / "spawn_pool_world" / "tidefox.json").unlink()
+
+    (bedrock / "resolvers" / "0_stonefox_base.json").unlink()
+    species_file = behavior / "species" / "custom" / "stonefox.json"
+    data = json.loads(species_file.read_text(encoding='utf-8'))
+    data['evolutions'] = [{"id": "stonefox_nobody", "variant": "level_up", "result": "nobody", "requirements": []}]
+    species_file.write_text(json.dumps(data), encoding='utf-8')
+
+    (behavior / "species" / "custom" / "mangled.json").write_text("{not json", encoding='utf-8')
+    return pack
+
+
+def findings(out):
+    return sorted(line.strip() for line in out.splitlines() if re.match(r"  (ERROR|WARNING): ", line))
+
+
+def test_check_passes_on_a_healthy_pack(pack, monkeypatch, capsys):
+    create(pack, "emberfox", "tidefox")
+    code, out = run_check(pack, monkeypatch, capsys)
+    assert code == 0
+    assert "[OK] 2 Pokémon checked" in out and ": 0 error(s)," in out
+
+
+def test_check_reports_each_category_and_fails(broken, monkeypatch, capsys):
+    code, out = run_check(broken, monkeypatch, capsys)
+    assert code == 1
+    lines = findings(out)
+    assert any(line.startswith("ERROR: mangled.json: unreadable") for line in lines)
+    assert "ERROR: tidefox: model identifier is geometry.wrong, expected geometry.tidefox" in lines
+    assert "WARNING: tidefox: no spawn pool entry (it will never spawn naturally)" in lines
+    assert "ERROR: stonefox: missing resolver resolvers/0_stonefox_base.json" in lines
+    assert any(line.startswith("WARNING: stonefox: evolution 'stonefox_nobody' → 'nobody'") for line in lines)
+    assert not any(line.startswith("ERROR: emberfox: ") for line in lines)
+    errors = sum(line.startswith("ERROR: ") for line in lines)
+    assert errors == 3
+    assert re.search(rf"ERROR: 3 Pokémon checked in [\d.]+s: 3 error\(s\), {len(lines) - errors} warning\(s\)", out)
+
+
+def test_check_findings_do_not_depend_on_workers(broken, monkeypatch, capsys):
+    _code, serial = run_check(broken, monkeypatch, capsys, "--workers", "1")
+    code, parallel = run_check(broken, monkeypatch, capsys, "--workers", "4")
+    assert code == 1
+    assert findings(parallel)  # the broken pack has findings
+    assert [line for line in parallel.splitlines() if re.match(r"  (ERROR|WARNING): ", line)] == \
+        [line for line in serial.splitlines() if re.match(r"  (ERROR|WARNING): ", line)]  # same findings, same order
+
+
+def test_api_check_pack_matches_the_cli(broken, monkeypatch, capsys):
+    _code, out = run_check(broken, monkeypatch, capsys)
+    result = api.check_pack(broken, workers=2)
+    assert not result['ok']
+    assert sorted(f"{i['level']}: {i['where']}: {i['message']}" for i in result['issues']) == findings(out)
@@ -0,0 +1,59 @@
+from cobblemon_packgen import api
+from conftest import drop_assets, png_bytes
+
+
+def names(files):
+    return {key: sorted(f.name for f in file_list) for key, file_list in files.items()}
+
+
+def test_loose_files_without_a_name_group_are_all_used(pack):
+    drop_assets(pack.base_dir, "model")  # model.geo.json etc.: not named for emberfox
+    (pack.base_dir / "tex.png").write_bytes(png_bytes(1, 1, bytes(4)))
+    files = pack.find_files_in_base_dir("emberfox")
+    assert names(files)['textures'] == ["model.png", "tex.png"]
+    assert names(files)['models'] == ["model.geo.json"]
+
+
+def test_prefixed_and_subfolder_groups(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    (pack.base_dir / "emberfox_shiny.png").write_bytes(png_bytes(1, 1, bytes(4)))
+    drop_assets(pack.base_dir / "tidefox", "anything")
+    groups = pack.find_species_files()
+    assert names(groups["emberfox"]) == {'animations': ["emberfox.animation.json"], 'models': ["emberfox.geo.json"],
+                                         'textures': ["emberfox.png", "emberfox_shiny.png"], 'other': []}
+    assert names(groups["tidefox"])['models'] == ["anything.geo.json"]
+    assert names(pack.find_files_in_base_dir("tidefox"))['textures'] == ["anything.png"]
+
+
+def test_mixed_drop_warns_about_files_left_behind(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    (pack.base_dir / "emberfox.png").unlink()
+    (pack.base_dir / "tex.png").write_bytes(png_bytes(1, 1, bytes(4)))
+    files = pack.find_files_in_base_dir("emberfox")
+    assert names(files)['textures'] == []
+    out = capsys.readouterr().out
+    assert "WARNING: Not used for emberfox (not named for it): tex.png" in out
+    assert "have no textures" in out
+
+
+def test_other_species_files_are_noted_not_used(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "tidefox")
+    result = api.create_species(pack, {"name": "Emberfox", "number": 1100})
+    assert result['ok']
+    assert "NOTE: Left in the pack folder (not named emberfox): tidefox.animation.json, tidefox.geo.json, " \
+           "tidefox.png" in result['log']
+    assert "WARNING: Not used" not in result['log']
+    assert sorted(p.name for p in pack.base_dir.iterdir() if p.is_file()) == \
+        ["tidefox.animation.json", "tidefox.geo.json", "tidefox.png"]
+
+
+def test_manifest_notes_files_no_row_uses(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    drop_assets(pack.base_dir, "stray")
+    entries = [{'name': "Emberfox", 'config': api.species_config({"name": "Emberfox", "number": 1100}),
+                'assets': None}]
+    assert pack.generate_batch(entries)
+    assert "NOTE: Left in the pack folder (no manifest row uses them): stray.animation.json, stray.geo.json, " \
+           "stray.png" in capsys.readouterr().out
+    assert (pack.base_dir / "stray.png").exists() and not (pack.base_dir / "emberfox.png").exists()
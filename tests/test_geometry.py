@@ -0,0 +1,127 @@
+import io
+import json
+
+import pytest
+
+from cobblemon_packgen import generator
+from cobblemon_packgen.generator import (scan_geometry_identifiers, scan_geometry_identifier_stream,
+                                         rewrite_geometry_identifiers)
+
+
+def model(*identifiers, indent=2):
+    return json.dumps({
+        "format_version": "1.12.0",
+        "minecraft:geometry": [
+            {"description": {"identifier": identifier, "texture_width": 64}, "bones": [{"name": "body"}]}
+            for identifier in identifiers
+        ],
+    }, indent=indent)
+
+
+def test_scan_finds_every_geometry():
+    text = model("geometry.emberfox", "geometry.emberfox_shiny")
+    spans = scan_geometry_identifiers(text)
+    assert [value for _start, _end, value in spans] == ["geometry.emberfox", "geometry.emberfox_shiny"]
+    for start, end, value in spans:
+        assert json.loads(text[start:end]) == value
+
+
+def test_scan_handles_compact_json():
+    assert [v for _s, _e, v in scan_geometry_identifiers(model("geometry.a", "geometry.b", indent=None))] == \
+        ["geometry.a", "geometry.b"]
+
+
+def test_scan_decodes_escaped_quotes_in_the_identifier():
+    text = model('geometry.say \\"hi\\"')
+    ((start, end, value),) = scan_geometry_identifiers(text)
+    assert value == 'geometry.say \\"hi\\"'
+    assert text[start:end] == json.dumps(value)
+
+
+def test_scan_ignores_identifier_text_inside_string_values():
+    text = json.dumps({"comment": '"description": {"identifier": "geometry.fake"}',
+                       "minecraft:geometry": [{"description": {"identifier": "geometry.real"}}]})
+    assert [value for _start, _end, value in scan_geometry_identifiers(text)] == ["geometry.real"]
+
+
+@pytest.mark.parametrize("text", [
+    # an "identifier" key somewhere else in the model
+    '{"minecraft:geometry": [{"description": {"identifier": "geometry.a"}, "bones": [{"identifier": "x"}]}]}',
+    # "identifier" not the first key of the description
+    '{"minecraft:geometry": [{"description": {"texture_width": 64, "identifier": "geometry.a"}}]}',
+    # description outside minecraft:geometry
+    '{"other": [{"description": {"identifier": "geometry.a"}}]}',
+    # old-format model without the geometry array
+    '{"geometry.a": {"bones": []}}',
+    # a description without an identifier we could rewrite
+    '{"minecraft:geometry": [{"description": {"identifier": "geometry.a"}}, {"description": {}}]}',
+])
+def test_scan_rejects_unusual_layouts(text):
+    assert scan_geometry_identifiers(text) is None
+
+
+def test_rewrite_changes_only_the_identifiers(tmp_path):
+    src = tmp_path / "old.geo.json"
+    text = model("geometry.oldname", "geometry.oldname_shiny")
+    src.write_text(text, encoding='utf-8')
+    dest = tmp_path / "new.geo.json"
+    changes = rewrite_geometry_identifiers(src, dest, lambda old: old.replace("oldname", "newname"))
+    assert changes == [("geometry.oldname", "geometry.newname"),
+                       ("geometry.oldname_shiny", "geometry.newname_shiny")]
+    assert dest.read_text(encoding='utf-8') == text.replace("oldname", "newname")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.geo.json", "old.geo.json"]
+
+
+def test_rewrite_falls_back_on_unusual_layouts(tmp_path):
+    src = tmp_path / "a.geo.json"
+    src.write_text('{"geometry.a": {"bones": []}}', encoding='utf-8')
+    assert rewrite_geometry_identifiers(src, src, lambda old: "geometry.b") is None
+    assert src.read_text(encoding='utf-8') == '{"geometry.a": {"bones": []}}'
+
+
+def test_rewrite_removes_its_temp_file_on_failure(tmp_path):
+    src = tmp_path / "a.geo.json"
+    src.write_text(model("geometry.a"), encoding='utf-8')
+
+    def rename(old):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        rewrite_geometry_identifiers(src, src, rename)
+    assert [p.name for p in tmp_path.iterdir()] == ["a.geo.json"]
+
+
+@pytest.mark.parametrize("chunk", [1, 5, 13, 64, 1 << 20])
+def test_stream_scan_matches_the_text_scan_at_any_read_size(monkeypatch, chunk):
+    monkeypatch.setattr(generator, "GEOMETRY_SCAN_CHUNK", chunk)
+    for text in [model("geometry.emberfox", "geometry.émberfox_shiny"), model("geometry.a", "geometry.b", indent=None),
+                 model('geometry.say \\"hi\\"'), '{"other": [{"description": {"identifier": "geometry.a"}}]}']:
+        data = text.encode('utf-8')
+        stream = scan_geometry_identifier_stream(io.BytesIO(data))
+        spans = scan_geometry_identifiers(text)
+        if spans is None:
+            assert stream is None
+            continue
+        assert [value for _s, _e, value in stream] == [value for _s, _e, value in spans]
+        for start, end, value in stream:
+            assert json.loads(data[start:end].decode('utf-8')) == value
+
+
+def test_stream_scan_gives_up_past_its_look_back(monkeypatch):
+    monkeypatch.setattr(generator, "GEOMETRY_SCAN_CHUNK", 16)
+    padding = " " * (generator._GEOMETRY_SCAN_CONTEXT + 100)
+    text = '{"minecraft:geometry": [' + padding + '{"description": {"identifier": "geometry.a"}}]}'
+    assert scan_geometry_identifiers(text) is not None
+    assert scan_geometry_identifier_stream(io.BytesIO(text.encode('utf-8'))) is None
+
+
+def test_rewrite_keeps_crlf_line_endings(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator, "GEOMETRY_SCAN_CHUNK", 7)  # tokens straddle reads
+    data = model("geometry.oldname", "geometry.oldname_shiny").replace("\n", "\r\n").encode('utf-8')
+    src = tmp_path / "old.geo.json"
+    src.write_bytes(data)
+    changes = rewrite_geometry_identifiers(src, src, lambda old: old.replace("oldname", "newname"))
+    assert changes == [("geometry.oldname", "geometry.newname"),
+                       ("geometry.oldname_shiny", "geometry.newname_shiny")]
+    assert src.read_bytes() == data.replace(b"oldname", b"newname")
+    assert b"\r\n" in src.read_bytes()
@@ -0,0 +1,61 @@
+import pytest
+
+from cobblemon_packgen import api
+from conftest import drop_assets
+
+
+def sources(pack):
+    return sorted(p.name for p in pack.base_dir.iterdir() if p.is_file())
+
+
+def test_failed_generation_leaves_sources_in_the_pack_folder(pack, monkeypatch):
+    drop_assets(pack.base_dir, "emberfox", identifier="geometry.unknown")
+    before = sources(pack)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("simulated failure")
+
+    monkeypatch.setattr(pack, "generate_pack_files", fail)
+    config = api.species_config({"name": "Emberfox", "number": 1100})
+    with pytest.raises(RuntimeError):
+        pack.generate_pokemon("Emberfox", config, cleanup=True)
+    assert sources(pack) == before
+
+
+def test_successful_generation_consumes_sources(pack, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    model = (pack.base_dir / "emberfox.geo.json").read_bytes()
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    assert sources(pack) == []
+    installed = pack.resource_pack_dir / "assets/cobblemon/bedrock/pokemon/models/emberfox/emberfox.geo.json"
+    assert installed.read_bytes() == model
+
+
+def test_no_cleanup_never_links_the_sources(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100}, cleanup=False)['ok']
+    assert len(sources(pack)) == 3
+    installed = pack.resource_pack_dir / "assets/cobblemon/textures/pokemon/emberfox/emberfox.png"
+    assert installed.stat().st_ino != (pack.base_dir / "emberfox.png").stat().st_ino
+
+
+def test_failed_generation_never_changes_linked_sources(pack, monkeypatch):
+    drop_assets(pack.base_dir, "emberfox")
+    before = {name: (pack.base_dir / name).read_bytes() for name in sources(pack)}
+    real_poser = pack.create_poser_json
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("simulated failure")
+
+    monkeypatch.setattr(pack, "create_poser_json", fail)
+    config = api.species_config({"name": "Emberfox", "number": 1100})
+    with pytest.raises(RuntimeError):
+        pack.generate_pokemon("Emberfox", config, cleanup=True)
+    installed = pack.resource_pack_dir / "assets/cobblemon/bedrock/pokemon/models/emberfox/emberfox.geo.json"
+    assert installed.exists()
+
+    # Rewrite the installed model as an edit would, then retry without cleanup
+    pack._write_json(installed, {"format_version": "1.12.0", "minecraft:geometry": []}, 'model')
+    monkeypatch.setattr(pack, "create_poser_json", real_poser)
+    assert pack.generate_pokemon("Emberfox", config, cleanup=False)
+    assert {name: (pack.base_dir / name).read_bytes() for name in sources(pack)} == before
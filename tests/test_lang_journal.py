@@ -0,0 +1,78 @@
+import json
+
+from cobblemon_packgen.generator import LangJournal
+
+EXISTING = {"cobblemon.species.aa.name": "Aa", "cobblemon.species.bb.name": "Bb"}
+OPS = [
+    ("set", {"cobblemon.species.emberfox.name": "Emberfox", "cobblemon.species.emberfox.desc": "Warm."}),
+    ("set", {"cobblemon.species.aa.name": "Aa Prime"}),
+    ("delete", ["cobblemon.species.bb.name", "cobblemon.species.missing.name"]),
+    ("set", {"cobblemon.species.bb.name": "Bb Again", "cobblemon.species.ü.name": "Ü"}),
+    ("delete", ["cobblemon.species.emberfox.desc"]),
+]
+
+
+def direct(lang):
+    """What writing every change straight into en_us.json would give"""
+    lang = dict(lang)
+    for kind, value in OPS:
+        if kind == "set":
+            lang.update(value)
+        else:
+            for key in value:
+                lang.pop(key, None)
+    return lang
+
+
+def journal(tmp_path):
+    return LangJournal(tmp_path / "lang" / "en_us.json", tmp_path / "lang" / ".lang_journal.jsonl")
+
+
+def record(j):
+    for kind, value in OPS:
+        getattr(j, kind)(value)
+
+
+def test_compacted_file_equals_direct_write(tmp_path):
+    j = journal(tmp_path)
+    j.lang_file.parent.mkdir()
+    j.lang_file.write_text(json.dumps(EXISTING), encoding='utf-8')
+    record(j)
+    assert j.pending()
+    assert j.compact() == len(direct(EXISTING))
+    expected = json.dumps(direct(EXISTING), indent=2, sort_keys=True, ensure_ascii=False)
+    assert j.lang_file.read_text(encoding='utf-8') == expected
+    assert not j.journal_file.exists()
+    assert j.compact() is None
+
+
+def test_replay_in_a_new_process_sees_pending_changes(tmp_path):
+    record(journal(tmp_path))  # no en_us.json yet
+    assert journal(tmp_path).load() == direct({})
+
+
+def test_load_before_and_after_appends_agree(tmp_path):
+    j = journal(tmp_path)
+    assert j.load() == {}
+    record(j)
+    assert j.load() == direct({}) == journal(tmp_path).load()
+
+
+def test_unreadable_journal_lines_are_skipped(tmp_path, capsys):
+    j = journal(tmp_path)
+    j.set({"a": "A"})
+    with open(j.journal_file, 'a', encoding='utf-8') as f:
+        f.write('{"set": {"b": \n\n["not", "an", "op"]\n')
+    j.set({"c": "C"})
+    assert journal(tmp_path).load() == {"a": "A", "c": "C"}
+    assert capsys.readouterr().out.count("WARNING: Skipped unreadable lang journal line") == 2
+
+
+def test_revalidate_picks_up_outside_edits(tmp_path):
+    j = journal(tmp_path)
+    j.set({"a": "A"})
+    j.compact()
+    assert j.load() == {"a": "A"}
+    j.lang_file.write_text(json.dumps({"a": "Edited by hand", "z": "Z"}), encoding='utf-8')
+    assert j.revalidate()
+    assert j.load() == {"a": "Edited by hand", "z": "Z"}
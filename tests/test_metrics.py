@@ -0,0 +1,77 @@
+import sys
+import json
+
+import pytest
+
+from cobblemon_packgen import api, cli, metrics
+from conftest import drop_assets
+
+
+@pytest.fixture
+def fresh_metrics(monkeypatch):
+    """Count into a new Metrics, as a new process would"""
+    def new_run():
+        fresh = metrics.Metrics()
+        monkeypatch.setattr(metrics, "METRICS", fresh)
+        monkeypatch.setattr(metrics, "inc", fresh.inc)
+        monkeypatch.setattr(metrics, "timed", fresh.timed)
+        return fresh
+    return new_run
+
+
+def run(fresh_metrics, monkeypatch, *argv):
+    """One CLI run in a 'new process'; its exit code"""
+    fresh_metrics()
+    monkeypatch.setattr(sys, "argv", ["pack-generator.py", *argv])
+    try:
+        cli.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_textfile_counters_accumulate_and_gauges_are_replaced(tmp_path):
+    path = tmp_path / "textfile" / "packgen.prom"
+    first = {'status': "ok", 'command': "manifest", 'finished': 100.0, 'duration_seconds': 2.5}
+    metrics.write_textfile(str(path), first, {("species_generated", ()): 3,
+                                              ("cache_hits", (("cache", "index"),)): 5})
+    second = {'status': "failed", 'command': "edit", 'finished': 200.0, 'duration_seconds': 0.25}
+    metrics.write_textfile(str(path), second, {("species_generated", ()): 2})
+    values = metrics.read_textfile(path)
+    assert values['packgen_species_generated_total'] == 5
+    assert values['packgen_cache_hits_total{cache="index"}'] == 5  # untouched by the second run: kept
+    assert values['packgen_runs_total{status="ok"}'] == 1 and values['packgen_runs_total{status="failed"}'] == 1
+    assert values['packgen_last_run_timestamp_seconds{command="edit"}'] == 200
+    assert not any('command="manifest"' in sample for sample in values)
+    text = path.read_text(encoding='utf-8')
+    assert "# TYPE packgen_species_generated_total counter" in text
+    assert "# TYPE packgen_last_run_success gauge" in text
+    assert [p.name for p in path.parent.iterdir()] == ["packgen.prom"]
+
+
+def test_cli_runs_accumulate_in_the_textfile_and_log(pack, tmp_path, monkeypatch, fresh_metrics, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    prom, log = tmp_path / "packgen.prom", tmp_path / "runs.jsonl"
+    common = ["--downloads", str(tmp_path), "--metrics-textfile", str(prom), "--metrics-log", str(log)]
+    assert run(fresh_metrics, monkeypatch, *common, "--edit", "emberfox", "--hp", "80") == 0
+    assert run(fresh_metrics, monkeypatch, *common, "--edit", "emberfox", "--hp", "90") == 0
+    assert run(fresh_metrics, monkeypatch, *common, "--edit", "nobody", "--hp", "1") == 0  # reported, not fatal
+
+    values = metrics.read_textfile(prom)
+    assert values['packgen_runs_total{status="ok"}'] == 3
+    assert values['packgen_species_edited_total'] == 2
+    assert values['packgen_edits_failed_total'] == 1
+    assert values['packgen_last_run_success{command="edit"}'] == 1
+
+    records = [json.loads(line) for line in log.read_text(encoding='utf-8').splitlines()]
+    assert [r['status'] for r in records] == ["ok", "ok", "ok"]
+    assert [r['counters'].get('species_edited') for r in records] == [1, 1, None]  # per run, not cumulative
+    assert records[2]['counters']['edits_failed'] == 1
+    assert all(r['command'] == "edit" and r['duration_seconds'] >= 0 for r in records)
+
+
+def test_hit_rates():
+    counters = {("cache_hits", (("cache", "index"),)): 3, ("cache_misses", (("cache", "index"),)): 1,
+                ("cache_misses", (("cache", "png"),)): 2, ("species_generated", ()): 9}
+    assert metrics.hit_rates(counters) == {"index": 0.75, "png": 0.0}
@@ -0,0 +1,70 @@
+import json
+
+from cobblemon_packgen import api
+from conftest import drop_assets
+
+
+def create(pack, *names):
+    for number, name in enumerate(names, 1100):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name, "number": number})['ok']
+
+
+def species_file(pack, name):
+    return pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / f"{name}.json"
+
+
+def test_spawn_files_and_evolutions_are_indexed_by_target(pack):
+    create(pack, "emberfox", "tidefox")
+    assert api.edit_species(pack, {"name": "emberfox", "evo_target": "tidefox", "evo_level": 30})['ok']
+    index = pack.pack_index()
+    spawn = pack.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" / "emberfox.json"
+    assert index.spawn_files_for("emberfox") == [spawn]
+    assert index.evolution_referrers("tidefox") == [species_file(pack, "emberfox")]
+    assert index.referrers("tidefox")[species_file(pack, "emberfox")] == ["evolutions[0].result",
+                                                                          "evolutions[0].id"]
+
+
+def test_edits_keep_the_reverse_references_current(pack):
+    create(pack, "emberfox", "tidefox")
+    index = pack.pack_index()
+    assert api.edit_species(pack, {"name": "emberfox", "evo_target": "tidefox", "evo_level": 30})['ok']
+    assert index.species_referencing("tidefox") == [species_file(pack, "emberfox")]
+    assert api.edit_species(pack, {"name": "emberfox", "remove_evolutions": True})['ok']
+    assert index.species_referencing("tidefox") == []
+    assert list(index.referrers("tidefox")) == index.spawn_files_for("tidefox")  # only its own spawn file left
+
+
+def test_rename_moves_the_references_to_the_new_name(pack):
+    create(pack, "emberfox", "tidefox", "stonefox")
+    assert api.edit_species(pack, {"name": "emberfox", "evo_target": "tidefox", "evo_level": 30})['ok']
+    untouched = species_file(pack, "stonefox").stat().st_mtime_ns
+    assert api.rename_species(pack, {"tidefox": "seafox"})['ok']
+    index = pack.pack_index()
+    assert index.referrers("tidefox") == {}
+    assert index.evolution_referrers("seafox") == [species_file(pack, "emberfox")]
+    evolution = json.loads(species_file(pack, "emberfox").read_text(encoding='utf-8'))['evolutions'][0]
+    assert evolution['result'] == "seafox"
+    assert species_file(pack, "stonefox").stat().st_mtime_ns == untouched  # not a referrer: not rewritten
+
+
+def test_revalidate_picks_up_files_changed_by_hand(pack):
+    create(pack, "emberfox", "tidefox")
+    index = pack.pack_index()
+    path = species_file(pack, "tidefox")
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['preEvolution'] = "emberfox"
+    path.write_text(json.dumps(data) + "\n", encoding='utf-8')
+    additions = pack.behavior_pack_dir / "data" / "cobblemon" / "species_additions"
+    additions.mkdir(parents=True, exist_ok=True)
+    (additions / "pichu_emberfox_evo.json").write_text(json.dumps({"target": "cobblemon:pichu", "evolutions": [
+        {"id": "pichu_emberfox", "result": "emberfox"}]}), encoding='utf-8')
+
+    assert index.revalidate() == 2
+    assert index.pre_evolution_referrers("emberfox") == [path]
+    assert index.additions_referencing("emberfox") == [additions / "pichu_emberfox_evo.json"]
+
+    path.unlink()
+    assert index.revalidate() == 1
+    assert index.pre_evolution_referrers("emberfox") == []
+    assert "tidefox" not in index.species
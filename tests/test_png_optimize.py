@@ -0,0 +1,119 @@
+import zlib
+import struct
+import hashlib
+
+import pytest
+
+from cobblemon_packgen.generator import optimize_png
+from conftest import png_bytes, decode_png
+
+
+def chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def with_chunk(png, kind, data):
+    """png with an extra chunk right after IHDR"""
+    return png[:33] + chunk(kind, data) + png[33:]
+
+
+def gradient(width, height, channels):
+    return bytes((x * 7 + y * 13 + c * 50 + (x * y) % 11) & 0xFF
+                 for y in range(height) for x in range(width) for c in range(channels))
+
+
+@pytest.mark.parametrize("color_type,channels", [(6, 4), (2, 3), (4, 2), (0, 1)])
+@pytest.mark.parametrize("width,height", [(16, 16), (1, 5), (33, 3)])
+def test_optimized_png_decodes_to_the_same_pixels(color_type, channels, width, height):
+    pixels = gradient(width, height, channels)
+    original = png_bytes(width, height, pixels, color_type)
+    optimized = optimize_png(original)
+    assert len(optimized) <= len(original)
+    assert decode_png(optimized) == decode_png(original) == (width, height, color_type, 8, b"", pixels)
+
+
+def test_every_input_filter_is_undone():
+    pixels = gradient(24, 24, 4)
+    once = optimize_png(png_bytes(24, 24, pixels))
+    # once uses a mix of filters; a metadata chunk makes the second pass shrink it again
+    raw = zlib.decompress(once[once.index(b"IDAT") + 4:-16])
+    assert len({raw[y * (24 * 4 + 1)] for y in range(24)}) > 1
+    with_text = with_chunk(once, b"tEXt", b"Comment\0" + b"x" * 500)
+    twice = optimize_png(with_text)
+    assert len(twice) < len(with_text)  # re-encoded, not passed through
+    assert decode_png(twice)[5] == pixels
+
+
+def test_palette_and_transparency_are_kept():
+    palette = bytes((255, 0, 0, 0, 255, 0, 0, 0, 255))
+    indices = bytes((x + y) % 3 for y in range(8) for x in range(8))
+    raw = b"".join(b"\0" + indices[y * 8:(y + 1) * 8] for y in range(8))
+    original = (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 3, 0, 0, 0))
+                + chunk(b"PLTE", palette) + chunk(b"tRNS", b"\xff\x80\x00")
+                + chunk(b"tEXt", b"Software\0Editor") + chunk(b"IDAT", zlib.compress(raw, 0)) + chunk(b"IEND", b""))
+    optimized = optimize_png(original)
+    assert b"tEXt" not in optimized and b"tRNS" in optimized
+    assert optimized.index(b"PLTE") < optimized.index(b"tRNS") < optimized.index(b"IDAT")
+    assert decode_png(optimized)[4:] == (palette, indices)
+
+
+def test_metadata_is_dropped():
+    original = with_chunk(png_bytes(8, 8, gradient(8, 8, 4)), b"tIME", b"\x07\xe6\x01\x01\x00\x00\x00")
+    optimized = optimize_png(original)
+    assert b"tIME" not in optimized
+    assert decode_png(optimized)[5] == gradient(8, 8, 4)
+
+
+def test_already_optimal_and_interlaced_files_are_returned_unchanged():
+    optimized = optimize_png(png_bytes(16, 16, gradient(16, 16, 4)))
+    assert optimize_png(optimized) is optimized
+    interlaced = bytearray(png_bytes(4, 4, bytes(64)))
+    interlaced[28] = 1
+    interlaced[29:33] = struct.pack(">I", zlib.crc32(bytes(interlaced[12:29])))
+    assert optimize_png(bytes(interlaced)) == bytes(interlaced)
+
+
+def test_bad_input_is_rejected():
+    with pytest.raises(ValueError):
+        optimize_png(b"GIF89a")
+    truncated = png_bytes(8, 8, bytes(256))
+    idat = truncated.index(b"IDAT") - 4
+    body = zlib.compress(b"\0" * 10)
+    with pytest.raises(ValueError, match="truncated"):
+        optimize_png(truncated[:idat] + chunk(b"IDAT", body) + chunk(b"IEND", b""))
+
+
+def install_texture(pack, name, pixels):
+    folder = pack.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / name
+    folder.mkdir(parents=True, exist_ok=True)
+    data = png_bytes(16, 16, pixels)
+    (folder / f"{name}.png").write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_entries(pack):
+    return sorted(p.name for p in (pack.base_dir / ".png_cache").iterdir())
+
+
+def test_cache_holds_each_input_and_result_once(pack):
+    digest = install_texture(pack, "emberfox", gradient(16, 16, 4))
+    assert pack.optimize_species_textures(["emberfox"], workers=1)
+    installed = (pack.resource_pack_dir / "assets/cobblemon/textures/pokemon/emberfox/emberfox.png").read_bytes()
+    assert cache_entries(pack) == sorted([f"{digest}.png", f"{hashlib.sha256(installed).hexdigest()}.keep"])
+    assert (pack.base_dir / ".png_cache" / f"{digest}.png").read_bytes() == installed
+
+
+def test_whole_pack_run_prunes_entries_nothing_uses(pack):
+    old = install_texture(pack, "emberfox", gradient(16, 16, 4))
+    install_texture(pack, "tidefox", bytes(16 * 16 * 4))
+    assert pack.optimize_species_textures(["emberfox", "tidefox"], workers=1)
+    (pack.base_dir / ".png_cache" / ".deadbeef.png.tmp").write_bytes(b"partial")
+
+    install_texture(pack, "emberfox", bytes(reversed(gradient(16, 16, 4))))
+    assert pack.optimize_species_textures(["emberfox"], workers=1)  # one species: nothing pruned
+    assert f"{old}.png" in cache_entries(pack)
+
+    assert pack.optimize_species_textures(pack.texture_species(), workers=1, prune=True)
+    installed = sorted(hashlib.sha256(p.read_bytes()).hexdigest()
+                       for p in (pack.resource_pack_dir / "assets/cobblemon/textures/pokemon").rglob("*.png"))
+    assert cache_entries(pack) == [f"{digest}.keep" for digest in installed]  # still hits on the next run
@@ -0,0 +1,74 @@
+import json
+
+from cobblemon_packgen import api
+from conftest import drop_assets
+
+
+def create(pack, *names):
+    for number, name in enumerate(names, 1100):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name, "number": number})['ok']
+
+
+def species_names(pack):
+    folder = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+    return {path.stem: json.loads(path.read_text(encoding='utf-8'))['name'] for path in folder.glob("*.json")}
+
+
+def textures(pack, name):
+    return sorted(p.name for p in (pack.resource_pack_dir / "assets/cobblemon/textures/pokemon" / name).iterdir())
+
+
+def resolver(pack, name):
+    path = pack.resource_pack_dir / "assets/cobblemon/bedrock/pokemon/resolvers" / f"0_{name}_base.json"
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def test_a_name_that_prefixes_another_renames_only_its_own_files(pack):
+    create(pack, "pika", "pikachu", "sir_pika")
+    (pack.resource_pack_dir / "assets/cobblemon/textures/pokemon/pika/pikachu_sketch.png").write_bytes(b"x")
+    assert api.rename_species(pack, {"pika": "volt"})['ok']
+    assert species_names(pack) == {"volt": "volt", "pikachu": "pikachu", "sir_pika": "sir_pika"}
+    assert textures(pack, "volt") == ["pikachu_sketch.png", "volt.png"]
+    assert textures(pack, "pikachu") == ["pikachu.png"]
+    assert resolver(pack, "volt")['species'] == "cobblemon:volt"
+    assert resolver(pack, "sir_pika")['species'] == "cobblemon:sir_pika"
+    assert resolver(pack, "pikachu")['species'] == "cobblemon:pikachu"
+
+
+def test_swap(pack):
+    create(pack, "emberfox", "tidefox")
+    assert api.rename_species(pack, {"emberfox": "tidefox", "tidefox": "emberfox"})['ok']
+    assert species_names(pack) == {"emberfox": "emberfox", "tidefox": "tidefox"}
+    for name in ("emberfox", "tidefox"):
+        variation = resolver(pack, name)['variations'][0]
+        assert resolver(pack, name)['species'] == f"cobblemon:{name}"
+        assert (variation['model'], variation['poser'], variation['texture']) == \
+            (f"cobblemon:{name}.geo", f"cobblemon:{name}", f"cobblemon:textures/pokemon/{name}/{name}.png")
+    assert textures(pack, "emberfox") == ["emberfox.png"] and textures(pack, "tidefox") == ["tidefox.png"]
+    species = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+    assert json.loads((species / "tidefox.json").read_text(encoding='utf-8'))['nationalPokedexNumber'] == 1100
+
+
+def test_chain(pack, tmp_path):
+    create(pack, "a", "b")
+    mapping = tmp_path / "renames.csv"
+    mapping.write_text("old,new\na,b\nb,c\n", encoding='utf-8')
+    assert pack.rename_map(str(mapping))
+    assert species_names(pack) == {"b": "b", "c": "c"}
+    species = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+    assert json.loads((species / "b.json").read_text(encoding='utf-8'))['nationalPokedexNumber'] == 1100
+    assert json.loads((species / "c.json").read_text(encoding='utf-8'))['nationalPokedexNumber'] == 1101
+    assert textures(pack, "b") == ["b.png"] and textures(pack, "c") == ["c.png"]
+
+
+def test_collisions_in_a_rename_map_change_nothing(pack, tmp_path, capsys):
+    create(pack, "a", "b", "c")
+    mapping = tmp_path / "renames.csv"
+    for rows, message in [("a,z\nb,z\n", "'a' and 'b' are both renamed to 'z'"),
+                          ("a,c\n", "A Pokémon named 'c' already exists"),
+                          ("a,x\na,y\n", "'a' is renamed twice")]:
+        mapping.write_text(rows, encoding='utf-8')
+        assert not pack.rename_map(str(mapping))
+        assert message in capsys.readouterr().out
+        assert species_names(pack) == {"a": "a", "b": "b", "c": "c"}
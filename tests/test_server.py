@@ -0,0 +1,110 @@
+import json
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from cobblemon_packgen.server import PackServer, remove_stale_socket
+
+
+def test_remove_stale_socket_only_removes_sockets(tmp_path):
+    path = tmp_path / "s.sock"
+    remove_stale_socket(str(path))  # nothing there: fine
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(path))
+    stale.close()
+    remove_stale_socket(str(path))
+    assert not path.exists()
+
+    important = tmp_path / "important.json"
+    important.write_text("{}")
+    with pytest.raises(ValueError, match="not a socket"):
+        remove_stale_socket(str(important))
+    assert important.read_text() == "{}"
+
+
+def test_remove_stale_socket_refuses_a_live_socket(tmp_path):
+    path = tmp_path / "s.sock"
+    live = socket.socket(socket.AF_UNIX)
+    live.bind(str(path))
+    live.listen(1)
+    try:
+        with pytest.raises(ValueError, match="already listening"):
+            remove_stale_socket(str(path))
+        assert path.exists()
+    finally:
+        live.close()
+
+
+def test_second_server_on_the_same_path_is_refused(pack, tmp_path):
+    path = tmp_path / "s.sock"
+    first = threading.Thread(target=PackServer(pack).serve, args=(str(path),))
+    first.start()
+    wait_for(path)
+    try:
+        with pytest.raises(ValueError, match="already listening"):
+            PackServer(pack).serve(str(path))
+        assert path.exists()
+        with socket.socket(socket.AF_UNIX) as client:  # the first server still answers
+            client.connect(str(path))
+            client.sendall(b'{"jsonrpc": "2.0", "id": 1, "method": "shutdown"}\n')
+            reply = json.loads(client.makefile('r', encoding='utf-8').readline())
+        assert reply == {"jsonrpc": "2.0", "id": 1, "result": {"ok": True, "log": ""}}
+    finally:
+        first.join(5)
+    assert not path.exists()
+
+
+def test_serve_refuses_to_replace_a_regular_file(pack, tmp_path):
+    important = tmp_path / "important.json"
+    important.write_text("{}")
+    with pytest.raises(ValueError):
+        PackServer(pack).serve(str(important))
+    assert important.read_text() == "{}"
+
+
+def wait_for(path):
+    for _ in range(200):
+        if path.exists():
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"{path} never appeared")
+
+
+def test_socket_is_removed_after_shutdown(pack, tmp_path):
+    path = tmp_path / "s.sock"
+    thread = threading.Thread(target=PackServer(pack).serve, args=(str(path),))
+    thread.start()
+    wait_for(path)
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(str(path))
+        client.sendall(b'{"jsonrpc": "2.0", "id": 1, "method": "show"}\n'
+                       b'{"jsonrpc": "2.0", "id": 2, "method": "shutdown"}\n')
+        replies = client.makefile('r', encoding='utf-8').read().splitlines()
+    thread.join(5)
+    assert [json.loads(r)['id'] for r in replies] == [1, 2]
+    assert json.loads(replies[0])['result']['species'] == []
+    assert not path.exists()
+
+
+def test_socket_is_removed_when_serving_fails(pack, tmp_path, monkeypatch):
+    path = tmp_path / "s.sock"
+
+    def broken(self):
+        raise OSError("accept failed")
+
+    monkeypatch.setattr(socketserver.UnixStreamServer, "handle_request", broken, raising=False)
+    with pytest.raises(OSError):
+        PackServer(pack).serve(str(path))
+    assert not path.exists()
+
+
+def test_handle_reports_protocol_errors(pack):
+    rpc = PackServer(pack)
+    assert rpc.handle("{nope")['error']['code'] == -32700
+    assert rpc.handle('[1]')['error']['code'] == -32600
+    assert rpc.handle('{"jsonrpc": "2.0", "id": 3, "method": "fly"}')['error']['code'] == -32601
+    assert rpc.handle('{"jsonrpc": "2.0", "id": 4, "method": "rename", "params": {}}')['error']['code'] == -32602
+    assert rpc.handle('{"jsonrpc": "2.0", "method": "show"}') is None  # notification
@@ -0,0 +1,62 @@
+import struct
+
+from cobblemon_packgen import api
+from cobblemon_packgen.generator import inspect_texture, model_texture_size
+from conftest import drop_assets, png_bytes
+
+
+def tex_dir(pack, name):
+    return pack.resource_pack_dir / "assets" / "cobblemon" / "textures" / "pokemon" / name
+
+
+def test_png_size_comes_from_the_header_alone(tmp_path):
+    path = tmp_path / "big.png"
+    # a 4096x2048 header followed by garbage: nothing past IHDR is read or decoded
+    path.write_bytes(png_bytes(4096, 2048, b"", color_type=2)[:33] + b"\xff" * 100)
+    assert inspect_texture(path) == {"format": "png", "width": 4096, "height": 2048, "bit_depth": 8, "color": "rgb"}
+
+
+def test_format_is_detected_by_content(tmp_path):
+    tga = tmp_path / "looks_like.png"
+    tga.write_bytes(struct.pack('<BBBHHBHHHHBB', 0, 0, 2, 0, 0, 0, 0, 0, 64, 32, 32, 8) + b"\0" * 64)
+    assert inspect_texture(tga) == {"format": "tga", "width": 64, "height": 32, "bit_depth": 32, "color": "rgb"}
+    junk = tmp_path / "junk.png"
+    junk.write_bytes(b"not an image at all")
+    assert inspect_texture(junk) == {"format": None}
+
+
+def test_model_texture_size(tmp_path):
+    drop_assets(tmp_path, "emberfox")
+    assert model_texture_size(tmp_path / "emberfox.geo.json") == (2, 2)
+    (tmp_path / "bare.geo.json").write_text('{"minecraft:geometry": [{"description": {}}]}', encoding='utf-8')
+    assert model_texture_size(tmp_path / "bare.geo.json") is None
+
+
+def test_texture_issues_cross_check_the_model(pack):
+    drop_assets(pack.base_dir, "emberfox")  # the model declares 2x2
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    assert pack.texture_issues("emberfox") == (1, [])
+
+    folder = tex_dir(pack, "emberfox")
+    (folder / "emberfox_shiny.png").write_bytes(png_bytes(4, 4, bytes(64)))  # scaled x2: fine
+    (folder / "emberfox_glow.png").write_bytes(png_bytes(3, 2, bytes(24)))
+    (folder / "notes.png").write_bytes(b"hello")
+    count, issues = pack.texture_issues("emberfox")
+    assert count == 4
+    assert ("NOTE", "emberfox_shiny.png: 4x4 is the model's 2x2 scaled x2") in issues
+    assert ("ERROR", "emberfox_glow.png: 3x2 but the model expects 2x2 (texture_width/texture_height)") in issues
+    assert ("ERROR", "notes.png: not a PNG or TGA image") in issues
+    assert ("WARNING", "emberfox_shiny.png is 4x4, emberfox.png is 2x2") in issues
+
+
+def test_check_textures_fails_only_on_errors(pack, capsys):
+    for number, name in enumerate(("emberfox", "tidefox"), 1100):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name, "number": number})['ok']
+    assert pack.validate_textures(workers=2)
+    (tex_dir(pack, "tidefox") / "tidefox.png").write_bytes(png_bytes(5, 5, bytes(100)))
+    capsys.readouterr()
+    assert not pack.validate_textures(workers=2)
+    out = capsys.readouterr().out
+    assert "ERROR: tidefox: tidefox.png: 5x5 but the model expects 2x2" in out
+    assert "2 texture(s) across 2 Pokémon" in out
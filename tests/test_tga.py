@@ -0,0 +1,112 @@
+import struct
+
+import pytest
+
+from cobblemon_packgen.generator import convert_tga_to_png, inspect_texture
+from conftest import decode_png
+
+TOP_DOWN = 0x20
+
+
+def tga(image_type, depth, width, height, pixel_data, descriptor=TOP_DOWN, colormap=None):
+    cmap_type, cmap_length, cmap_depth, cmap_data = 0, 0, 0, b""
+    if colormap is not None:
+        cmap_type, cmap_length, cmap_depth = 1, len(colormap), 24
+        cmap_data = b"".join(bytes((b, g, r)) for r, g, b in colormap)
+    return struct.pack('<BBBHHBHHHHBB', 0, cmap_type, image_type, 0, cmap_length, cmap_depth,
+                       0, 0, width, height, depth, descriptor) + cmap_data + pixel_data
+
+
+def convert(tmp_path, data):
+    src, dest = tmp_path / "in.tga", tmp_path / "out.png"
+    src.write_bytes(data)
+    assert convert_tga_to_png(src, dest) == {"width": 2, "height": 2}
+    width, height, color_type, depth, _palette, pixels = decode_png(dest.read_bytes())
+    assert (color_type, depth) == (6, 8)
+    return [tuple(pixels[i:i + 4]) for i in range(0, len(pixels), 4)]
+
+
+RED, GREEN, BLUE, WHITE = (255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255), (255, 255, 255, 255)
+
+
+def test_32_bit_bgra_bottom_up(tmp_path):
+    # bottom row first in the file
+    data = bytes((0, 0, 255, 255, 255, 255, 255, 128)) + bytes((0, 255, 0, 255, 255, 0, 0, 0))
+    assert convert(tmp_path, tga(2, 32, 2, 2, data, descriptor=8)) == \
+        [GREEN, (0, 0, 255, 0), RED, (255, 255, 255, 128)]
+
+
+def test_24_bit_rle(tmp_path):
+    # one run of 3 red pixels, then one raw blue pixel
+    data = bytes((0x82, 0, 0, 255, 0x00, 255, 0, 0))
+    assert convert(tmp_path, tga(10, 24, 2, 2, data)) == [RED, RED, RED, BLUE]
+
+
+def test_8_bit_greyscale(tmp_path):
+    assert convert(tmp_path, tga(3, 8, 2, 2, bytes((0, 64, 128, 255)))) == \
+        [(0, 0, 0, 255), (64, 64, 64, 255), (128, 128, 128, 255), WHITE]
+
+
+def test_16_bit_greyscale_with_alpha(tmp_path):
+    data = bytes((10, 255, 200, 0, 90, 128, 255, 255))  # luminance, alpha per pixel
+    assert convert(tmp_path, tga(3, 16, 2, 2, data, descriptor=TOP_DOWN | 8)) == \
+        [(10, 10, 10, 255), (200, 200, 200, 0), (90, 90, 90, 128), WHITE]
+
+
+def test_16_bit_greyscale_rle_without_alpha_bits(tmp_path):
+    data = bytes((0x83, 77, 3))  # 4 x luminance 77; alpha byte ignored (descriptor says 0 alpha bits)
+    assert convert(tmp_path, tga(11, 16, 2, 2, data)) == [(77, 77, 77, 255)] * 4
+
+
+def test_16_bit_argb1555(tmp_path):
+    pixels = [0x8000 | 31 << 10, 31 << 5, 0x8000 | 31, 0xFFFF]  # red, transparent green, blue, white
+    data = struct.pack('<4H', *pixels)
+    assert convert(tmp_path, tga(2, 16, 2, 2, data, descriptor=TOP_DOWN | 1)) == \
+        [RED, (0, 255, 0, 0), BLUE, WHITE]
+
+
+def test_colour_mapped_right_to_left(tmp_path):
+    data = bytes((0, 1, 2, 0))
+    assert convert(tmp_path, tga(1, 8, 2, 2, data, descriptor=TOP_DOWN | 0x10,
+                                 colormap=[(255, 0, 0), (0, 255, 0), (0, 0, 255)])) == \
+        [GREEN, RED, RED, BLUE]
+
+
+def test_unsupported_greyscale_depth_is_rejected(tmp_path):
+    src = tmp_path / "in.tga"
+    src.write_bytes(tga(3, 24, 2, 2, b"\0" * 12))
+    with pytest.raises(ValueError, match="greyscale"):
+        convert_tga_to_png(src, tmp_path / "out.png")
+    assert not (tmp_path / "out.png").exists()
+
+
+def test_truncated_data_leaves_no_output(tmp_path):
+    src = tmp_path / "in.tga"
+    src.write_bytes(tga(2, 24, 2, 2, b"\0" * 5))
+    with pytest.raises(ValueError, match="truncated"):
+        convert_tga_to_png(src, tmp_path / "out.png")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.tga"]
+
+
+def test_inspect_reads_the_header(tmp_path):
+    src = tmp_path / "grey.png"  # TGA data with the wrong extension
+    src.write_bytes(tga(3, 16, 2, 2, b"\0" * 8))
+    assert inspect_texture(src) == {"format": "tga", "width": 2, "height": 2, "bit_depth": 16, "color": "grey"}
+
+
+def test_true_colour_with_a_colour_map_ignores_the_map(tmp_path):
+    data = bytes((0, 0, 255, 0, 255, 0, 255, 0, 0, 255, 255, 255))  # BGR: red, green, blue, white
+    assert convert(tmp_path, tga(2, 24, 2, 2, data, colormap=[(9, 9, 9), (8, 8, 8)])) == [RED, GREEN, BLUE, WHITE]
+
+
+def test_true_colour_rle_with_a_colour_map_ignores_the_map(tmp_path):
+    data = bytes((0x83, 0, 0, 255, 255))  # 4 x opaque red (BGRA)
+    assert convert(tmp_path, tga(10, 32, 2, 2, data, descriptor=TOP_DOWN | 8, colormap=[(1, 2, 3)])) == [RED] * 4
+
+
+def test_malformed_pixel_data_is_a_value_error(tmp_path):
+    src = tmp_path / "in.tga"
+    src.write_bytes(tga(1, 24, 2, 2, b"\0" * 12, colormap=[(1, 2, 3)]))
+    with pytest.raises(ValueError):
+        convert_tga_to_png(src, tmp_path / "out.png")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.tga"]
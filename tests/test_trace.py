@@ -0,0 +1,71 @@
+import sys
+import json
+
+import pytest
+
+from cobblemon_packgen import api, cli, trace
+from conftest import drop_assets
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """A fresh tracer in place of the global one, always stopped afterwards"""
+    fresh = trace.Tracer()
+    monkeypatch.setattr(trace, "TRACER", fresh)
+    yield fresh
+    fresh.stop()
+
+
+def complete_events(data):
+    return [event for event in data['traceEvents'] if event['ph'] == 'X']
+
+
+def test_trace_file_is_chrome_trace_json(tracer, tmp_path):
+    trace.start()
+    with trace.span("outer", species="emberfox"):
+        trace.step("write")
+        with open(tmp_path / "out.json", 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"x": [1, 2, 3]}))
+        trace.step("read")
+        with open(tmp_path / "out.json", 'r', encoding='utf-8') as f:
+            json.load(f)
+    trace.stop()
+    assert trace.write(str(tmp_path / "trace.json"), {'command': "test"}) == 3
+
+    data = json.loads((tmp_path / "trace.json").read_text(encoding='utf-8'))
+    assert data['displayTimeUnit'] == "ms" and data['otherData'] == {'command': "test"}
+    assert {event['name'] for event in data['traceEvents'] if event['ph'] == 'M'} == {"process_name", "thread_name"}
+    events = {event['name']: event for event in complete_events(data)}
+    assert sorted(events) == ["outer", "read", "write"]
+    for event in events.values():
+        assert event['cat'] == "packgen" and event['dur'] >= 0
+        assert isinstance(event['pid'], int) and isinstance(event['tid'], int)
+    outer, write, read = events['outer'], events['write'], events['read']
+    assert outer['ts'] <= write['ts'] <= read['ts'] <= outer['ts'] + outer['dur']
+    assert outer['args']['species'] == "emberfox"
+    assert write['args']['files_written'] == 1 and write['args']['bytes_written'] == len('{"x": [1, 2, 3]}')
+    assert read['args']['files_read'] == 1 and read['args']['bytes_read'] == write['args']['bytes_written']
+    assert outer['args']['files'] == [str(tmp_path / "out.json")]
+
+
+def test_tracing_off_records_nothing(tracer, tmp_path):
+    with trace.span("ignored"):
+        trace.step("also ignored")
+    assert tracer.events == []
+
+
+def test_profile_out_traces_a_cli_run(tracer, pack, tmp_path, monkeypatch, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    out = tmp_path / "profiles" / "edit.json"
+    monkeypatch.setattr(sys, "argv", ["pack-generator.py", "--downloads", str(tmp_path), "--edit", "emberfox",
+                                      "--hp", "80", "--profile-out", str(out)])
+    cli.main()
+    assert "[OK] Trace written to" in capsys.readouterr().out
+    data = json.loads(out.read_text(encoding='utf-8'))
+    names = [event['name'] for event in complete_events(data)]
+    assert "pack-generator" in names and "edit_pokemon" in names
+    root = next(event for event in complete_events(data) if event['name'] == "pack-generator")
+    assert root['args']['files_written'] >= 1
+    assert data['otherData']['command'].endswith("--profile-out " + str(out))
+    assert not tracer.enabled
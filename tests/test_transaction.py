@@ -0,0 +1,73 @@
+import os
+import json
+
+import pytest
+
+from cobblemon_packgen.generator import PackTransaction
+
+
+def write_json(path, data, file_class):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_commit_writes_each_dirty_file_once(tmp_path):
+    a, b = tmp_path / "a.json", tmp_path / "sub" / "b.json"
+    a.write_text('{"hp": 1}')
+    txn = PackTransaction()
+    txn.load(a)["hp"] = 2
+    txn.mark_dirty(a, "species")
+    txn.set(b, {"new": True}, "lang")
+    written = txn.commit(write_json)
+    assert set(written) == {a, b}
+    assert read(a) == {"hp": 2} and read(b) == {"new": True}
+    assert sorted(p.name for p in tmp_path.rglob("*")) == ["a.json", "b.json", "sub"]
+    assert txn.commit(write_json) == {}  # nothing dirty any more
+
+
+def test_failed_staging_leaves_pack_and_no_temp_files(tmp_path):
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text('{"hp": 1}')
+    b.write_text('{"hp": 1}')
+
+    def failing_write(path, data, file_class):
+        if path.name.startswith(".b.json"):
+            path.write_text("{half")
+            raise OSError("disk full")
+        write_json(path, data, file_class)
+
+    txn = PackTransaction()
+    txn.set(a, {"hp": 2}, "species")
+    txn.set(b, {"hp": 2}, "species")
+    with pytest.raises(OSError):
+        txn.commit(failing_write)
+    assert read(a) == {"hp": 1} and read(b) == {"hp": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json"]
+
+
+def test_failed_swap_restores_files_already_swapped(tmp_path, monkeypatch):
+    a, b, c = tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"
+    a.write_text('{"hp": 1}')
+    c.write_text('{"hp": 1}')
+    txn = PackTransaction()
+    txn.set(a, {"hp": 2}, "species")
+    txn.set(b, {"hp": 2}, "species")  # new file
+    txn.set(c, {"hp": 2}, "species")
+
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if str(src).endswith(".c.json.edit-tmp"):
+            raise OSError("locked")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace)
+    with pytest.raises(OSError):
+        txn.commit(write_json)
+    assert read(a) == {"hp": 1} and read(c) == {"hp": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "c.json"]
@@ -0,0 +1,111 @@
+import json
+
+from cobblemon_packgen import api, generator
+from conftest import drop_assets
+
+
+def run_watch(pack, monkeypatch, steps, configs):
+    """Run pack.watch(), doing steps[i]() before poll i; stops after the last step"""
+    steps = list(steps)
+
+    def sleep(_seconds):
+        if not steps:
+            raise KeyboardInterrupt
+        steps.pop(0)()
+
+    monkeypatch.setattr(generator.time, "sleep", sleep)
+    pack.watch(lambda: configs, poll=0, settle=0)
+
+
+def entry(name, number):
+    return {'name': name, 'config': api.species_config({"name": name, "number": number})}
+
+
+def test_a_failing_species_does_not_stop_the_watcher(pack, monkeypatch, capsys):
+    configs = {"brokenfox": entry("Brokenfox", 1101), "emberfox": entry("Emberfox", 1100)}
+
+    def broken_drop():
+        drop_assets(pack.base_dir, "brokenfox")
+        (pack.base_dir / "brokenfox.animation.json").write_text("{not json", encoding='utf-8')
+
+    real_validate = pack.validate_animations
+
+    def validate(anim_file, name):
+        json.loads(anim_file.read_text(encoding='utf-8'))  # malformed export: raises
+        return real_validate(anim_file, name)
+
+    monkeypatch.setattr(pack, "validate_animations", validate)
+    run_watch(pack, monkeypatch, [broken_drop, lambda: None, lambda: drop_assets(pack.base_dir, "emberfox"),
+                                  lambda: None], configs)
+    out = capsys.readouterr().out
+    assert out.count("ERROR: brokenfox failed: JSONDecodeError") == 1  # not retried until saved again
+    assert "Watch stopped." in out
+    species = pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom"
+    assert (species / "emberfox.json").exists()
+    assert (pack.base_dir / "brokenfox.geo.json").exists()  # left for the user to fix
+
+
+def test_a_fixed_drop_is_retried(pack, monkeypatch, capsys):
+    configs = {"emberfox": entry("Emberfox", 1100)}
+    calls = []
+    real_generate = pack.generate_pokemon
+
+    def generate(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise OSError("disk full")
+        return real_generate(*args, **kwargs)
+
+    monkeypatch.setattr(pack, "generate_pokemon", generate)
+
+    def resave():
+        texture = pack.base_dir / "emberfox.png"
+        texture.write_bytes(texture.read_bytes() + b"\0")
+
+    run_watch(pack, monkeypatch, [lambda: drop_assets(pack.base_dir, "emberfox"), lambda: None, resave,
+                                  lambda: None], configs)
+    assert calls == ["Emberfox", "Emberfox"]
+    assert "ERROR: emberfox failed: OSError: disk full" in capsys.readouterr().out
+    assert (pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / "emberfox.json").exists()
+
+
+def test_a_reported_failure_is_not_taken_as_done(pack, monkeypatch, capsys):
+    configs = {"emberfox": entry("Emberfox", 1100)}
+    calls = []
+    real_generate = pack.generate_pokemon
+
+    def generate(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 1:
+            print("ERROR: Model validation failed")
+            return False
+        return real_generate(*args, **kwargs)
+
+    monkeypatch.setattr(pack, "generate_pokemon", generate)
+
+    def resave():
+        model = pack.base_dir / "emberfox.geo.json"
+        model.write_text(model.read_text(encoding='utf-8') + "\n", encoding='utf-8')
+
+    run_watch(pack, monkeypatch, [lambda: drop_assets(pack.base_dir, "emberfox"), lambda: None, lambda: None,
+                                  resave, lambda: None], configs)
+    out = capsys.readouterr().out
+    assert calls == ["Emberfox", "Emberfox"]  # not retried until saved again, then retried
+    assert out.count("ERROR: emberfox failed: see the messages above") == 1
+    assert (pack.behavior_pack_dir / "data" / "cobblemon" / "species" / "custom" / "emberfox.json").exists()
+
+
+def test_a_failed_file_swap_is_retried(pack, monkeypatch, capsys):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    calls = []
+    monkeypatch.setattr(pack, "edit_files", lambda name, files: calls.append(name) or len(calls) > 1)
+
+    def resave():
+        texture = pack.base_dir / "emberfox.png"
+        texture.write_bytes(texture.read_bytes() + b"\0")
+
+    run_watch(pack, monkeypatch, [lambda: drop_assets(pack.base_dir, "emberfox", "geometry.ember"), lambda: None,
+                                  resave, lambda: None], {})
+    assert calls == ["emberfox", "emberfox"]
+    assert capsys.readouterr().out.count("ERROR: emberfox failed") == 1
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from cobblemon_packgen import api
+from cobblemon_packgen.generator import parse_where, where_matches, parse_set, set_path, _MISSING
+from conftest import drop_assets
+
+RECORD = {"name": "emberfox", "number": 1100, "primary_type": "fire", "secondary_type": None,
+          "labels": ["custom", "Legendary"], "catch_rate": 45, "pre_evolution": None,
+          "base_stats": {"hp": 80, "attack": 95}}
+
+
+@pytest.mark.parametrize("spec,expected", [
+    ("primaryType=fire", [("primary_type", None, "=", "fire")]),
+    (" labels ~ legendary , baseStats.hp>=100 ", [("labels", None, "~", "legendary"),
+                                                  ("base_stats", "hp", ">=", 100.0)]),
+    ("nationalPokedexNumber<1000,number!=5", [("number", None, "<", 1000.0), ("number", None, "!=", "5")]),
+    ("CATCHRATE>3,preEvolution=", [("catch_rate", None, ">", 3.0), ("pre_evolution", None, "=", "")]),
+])
+def test_parse_where_accepts(spec, expected):
+    assert parse_where(spec) == expected
+
+
+@pytest.mark.parametrize("spec,message", [
+    ("", "empty"),
+    (" , ", "empty"),
+    ("primaryType", "field<op>value"),
+    ("colour=red", "unknown --where field"),
+    ("baseStats.hp>=lots", "needs a number"),
+    ("catchRate<", "needs a number"),
+    ("primary-type=fire", "field<op>value"),
+])
+def test_parse_where_rejects(spec, message):
+    with pytest.raises(ValueError, match=message):
+        parse_where(spec)
+
+
+@pytest.mark.parametrize("spec,matches", [
+    ("primaryType=FIRE", True),
+    ("primaryType!=fire", False),
+    ("labels~legendary", True),  # list: whole item, any case
+    ("labels~legend", False),
+    ("name~mber", True),  # string: substring
+    ("secondaryType=", True),  # missing compares as empty
+    ("baseStats.hp>=80,baseStats.attack>90", True),
+    ("baseStats.hp>80", False),
+    ("baseStats.speed>0", False),  # missing stats never satisfy numeric filters
+    ("baseStats.speed<1000", False),
+    ("catchRate<=45,number>1000", True),
+])
+def test_where_matches(spec, matches):
+    assert where_matches(RECORD, parse_where(spec)) is matches
+
+
+def test_parse_set_values_and_scopes():
+    assert parse_set('catchRate=90,baseStats.hp=80,spawn.weight=0.02,labels=["a","b"],'
+                     'spawn.condition.canSeeSky=true,eggGroups=[],behaviour={"walk":{"canWalk":true,"x":1}},'
+                     'pokedex=Some text') == [
+        ("species", ["catchRate"], 90),
+        ("species", ["baseStats", "hp"], 80),
+        ("spawn", ["weight"], 0.02),
+        ("species", ["labels"], ["a", "b"]),
+        ("spawn", ["condition", "canSeeSky"], True),
+        ("species", ["eggGroups"], []),
+        ("species", ["behaviour"], {"walk": {"canWalk": True, "x": 1}}),
+        ("species", ["pokedex"], "Some text"),
+    ]
+
+
+@pytest.mark.parametrize("spec,message", [
+    ("", "empty"),
+    ("catchRate", "field=value"),
+    ("baseStats..hp=3", "field path"),
+    ("spawn=3", "field path"),
+    ("name=other", "can't be bulk-set"),
+    ("evolutions=[]", "can't be bulk-set"),
+    ("preEvolution=x", "can't be bulk-set"),
+    ("spawn.pokemon=x", "can't be bulk-set"),
+    ("spawn.id=x", "can't be bulk-set"),
+])
+def test_parse_set_rejects(spec, message):
+    with pytest.raises(ValueError, match=message):
+        parse_set(spec)
+
+
+def test_set_path():
+    data = {"baseStats": {"hp": 1}, "catchRate": 3}
+    assert set_path(data, ["baseStats", "hp"], 80) == 1
+    assert set_path(data, ["behaviour", "walk", "canWalk"], True) is _MISSING
+    assert data == {"baseStats": {"hp": 80}, "catchRate": 3, "behaviour": {"walk": {"canWalk": True}}}
+    with pytest.raises(ValueError, match="not an object"):
+        set_path(data, ["catchRate", "x"], 1)
+
+
+@pytest.fixture
+def two_species(pack):
+    """emberfox (with a spawn file) and tidefox (without one), both catch rate 45"""
+    for name, number in (("emberfox", 1100), ("tidefox", 1101)):
+        drop_assets(pack.base_dir, name)
+        assert api.create_species(pack, {"name": name.capitalize(), "number": number})['ok']
+    (pack.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" / "tidefox.json").unlink()
+    return pack
+
+
+def test_bulk_edit_reports_a_missing_spawn_file_once(two_species, capsys):
+    capsys.readouterr()
+    assert two_species.bulk_edit("catchRate=45", "spawn.weight=3,spawn.level=5-9", confirm=True)
+    out = capsys.readouterr().out
+    assert out.count("tidefox: no spawn file — spawn.weight, spawn.level skipped") == 1
+    assert "[OK] 1 Pokémon updated, 1 without a spawn file (spawn fields skipped)" in out
+    spawn = json.loads((two_species.behavior_pack_dir / "data" / "cobblemon" / "spawn_pool_world" /
+                        "emberfox.json").read_text(encoding='utf-8'))
+    assert {entry['weight'] for entry in spawn['spawns']} == {3}
+
+
+def test_bulk_edit_counts_species_changes_despite_a_missing_spawn_file(two_species, capsys):
+    capsys.readouterr()
+    assert two_species.bulk_edit("catchRate=45", "catchRate=90,spawn.weight=3")
+    out = capsys.readouterr().out
+    assert "PREVIEW: 2 Pokémon would change, 1 without a spawn file (spawn fields skipped)." in out
+    assert "catchRate: 45 → 90" in out
+
+
+def test_bulk_edit_with_nothing_to_change_but_skips(two_species, capsys):
+    two_species.bulk_edit("name=tidefox", "spawn.weight=3", confirm=True)
+    out = capsys.readouterr().out
+    assert "[OK] 0 Pokémon updated, 1 without a spawn file (spawn fields skipped)" in out
+    assert "already has these values" not in out
@@ -0,0 +1,76 @@
+import os
+import zipfile
+
+from cobblemon_packgen import api
+from cobblemon_packgen.generator import ZipMemberCache, write_deterministic_zip, is_shipped_file
+from conftest import drop_assets
+
+
+def fill(root):
+    (root / "assets" / "lang").mkdir(parents=True)
+    (root / "pack.mcmeta").write_text('{"pack": {"pack_format": 15}}')
+    (root / "assets" / "lang" / "en_us.json").write_text('{"a": "A"}' * 50)
+    (root / "assets" / "noise.bin").write_bytes(os.urandom(512))  # incompressible: stored
+    (root / "assets" / "empty.txt").write_bytes(b"")
+
+
+def test_zip_opens_and_matches_the_files(tmp_path):
+    root = tmp_path / "resource_pack"
+    fill(root)
+    result = write_deterministic_zip(tmp_path / "out.zip", root, ZipMemberCache(tmp_path / "cache"))
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names == sorted(names) == ["assets/empty.txt", "assets/lang/en_us.json", "assets/noise.bin",
+                                          "pack.mcmeta"]
+        for name in names:
+            assert archive.read(name) == (root / name).read_bytes()
+        infos = {i.filename: i for i in archive.infolist()}
+        assert infos["assets/noise.bin"].compress_type == zipfile.ZIP_STORED
+        assert infos["assets/lang/en_us.json"].compress_type == zipfile.ZIP_DEFLATED
+        assert {i.date_time for i in infos.values()} == {(1980, 1, 1, 0, 0, 0)}
+    assert result["files"] == 4 and result["skipped"] == []
+
+
+def test_zip_is_byte_identical_across_runs_and_cache_states(tmp_path):
+    root = tmp_path / "pack"
+    fill(root)
+    cache = ZipMemberCache(tmp_path / "cache")
+    first = write_deterministic_zip(tmp_path / "a.zip", root, cache)
+    assert cache.misses == 4 and cache.hits == 0
+    os.utime(root / "pack.mcmeta", (0, 0))  # timestamps must not matter
+    warm = ZipMemberCache(tmp_path / "cache")
+    write_deterministic_zip(tmp_path / "b.zip", root, warm)
+    assert warm.hits == 4 and warm.misses == 0
+    assert (tmp_path / "a.zip").read_bytes() == (tmp_path / "b.zip").read_bytes()
+    again = write_deterministic_zip(tmp_path / "a.zip", root, warm)
+    assert not first["unchanged"] and again["unchanged"]
+
+
+def test_stray_files_are_left_out(tmp_path):
+    root = tmp_path / "pack"
+    fill(root)
+    strays = [".lang_journal.jsonl", ".pack_index_cache.sqlite", ".en_us.json.edit-tmp", "en_us.json~",
+              "en_us.json.bak", "#en_us.json#", "model.geo.json.tmp", "Thumbs.db", "desktop.ini"]
+    for name in strays:
+        (root / "assets" / "lang" / name).write_text("x")
+    (root / ".git").mkdir()
+    (root / ".git" / "HEAD").write_text("x")
+    result = write_deterministic_zip(tmp_path / "out.zip", root, ZipMemberCache(tmp_path / "cache"))
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert len(archive.namelist()) == 4
+    assert result["skipped"] == sorted(f"assets/lang/{name}" for name in strays)
+    assert all(not is_shipped_file(name) for name in strays)
+    assert is_shipped_file("pack.png") and is_shipped_file("emberfox.geo.json")
+
+
+def test_export_zip_twice_gives_identical_archives(pack):
+    drop_assets(pack.base_dir, "emberfox")
+    assert api.create_species(pack, {"name": "Emberfox", "number": 1100})['ok']
+    assert pack.export_zip(pack.base_dir / "dist")
+    first = {p.name: p.read_bytes() for p in (pack.base_dir / "dist").iterdir()}
+    assert pack.export_zip(pack.base_dir / "dist")
+    assert {p.name: p.read_bytes() for p in (pack.base_dir / "dist").iterdir()} == first
+    with zipfile.ZipFile(pack.base_dir / "dist" / "resource_pack.zip") as archive:
+        assert "assets/cobblemon/textures/pokemon/emberfox/emberfox.png" in archive.namelist()
+        assert not [n for n in archive.namelist() if not is_shipped_file(n.rsplit('/', 1)[-1])]